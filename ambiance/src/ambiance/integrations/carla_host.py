@@ -9,7 +9,7 @@ fallback so that native UIs remain the primary experience.
 from __future__ import annotations
 
 import atexit
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import importlib.util
 import os
 import shutil
@@ -21,7 +21,7 @@ import tempfile
 import zipfile
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Sequence
+from typing import Any, Callable, Collection, Sequence
 
 from urllib.request import urlopen
 
@@ -387,6 +387,10 @@ class CarlaBackend:
         self._plugin_id: int | None = None
         self._plugin_path: Path | None = None
         self._parameters: list[CarlaParameterSnapshot] = []
+        # Last value handed out per parameter id by get_changed_parameters().
+        self._reported_parameter_values: dict[int, float] = {}
+        # Called with (parameter id, value) when the hosted plugin changes a parameter.
+        self._parameter_listeners: list[Callable[[int, float], None]] = []
         self._ui_visible = False
         self._idle_thread: threading.Thread | None = None
         self._idle_stop: threading.Event | None = None
@@ -708,6 +712,7 @@ class CarlaBackend:
             except (TypeError, ValueError):
                 return default
 
+        self._cb_parameter_value_changed = const("ENGINE_CALLBACK_PARAMETER_VALUE_CHANGED", 5)
         self._cb_patchbay_client_added = const("ENGINE_CALLBACK_PATCHBAY_CLIENT_ADDED", 20)
         self._cb_patchbay_client_removed = const("ENGINE_CALLBACK_PATCHBAY_CLIENT_REMOVED", 21)
         self._cb_patchbay_client_renamed = const("ENGINE_CALLBACK_PATCHBAY_CLIENT_RENAMED", 22)
@@ -1569,7 +1574,11 @@ class CarlaBackend:
         valuef: float,
         value_str: str,
     ) -> None:
-        if opcode == self._cb_patchbay_client_added:
+        if opcode == self._cb_parameter_value_changed:
+            if client_id == self._plugin_id:
+                for listener in tuple(self._parameter_listeners):
+                    listener(value1, valuef)
+        elif opcode == self._cb_patchbay_client_added:
             self._handle_patchbay_client_added(client_id, value1, value2, value_str)
         elif opcode == self._cb_patchbay_client_removed:
             self._handle_patchbay_client_removed(client_id)
@@ -2062,6 +2071,89 @@ class CarlaBackend:
                 payload["plugin"]["parameters"] = []
             return payload
 
+    def status_parameters(self, ids: Collection[int] | None = None) -> list[dict[str, Any]]:
+        """Return only the parameter entries of :meth:`status`.
+
+        When ``ids`` is given, parameters outside it are skipped before their
+        status entries are built.
+        """
+
+        with self._lock:
+            if self._plugin_id is None:
+                return []
+            return [
+                param.to_status_entry()
+                for param in self._parameters
+                if ids is None or param.identifier in ids
+            ]
+
+    def output_peak(self) -> float:
+        """Return the loaded plugin's current output peak across both channels.
+
+        Carla updates the peaks from its audio thread, so reading them is cheap
+        and reflects what was actually rendered. Returns 0.0 with no plugin.
+        """
+
+        with self._lock:
+            if self._plugin_id is None or self.host is None:
+                return 0.0
+            try:
+                return max(
+                    float(self.host.get_output_peak_value(self._plugin_id, True)),
+                    float(self.host.get_output_peak_value(self._plugin_id, False)),
+                )
+            except Exception:
+                return 0.0
+
+    def get_changed_parameters(self, ids: Collection[int] | None = None) -> list[dict[str, Any]]:
+        """Return parameters whose value changed since the previous call.
+
+        Values are re-read from Carla so edits made in the plugin's own editor
+        are picked up. The baseline is reset whenever a plugin is loaded.
+        Parameters outside ``ids``, when given, are not read at all.
+        """
+
+        with self._lock:
+            if self._plugin_id is None or self.host is None:
+                return []
+            changed: list[dict[str, Any]] = []
+            reported = self._reported_parameter_values
+            for index, param in enumerate(self._parameters):
+                if ids is not None and param.identifier not in ids:
+                    continue
+                try:
+                    live = float(
+                        self.host.get_current_parameter_value(self._plugin_id, param.identifier)
+                    )
+                except Exception:
+                    live = param.value
+                if live != param.value:
+                    param = replace(param, value=live)
+                    self._parameters[index] = param
+                if reported.get(param.identifier) != param.value:
+                    reported[param.identifier] = param.value
+                    changed.append(param.to_status_entry())
+            return changed
+
+    def add_parameter_listener(self, callback: Callable[[int, float], None]) -> bool:
+        """Call ``callback(parameter_id, value)`` whenever the hosted plugin changes a parameter.
+
+        The callback runs on Carla's engine thread. Returns ``False`` when no
+        engine callback is registered, in which case callers have to poll.
+        """
+
+        with self._lock:
+            if not self._engine_callback_registered:
+                return False
+            if callback not in self._parameter_listeners:
+                self._parameter_listeners.append(callback)
+            return True
+
+    def remove_parameter_listener(self, callback: Callable[[int, float], None]) -> None:
+        with self._lock:
+            if callback in self._parameter_listeners:
+                self._parameter_listeners.remove(callback)
+
     def load_plugin(
         self,
         plugin_path: str | Path,
@@ -2168,6 +2260,9 @@ class CarlaBackend:
             self._plugin_id = 0
             self._plugin_path = path
             self._parameters = self._collect_parameters()
+            self._reported_parameter_values = {
+                param.identifier: param.value for param in self._parameters
+            }
             self._ui_visible = False
             try:
                 self.host.set_active(self._plugin_id, True)
@@ -2235,6 +2330,7 @@ class CarlaBackend:
             self._plugin_id = None
             self._plugin_path = None
             self._parameters = []
+            self._reported_parameter_values = {}
             self._ui_visible = False
             self._supports_midi = False
             self._midi_routed = False
@@ -2878,6 +2974,32 @@ class CarlaVSTHost:
         with self._lock:
             return self._backend.status(include_parameters=include_parameters)
 
+    def status_meta(self) -> dict[str, Any]:
+        """Status without the parameter lists (plugin, engine, warnings, UI state)."""
+        return self.status(include_parameters=False)
+
+    def status_parameters(self, ids: Collection[int] | None = None) -> list[dict[str, Any]]:
+        with self._lock:
+            return self._backend.status_parameters(ids)
+
+    def output_peak(self) -> float:
+        with self._lock:
+            return self._backend.output_peak()
+
+    def get_changed_parameters(self, ids: Collection[int] | None = None) -> list[dict[str, Any]]:
+        """Parameters whose value changed since the last call; cheap enough to poll."""
+        with self._lock:
+            return self._backend.get_changed_parameters(ids)
+
+    def add_parameter_listener(self, callback: Callable[[int, float], None]) -> bool:
+        """Subscribe to parameter changes made by the plugin; ``False`` means poll instead."""
+        with self._lock:
+            return self._backend.add_parameter_listener(callback)
+
+    def remove_parameter_listener(self, callback: Callable[[int, float], None]) -> None:
+        with self._lock:
+            self._backend.remove_parameter_listener(callback)
+
     def ensure_available(self) -> None:
         if self._backend.available:
             return
@@ -2904,6 +3026,31 @@ class CarlaVSTHost:
                 raise CarlaHostError(f"Unsupported plugin format: {path.suffix}")
             return self._backend.load_plugin(path, parameters, show_ui=show_ui)
 
+    def load_and_describe(
+        self,
+        plugin_path: str | Path,
+        parameters: dict[str, float] | None = None,
+        *,
+        show_ui: bool = False,
+        include_parameters: bool = False,
+    ) -> tuple[dict[str, Any], dict[str, Any] | None, Exception | None]:
+        """Load a plugin and return ``(status, descriptor, descriptor_error)`` for it.
+
+        All three steps run under one hold of the host lock, so the snapshot and
+        descriptor describe the same state and no other caller can slip in between.
+        Only a failed load raises: the plugin stays loaded when just the descriptor
+        fails, so that error is returned (with ``descriptor`` set to ``None``) and
+        the caller can still report on and unload the plugin.
+        """
+        with self._lock:
+            self.load_plugin(plugin_path, parameters, show_ui=show_ui)
+            status = self._backend.status(include_parameters=include_parameters)
+            try:
+                descriptor = self._backend.describe_ui(include_parameters=include_parameters)
+            except Exception as exc:
+                return status, None, exc
+            return status, descriptor, None
+
     def unload(self) -> None:
         with self._lock:
             self._backend.unload()
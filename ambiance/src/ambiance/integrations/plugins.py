@@ -7,9 +7,13 @@ import os
 import shutil
 import stat
 import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, Iterator
+from typing import Generator, Iterator
 
 
 PLUGIN_EXTENSIONS = {
@@ -29,6 +33,10 @@ MODALYS_FILENAMES = {
     "mlys~.mxo": "Modalys.mxo",
 }
 
+# Suffixes that mark a file as a plugin, and the subset that are directory bundles
+PLUGIN_SUFFIXES = frozenset(PLUGIN_EXTENSIONS) | {".mc.svt", ".mcsvt"}
+BUNDLE_SUFFIXES = frozenset({".vst3", ".component"})
+
 LANES = ("A", "B")
 
 
@@ -57,37 +65,88 @@ class PluginRackManager:
     def workspace_path(self) -> Path:
         return Path(self.workspace_dir)
 
-    def _candidate_paths(self) -> Iterable[Path]:
+    def plugin_roots(self) -> list[Path]:
+        """Return the directories :meth:`discover_plugins` walks, in search order."""
+
         # Scan both workspace and included_plugins folder
-        roots_to_scan = [self.workspace_path()]
+        roots = [self.workspace_path()]
 
         # Add included_plugins folder if it exists
         included_plugins = self.base_dir / "included_plugins"
         included_plugins_parent = self.base_dir.parent / "included_plugins"
 
         if included_plugins.exists():
-            roots_to_scan.append(included_plugins)
+            roots.append(included_plugins)
         elif included_plugins_parent.exists():
-            roots_to_scan.append(included_plugins_parent)
+            roots.append(included_plugins_parent)
+        return roots
+
+    def _candidate_paths(self, max_workers: int = 1) -> Generator[Path, None, None]:
+        roots_to_scan = self.plugin_roots()
 
-        def walker() -> Iterator[Path]:
+        if max_workers > 1:
+            return self._parallel_walker(roots_to_scan, max_workers)
+
+        def walker() -> Generator[Path, None, None]:
             for root in roots_to_scan:
                 if not root.exists():
                     continue
-                for dirpath, dirnames, filenames in os.walk(root):
-                    current = Path(dirpath)
-                    for dirname in list(dirnames):
-                        candidate = current / dirname
-                        if self._looks_like_plugin(candidate):
-                            yield candidate
-                            dirnames.remove(dirname)
-                    for filename in filenames:
-                        candidate = current / filename
-                        if self._looks_like_plugin(candidate):
-                            yield candidate
+                yield from self._walk_tree(root)
 
         return walker()
 
+    def _walk_tree(self, root: Path, pending: list[Path] | None = None) -> Iterator[Path]:
+        """Yield plugin candidates below ``root`` in ``os.walk`` order.
+
+        When ``pending`` is given only ``root`` itself is listed; the
+        subdirectories that would be walked next are appended to it instead.
+        """
+        for dirpath, dirnames, filenames in os.walk(root):
+            current = Path(dirpath)
+            for dirname in list(dirnames):
+                candidate = current / dirname
+                if self._looks_like_plugin(candidate, is_dir=True):
+                    yield candidate
+                    dirnames.remove(dirname)
+            for filename in filenames:
+                candidate = current / filename
+                if self._looks_like_plugin(candidate, is_dir=False):
+                    yield candidate
+            if pending is not None:
+                pending.extend(current / dirname for dirname in dirnames)
+                return
+
+    def _parallel_walker(self, roots: list[Path], max_workers: int) -> Generator[Path, None, None]:
+        """Walk each root's subdirectories on a thread pool.
+
+        Subtrees are reassembled in submission order, so candidates come out in
+        the same order as the serial walk and ``limit`` cuts off the same entries.
+        Only ``2 * max_workers`` subtrees are queued ahead of the consumer, and the
+        queued ones are cancelled when the generator is closed early, so a
+        ``limit`` also bounds the filesystem work.
+        """
+        def walk(sub: Path) -> list[Path]:
+            return list(self._walk_tree(sub))
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for root in roots:
+                if not root.exists():
+                    continue
+                subdirs: list[Path] = []
+                yield from list(self._walk_tree(root, subdirs))
+                pending: deque[Future[list[Path]]] = deque()
+                queued = iter(subdirs)
+                for sub in islice(queued, 2 * max_workers):
+                    pending.append(executor.submit(walk, sub))
+                while pending:
+                    subtree = pending.popleft().result()
+                    for sub in islice(queued, 1):
+                        pending.append(executor.submit(walk, sub))
+                    yield from subtree
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     @staticmethod
     def _normalize_suffix(path: Path) -> str:
         name = path.name.lower()
@@ -97,12 +156,14 @@ class PluginRackManager:
             return ".mcsvt"
         return path.suffix.lower()
 
-    def _looks_like_plugin(self, path: Path) -> bool:
-        if path.is_dir():
-            suffix = self._normalize_suffix(path)
-            return suffix in {".vst3", ".component"}
+    def _looks_like_plugin(self, path: Path, is_dir: bool | None = None) -> bool:
+        """Classify ``path``; callers that already know its kind pass ``is_dir`` to skip a stat."""
+        if is_dir is None:
+            is_dir = path.is_dir()
         suffix = self._normalize_suffix(path)
-        if suffix in PLUGIN_EXTENSIONS or suffix in {".mc.svt", ".mcsvt"}:
+        if is_dir:
+            return suffix in BUNDLE_SUFFIXES
+        if suffix in PLUGIN_SUFFIXES:
             return True
         try:
             mode = path.stat().st_mode
@@ -156,31 +217,39 @@ class PluginRackManager:
             return "Max External"
         return PLUGIN_EXTENSIONS.get(suffix, suffix.lstrip("."))
 
-    def discover_plugins(self, limit: int = 256) -> list[dict[str, object]]:
+    def discover_plugins(self, limit: int = 256, *, max_workers: int = 1) -> list[dict[str, object]]:
+        """Describe the plugins in the workspace and ``included_plugins``.
+
+        ``max_workers`` above one walks each root's subdirectories concurrently,
+        which helps on slow or network-mounted plugin folders.
+        """
         entries: list[dict[str, object]] = []
         seen_paths: set[str] = set()  # Track absolute paths to avoid duplicates
 
-        for candidate in self._candidate_paths():
-            # Resolve to absolute path for deduplication
-            try:
-                absolute_path = str(candidate.resolve())
-            except (OSError, RuntimeError):
-                absolute_path = str(candidate.absolute())
+        # Closing the walk as soon as ``limit`` is reached stops a parallel walk
+        # from finishing subtrees nobody will read.
+        with closing(self._candidate_paths(max_workers)) as candidates:
+            for candidate in candidates:
+                # Resolve to absolute path for deduplication
+                try:
+                    absolute_path = str(candidate.resolve())
+                except (OSError, RuntimeError):
+                    absolute_path = str(candidate.absolute())
 
-            # Skip if we've already seen this exact path
-            if absolute_path in seen_paths:
-                continue
+                # Skip if we've already seen this exact path
+                if absolute_path in seen_paths:
+                    continue
 
-            info = self._describe_plugin(candidate)
-            if info is None:
-                continue
+                info = self._describe_plugin(candidate)
+                if info is None:
+                    continue
 
-            # Mark this path as seen
-            seen_paths.add(absolute_path)
-            entries.append(info)
+                # Mark this path as seen
+                seen_paths.add(absolute_path)
+                entries.append(info)
 
-            if len(entries) >= limit:
-                break
+                if len(entries) >= limit:
+                    break
 
         modalys = self._modalys_descriptor()
         if modalys and all(entry.get("path") != modalys.get("path") for entry in entries):
@@ -460,6 +460,24 @@ class AmbianceRequestHandler(SimpleHTTPRequestHandler):
                 update = self.vst_host.set_parameter(identifier, float(value))
                 self._send_json({"ok": True, "status": self.vst_host.status(), "update": update})
                 return
+            if path == "/api/vst/parameters":
+                payload = self._read_json()
+                updates = payload.get("updates")
+                if not isinstance(updates, list) or any(
+                    not isinstance(entry, dict) or entry.get("id") is None or entry.get("value") is None
+                    for entry in updates
+                ):
+                    self._send_json(
+                        {"ok": False, "error": "Expected 'updates' as a list of {'id', 'value'}"},
+                        HTTPStatus.BAD_REQUEST,
+                    )
+                    return
+                # Reply with the applied IDs only; each set_parameter result carries the
+                # full parameter list, and batching clients do not read it back.
+                for entry in updates:
+                    self.vst_host.set_parameter(entry["id"], float(entry["value"]))
+                self._send_json({"ok": True, "applied": [entry["id"] for entry in updates]})
+                return
             if path == "/api/vst/render":
                 payload = self._read_json()
                 duration = float(payload.get("duration", 1.5))
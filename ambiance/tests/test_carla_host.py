@@ -1,4 +1,5 @@
 import sys
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -183,6 +184,56 @@ def test_carla_vst_host_configure_audio_delegates(monkeypatch, tmp_path):
     ]
 
 
+def test_carla_vst_host_load_and_describe_holds_lock(monkeypatch, tmp_path):
+    class _LockCheckingBackend(_DummyBackend):
+        host = None
+
+        def status(self, include_parameters: bool = True) -> dict:
+            assert self.host._lock._is_owned()
+            return super().status()
+
+        def describe_ui(self, plugin_path=None, *, include_parameters: bool = True):
+            assert self.host._lock._is_owned()
+            return super().describe_ui(plugin_path)
+
+    monkeypatch.setattr(carla_host, "CarlaBackend", _LockCheckingBackend)
+
+    plugin_path = tmp_path / "Described.vst3"
+    plugin_path.write_text("stub")
+
+    host = carla_host.CarlaVSTHost(base_dir=tmp_path)
+    host._backend.host = host  # type: ignore[attr-defined]
+    status, descriptor, error = host.load_and_describe(plugin_path)
+
+    assert host._backend.load_calls == [str(plugin_path)]  # type: ignore[attr-defined]
+    assert host._backend.show_requests == [False]  # type: ignore[attr-defined]
+    assert status["plugin"]["path"] == str(plugin_path)
+    assert descriptor["plugin"] == status["plugin"]
+    assert error is None
+
+
+def test_carla_vst_host_load_and_describe_returns_descriptor_error(monkeypatch, tmp_path):
+    class _DescriptorFailingBackend(_DummyBackend):
+        def status(self, include_parameters: bool = True) -> dict:
+            return super().status()
+
+        def describe_ui(self, plugin_path=None, *, include_parameters: bool = True):
+            raise carla_host.CarlaHostError("descriptor unavailable")
+
+    monkeypatch.setattr(carla_host, "CarlaBackend", _DescriptorFailingBackend)
+
+    plugin_path = tmp_path / "NoDescriptor.vst3"
+    plugin_path.write_text("stub")
+
+    host = carla_host.CarlaVSTHost(base_dir=tmp_path)
+    status, descriptor, error = host.load_and_describe(plugin_path)
+
+    assert status["plugin"]["path"] == str(plugin_path)
+    assert descriptor is None
+    assert isinstance(error, carla_host.CarlaHostError)
+    assert "descriptor unavailable" in str(error)
+
+
 @pytest.mark.skipif(not sys.platform.startswith("win"), reason="Windows-only binary inspection")
 def test_carla_backend_binary_type_prefers_bridge_when_needed(monkeypatch):
     backend = carla_host.CarlaBackend.__new__(carla_host.CarlaBackend)
@@ -198,3 +249,73 @@ def test_carla_backend_binary_type_prefers_bridge_when_needed(monkeypatch):
     backend._detect_pe_architecture = lambda image: 64  # type: ignore[assignment]
     win64_type = backend._binary_type_for(Path("Plugin.vst3"), 0)
     assert win64_type == 2
+
+
+def test_carla_backend_reports_only_changed_parameters():
+    values = {0: 0.25}
+    backend = carla_host.CarlaBackend.__new__(carla_host.CarlaBackend)
+    backend._lock = threading.RLock()
+    backend._plugin_id = 0
+    backend.host = SimpleNamespace(
+        get_current_parameter_value=lambda plugin_id, index: values[index]
+    )
+    backend._parameters = [
+        carla_host.CarlaParameterSnapshot(
+            identifier=0,
+            name="Cutoff",
+            display_name="Cutoff",
+            units="",
+            default=0.5,
+            minimum=0.0,
+            maximum=1.0,
+            step=0.01,
+            value=0.25,
+        )
+    ]
+    backend._reported_parameter_values = {0: 0.25}
+
+    assert backend.get_changed_parameters() == []
+
+    values[0] = 0.75
+    assert backend.get_changed_parameters(ids=frozenset({1})) == []
+    changed = backend.get_changed_parameters()
+    assert [entry["value"] for entry in changed] == [0.75]
+    assert backend.get_changed_parameters() == []
+
+
+def test_carla_backend_forwards_parameter_changes_to_listeners():
+    backend = carla_host.CarlaBackend.__new__(carla_host.CarlaBackend)
+    backend._lock = threading.RLock()
+    backend.module = None
+    backend._init_engine_constants()
+    backend._plugin_id = 0
+    backend._parameter_listeners = []
+    backend._engine_callback_registered = False
+
+    received: list[tuple[int, float]] = []
+    listener = lambda param_id, value: received.append((param_id, value))
+    assert backend.add_parameter_listener(listener) is False
+
+    backend._engine_callback_registered = True
+    assert backend.add_parameter_listener(listener) is True
+    opcode = backend._cb_parameter_value_changed
+    backend._handle_engine_callback(opcode, 0, 3, 0, 0, 0.5, "")
+    backend._handle_engine_callback(opcode, 1, 4, 0, 0, 0.9, "")  # another plugin
+
+    backend.remove_parameter_listener(listener)
+    backend._handle_engine_callback(opcode, 0, 3, 0, 0, 0.75, "")
+    assert received == [(3, 0.5)]
+
+
+def test_carla_backend_output_peak_uses_loudest_channel():
+    backend = carla_host.CarlaBackend.__new__(carla_host.CarlaBackend)
+    backend._lock = threading.RLock()
+    backend._plugin_id = None
+    backend.host = SimpleNamespace(
+        get_output_peak_value=lambda plugin_id, is_left: 0.2 if is_left else 0.6
+    )
+
+    assert backend.output_peak() == 0.0
+
+    backend._plugin_id = 0
+    assert backend.output_peak() == 0.6
@@ -28,6 +28,58 @@ def test_discover_plugins(tmp_path):
     assert "textures" in names
 
 
+def test_discover_plugins_parallel_matches_serial(tmp_path):
+    manager = PluginRackManager(base_dir=tmp_path)
+    included = tmp_path / "included_plugins"
+    for vendor in ("Alpha", "Beta", "Gamma"):
+        folder = included / vendor / "x64"
+        folder.mkdir(parents=True)
+        (folder / f"{vendor}Synth.dll").write_text("dummy")
+        (included / vendor / f"{vendor}FX.vst3").mkdir()
+    (included / "Loose.dll").write_text("dummy")
+
+    serial = manager.discover_plugins(limit=4)
+    parallel = manager.discover_plugins(limit=4, max_workers=4)
+
+    assert parallel == serial
+    assert manager.discover_plugins(max_workers=4) == manager.discover_plugins()
+
+
+def test_discover_plugins_parallel_limit_bounds_walk(tmp_path):
+    manager = PluginRackManager(base_dir=tmp_path)
+    included = tmp_path / "included_plugins"
+    for index in range(40):
+        folder = included / f"Vendor{index:02d}"
+        folder.mkdir(parents=True)
+        (folder / f"Synth{index:02d}.dll").write_text("dummy")
+
+    walked = []
+    walk_tree = manager._walk_tree
+
+    def counting_walk(root, pending=None):
+        walked.append(root)
+        return walk_tree(root, pending)
+
+    manager._walk_tree = counting_walk
+
+    entries = manager.discover_plugins(limit=1, max_workers=2)
+
+    assert len(entries) == 1
+    assert len(walked) < 20
+
+
+def test_plugin_roots_prefers_local_included_plugins(tmp_path):
+    base = tmp_path / "app"
+    base.mkdir()
+    (tmp_path / "included_plugins").mkdir()
+    manager = PluginRackManager(base_dir=base)
+
+    assert manager.plugin_roots() == [manager.workspace_path(), tmp_path / "included_plugins"]
+
+    (base / "included_plugins").mkdir()
+    assert manager.plugin_roots() == [manager.workspace_path(), base / "included_plugins"]
+
+
 def test_assign_and_toggle(tmp_path):
     manager = PluginRackManager(base_dir=tmp_path)
     workspace = manager.workspace_path()
@@ -1,4 +1,11 @@
-from ambiance.server import render_payload
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from ambiance.server import AmbianceRequestHandler, ThreadingHTTPServer, render_payload
 
 
 def test_render_payload_produces_audio_data_url():
@@ -18,3 +25,80 @@ def test_render_payload_produces_audio_data_url():
     assert response["ok"] is True
     assert response["audio"].startswith("data:audio/wav;base64,")
     assert response["samples"] == int(payload["duration"] * payload["sample_rate"])
+
+
+class _RecordingVSTHost:
+    def __init__(self) -> None:
+        self.calls: list[tuple[object, float]] = []
+
+    def set_parameter(self, identifier, value):
+        self.calls.append((identifier, value))
+        return {"id": identifier, "value": value, "parameters": []}
+
+
+@pytest.fixture
+def vst_server(tmp_path):
+    vst_host = _RecordingVSTHost()
+
+    def handler(*args, **kwargs):
+        return AmbianceRequestHandler(
+            *args,
+            directory=str(tmp_path),
+            manager=None,
+            ui_path=tmp_path / "index.html",
+            vst_host=vst_host,
+            juce_host=None,
+            **kwargs,
+        )
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", vst_host
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def _post_json(url, payload):
+    request = urllib.request.Request(
+        url, data=json.dumps(payload).encode("utf-8"), headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def test_vst_parameters_batch_applies_updates(vst_server):
+    base_url, vst_host = vst_server
+
+    status, body = _post_json(
+        f"{base_url}/api/vst/parameters",
+        {"updates": [{"id": 3, "value": 0.5}, {"id": 7, "value": 1}]},
+    )
+
+    assert status == 200
+    assert body == {"ok": True, "applied": [3, 7]}
+    assert vst_host.calls == [(3, 0.5), (7, 1.0)]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"updates": {"id": 3, "value": 0.5}},
+        {"updates": [{"id": 3}]},
+        {"updates": [{"value": 0.5}]},
+        {},
+    ],
+)
+def test_vst_parameters_batch_rejects_malformed_updates(vst_server, payload):
+    base_url, vst_host = vst_server
+
+    status, body = _post_json(f"{base_url}/api/vst/parameters", payload)
+
+    assert status == 400
+    assert body["ok"] is False
+    assert vst_host.calls == []
@@ -1,17 +1,19 @@
 """Ambiance - Pure Qt desktop application matching web UI styling."""
 
+import os
 import sys
 import argparse
+from bisect import bisect_right
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QListWidget, QListWidgetItem, QScrollArea,
     QSlider, QFrame, QSplitter, QMessageBox
 )
-from PyQt5.QtCore import Qt, QTimer, QSize
-from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QPalette
+from PyQt5.QtCore import Qt, QTimer, QSize, QRect, QSignalBlocker, pyqtSlot
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QPalette, QPixmap, QRegion
 
 sys.path.insert(0, str(Path(__file__).parent / "ambiance" / "src"))
 
@@ -29,6 +31,25 @@ COLORS = {
     'border': '#444',
 }
 
+PLUGIN_EXTENSIONS = (".dll", ".vst3")
+
+
+def _iter_plugins(root: str) -> Iterator[Path]:
+    """Yield plugin paths under ``root`` in a single directory walk."""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name.lower().endswith(PLUGIN_EXTENSIONS):
+            yield Path(entry.path)
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:  # e.g. a protected folder; skip it rather than abort the scan
+            continue
+        if is_dir:
+            yield from _iter_plugins(entry.path)
+
 
 class StyledWidget(QWidget):
     """Base widget with web UI styling."""
@@ -77,9 +98,19 @@ class StyledPanel(QFrame):
         layout.addLayout(self.content_layout)
 
 
+WHITE_KEY_CLASSES = frozenset((0, 2, 4, 5, 7, 9, 11))
+
+
 class PianoKeyboard(QWidget):
     """Virtual piano keyboard matching web UI style."""
 
+    # Paint resources are immutable, so build them once instead of per key per frame
+    _PRESSED_BRUSH = QBrush(QColor('#f97316'))
+    _WHITE_BRUSH = QBrush(QColor(245, 247, 255))
+    _BLACK_BRUSH = QBrush(QColor(15, 18, 24))
+    _WHITE_OUTLINE_PEN = QPen(QColor(0, 0, 0, 150), 2)
+    _BLACK_OUTLINE_PEN = QPen(QColor(17, 17, 17), 2)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(140)
@@ -93,6 +124,15 @@ class PianoKeyboard(QWidget):
         self.black_key_width = 24
         self.black_key_height = 98
 
+        # Key geometry as (note, x) pairs, computed once rather than per paint/mouse event
+        self._white_rects: List[Tuple[int, int]] = []
+        self._black_rects: List[Tuple[int, int]] = []
+        self._black_xs: List[int] = []
+        self._key_rects: Dict[int, QRect] = {}
+        self._key_bounds: Dict[int, QRect] = {}
+        self._bg_pixmap: Optional[QPixmap] = None
+        self._rebuild_layout()
+
         # State
         self.pressed_keys = set()
         self.mouse_down_note = None
@@ -115,69 +155,114 @@ class PianoKeyboard(QWidget):
         self.note_on_callback = note_on
         self.note_off_callback = note_off
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Draw white keys
-        white_keys = []
-        for i in range(self.octaves * 12):
-            note = self.start_note + i
-            if note % 12 in [0, 2, 4, 5, 7, 9, 11]:
-                white_keys.append(note)
-
+    def _rebuild_layout(self):
+        """Recompute key positions; call again after changing ``start_note`` or ``octaves``."""
+        white_rects = []
+        black_rects = []
+        offset = self.white_key_width - self.black_key_width // 2
         x = 0
-        for note in white_keys:
-            is_pressed = note in self.pressed_keys
-            if is_pressed:
-                gradient = QColor('#f97316')
+        for note in range(self.start_note, self.start_note + self.octaves * 12):
+            if note % 12 in WHITE_KEY_CLASSES:
+                white_rects.append((note, x))
+                x += self.white_key_width
             else:
-                gradient = QColor(245, 247, 255)
+                black_rects.append((note, x + offset))
+        self._white_rects = white_rects
+        self._black_rects = black_rects
+        self._black_xs = [x for _, x in black_rects]
+        key_rects = {note: QRect(x, 0, self.white_key_width, self.white_key_height) for note, x in white_rects}
+        key_rects.update(
+            (note, QRect(x, 0, self.black_key_width, self.black_key_height)) for note, x in black_rects
+        )
+        self._key_rects = key_rects
+        # Padded for the 2px outline pen, which spills into neighbouring keys
+        self._key_bounds = {note: rect.adjusted(-2, -2, 2, 2) for note, rect in key_rects.items()}
+        self._bg_pixmap = None
+
+    def _rect_for_note(self, note):
+        """Repaint area for ``note``, padded for the 2px outline pen."""
+        return self._key_bounds.get(note, QRect())
+
+    def _rebuild_background(self):
+        """Render the keyboard with no keys pressed into ``_bg_pixmap``."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._draw_keys(painter, QRegion(self.rect()), frozenset())
+        painter.end()
+        self._bg_pixmap = pixmap
 
-            painter.fillRect(x, 0, self.white_key_width, self.white_key_height, gradient)
-            painter.setPen(QPen(QColor(0, 0, 0, 150), 2))
-            painter.drawRect(x, 0, self.white_key_width, self.white_key_height)
-            x += self.white_key_width
+    def resizeEvent(self, event):
+        self._bg_pixmap = None
+        super().resizeEvent(event)
 
-        # Draw black keys
-        x = 0
-        for i in range(self.octaves * 12):
-            note = self.start_note + i
-            if note % 12 in [1, 3, 6, 8, 10]:
-                is_pressed = note in self.pressed_keys
-                if is_pressed:
-                    color = QColor('#f97316')
-                else:
-                    color = QColor(15, 18, 24)
+    def paintEvent(self, event):
+        region = event.region()
+        if region.isEmpty():
+            return
+        if self._bg_pixmap is None:
+            self._rebuild_background()
+        painter = QPainter(self)
+        painter.setClipRegion(region)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
 
-                offset = self.white_key_width - self.black_key_width // 2
-                painter.fillRect(x + offset, 0, self.black_key_width, self.black_key_height, color)
-                painter.setPen(QPen(QColor(17, 17, 17), 2))
-                painter.drawRect(x + offset, 0, self.black_key_width, self.black_key_height)
+        pressed = self.pressed_keys
+        if not pressed:
+            return
+        # Only pressed keys differ from the background. Re-run the normal key pass
+        # clipped to their fills so neighbouring outlines and black keys stay on top.
+        overlay = QRegion()
+        for note in pressed:
+            rect = self._key_rects.get(note)
+            if rect is not None:
+                overlay = overlay.united(rect)
+        overlay = overlay.intersected(region)
+        if overlay.isEmpty():
+            return
+        painter.setClipRegion(overlay)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._draw_keys(painter, overlay, pressed)
 
-            if note % 12 in [0, 2, 4, 5, 7, 9, 11]:
-                x += self.white_key_width
+    def _draw_keys(self, painter, area, pressed):
+        """Draw every key whose padded bounds meet ``area``, white keys first."""
+        key_rects = self._key_rects
+        key_bounds = self._key_bounds
+
+        # Draw white keys
+        painter.setPen(self._WHITE_OUTLINE_PEN)
+        for note, _ in self._white_rects:
+            if not area.intersects(key_bounds[note]):
+                continue
+            rect = key_rects[note]
+            painter.fillRect(rect, self._PRESSED_BRUSH if note in pressed else self._WHITE_BRUSH)
+            painter.drawRect(rect)
+
+        # Draw black keys; any white key repainted beneath one brings it back in
+        painter.setPen(self._BLACK_OUTLINE_PEN)
+        for note, _ in self._black_rects:
+            if not area.intersects(key_bounds[note]):
+                continue
+            rect = key_rects[note]
+            painter.fillRect(rect, self._PRESSED_BRUSH if note in pressed else self._BLACK_BRUSH)
+            painter.drawRect(rect)
 
     def get_note_at_position(self, x, y):
-        # Check black keys first
-        white_x = 0
-        for i in range(self.octaves * 12):
-            note = self.start_note + i
-            if note % 12 in [1, 3, 6, 8, 10]:
-                offset = white_x + self.white_key_width - self.black_key_width // 2
-                if offset <= x < offset + self.black_key_width and y < self.black_key_height:
-                    return note
-            if note % 12 in [0, 2, 4, 5, 7, 9, 11]:
-                white_x += self.white_key_width
-
-        # Check white keys
-        white_x = 0
-        for i in range(self.octaves * 12):
-            note = self.start_note + i
-            if note % 12 in [0, 2, 4, 5, 7, 9, 11]:
-                if white_x <= x < white_x + self.white_key_width:
+        # Check black keys first: they are sorted by x and never overlap
+        if y < self.black_key_height:
+            index = bisect_right(self._black_xs, x) - 1
+            if index >= 0:
+                note, key_x = self._black_rects[index]
+                if x < key_x + self.black_key_width:
                     return note
-                white_x += self.white_key_width
+
+        # White keys are contiguous and equally wide
+        if x >= 0:
+            index = int(x // self.white_key_width)
+            if index < len(self._white_rects):
+                return self._white_rects[index][0]
 
         return None
 
@@ -187,7 +272,7 @@ class PianoKeyboard(QWidget):
             self.mouse_down_note = note
             if note not in self.pressed_keys:
                 self.pressed_keys.add(note)
-                self.update()
+                self.update(self._rect_for_note(note))
                 if self.note_on_callback:
                     self.note_on_callback(note)
 
@@ -196,7 +281,7 @@ class PianoKeyboard(QWidget):
             note = self.mouse_down_note
             if note in self.pressed_keys:
                 self.pressed_keys.remove(note)
-                self.update()
+                self.update(self._rect_for_note(note))
                 if self.note_off_callback:
                     self.note_off_callback(note)
             self.mouse_down_note = None
@@ -205,6 +290,9 @@ class PianoKeyboard(QWidget):
         if self.mouse_down_note is not None:
             current_note = self.get_note_at_position(event.x(), event.y())
             if current_note != self.mouse_down_note:
+                dirty = self._rect_for_note(self.mouse_down_note)
+                if current_note is not None:
+                    dirty = dirty.united(self._rect_for_note(current_note))
                 if self.mouse_down_note in self.pressed_keys:
                     self.pressed_keys.remove(self.mouse_down_note)
                     if self.note_off_callback:
@@ -219,12 +307,17 @@ class PianoKeyboard(QWidget):
                 else:
                     self.mouse_down_note = None
 
-                self.update()
+                self.update(dirty)
 
 
 class AmbianceQt(QMainWindow):
     """Pure Qt desktop app matching web UI."""
 
+    # Parameter polling backs off to the idle interval after this many quiet polls
+    POLL_INTERVAL_MS = 100
+    POLL_IDLE_INTERVAL_MS = 250
+    POLL_IDLE_CYCLES = 20
+
     def __init__(self, preferred_drivers=None, forced_driver=None, auto_plugin=None):
         super().__init__()
 
@@ -237,12 +330,14 @@ class AmbianceQt(QMainWindow):
 
         # State
         self.param_sliders = {}
+        self._tracked_ids = frozenset()
         self.updating_from_plugin = False
         self._auto_plugin = Path(auto_plugin) if auto_plugin else None
 
         # Timer for parameter polling
         self.poll_timer = QTimer()
         self.poll_timer.timeout.connect(self.poll_parameters)
+        self._idle_polls = 0
 
         self.init_ui()
 
@@ -280,6 +375,8 @@ class AmbianceQt(QMainWindow):
         # LEFT: Plugin Library
         left_panel = StyledPanel("Plugin Library")
         self.plugin_list = QListWidget()
+        # Every row is one line of text; lets the view skip per-item size hints
+        self.plugin_list.setUniformItemSizes(True)
         self.plugin_list.setStyleSheet(f"""
             QListWidget {{
                 background-color: rgba(255, 255, 255, 0.04);
@@ -404,16 +501,21 @@ class AmbianceQt(QMainWindow):
             base_dir.parent / "included_plugins",
         ]
 
-        plugins = []
+        plugins = set()
         for plugin_dir in plugin_dirs:
-            if plugin_dir.exists():
-                for pattern in ("**/*.dll", "**/*.vst3"):
-                    plugins.extend(plugin_dir.glob(pattern))
+            plugins.update(_iter_plugins(str(plugin_dir)))
 
-        for plugin_path in sorted(set(plugins)):
-            item = QListWidgetItem(plugin_path.stem)
-            item.setData(Qt.UserRole, str(plugin_path))
-            self.plugin_list.addItem(item)
+        # Insert in one pass with repaints and signals held off; the paths are
+        # already sorted, so the widget's own sorting is never enabled.
+        self.plugin_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.plugin_list):
+                for plugin_path in sorted(plugins):
+                    item = QListWidgetItem(plugin_path.stem)
+                    item.setData(Qt.UserRole, str(plugin_path))
+                    self.plugin_list.addItem(item)
+        finally:
+            self.plugin_list.setUpdatesEnabled(True)
 
     def on_plugin_selected(self, item):
         """Load selected plugin."""
@@ -428,7 +530,8 @@ class AmbianceQt(QMainWindow):
             self.update_parameters()
             self.ui_btn.setEnabled(True)
             self.unload_btn.setEnabled(True)
-            self.poll_timer.start(100)
+            self._idle_polls = 0
+            self.poll_timer.start(self.POLL_INTERVAL_MS)
             return True
         except Exception as e:
             QMessageBox.critical(self, "Load Error", f"Failed to load plugin:\n\n{e}")
@@ -446,7 +549,7 @@ class AmbianceQt(QMainWindow):
     def toggle_ui(self):
         """Toggle native UI."""
         try:
-            status = self.host.status()
+            status = self.host.status_meta()
             if status.get("ui_visible"):
                 self.host.hide_ui()
                 self.ui_btn.setText("Show Plugin UI")
@@ -472,7 +575,7 @@ class AmbianceQt(QMainWindow):
 
     def update_status(self):
         """Update status label."""
-        status = self.host.status()
+        status = self.host.status_meta()
         if status.get("plugin"):
             plugin = status["plugin"]
             name = plugin["metadata"]["name"]
@@ -488,12 +591,12 @@ class AmbianceQt(QMainWindow):
             if item.widget():
                 item.widget().deleteLater()
         self.param_sliders.clear()
+        self._tracked_ids = frozenset()
 
     def update_parameters(self):
         """Update parameter sliders."""
         self.clear_parameters()
-        status = self.host.status()
-        params = status.get("parameters", [])
+        params = self.host.status_parameters()
 
         if not params:
             self.param_layout.addWidget(QLabel("No parameters"))
@@ -539,54 +642,85 @@ class AmbianceQt(QMainWindow):
 
             param_id = param["id"]
             self.param_sliders[param_id] = {
+                "id": param_id,
                 "slider": slider,
                 "label": value_label,
                 "min": min_val,
                 "max": max_val,
                 "name": name,
-                "units": param["units"]
+                "units": param["units"],
+                "last_value": param["value"],
             }
 
-            def make_handler(pid, minv, maxv, lbl, nm, u):
-                def handler(val):
-                    if self.updating_from_plugin:
-                        return
-                    norm = val / 1000.0
-                    actual = minv + norm * (maxv - minv)
-                    try:
-                        self.host.set_parameter(pid, actual)
-                        lbl.setText(f"{nm}: {actual:.3f} {u}")
-                    except:
-                        pass
-                return handler
-
-            slider.valueChanged.connect(make_handler(param_id, min_val, max_val, value_label, name, param["units"]))
+            slider.setProperty("param_id", param_id)
+            slider.valueChanged.connect(self._on_slider_changed)
             param_layout.addWidget(slider)
             self.param_layout.addWidget(param_frame)
 
         self.param_layout.addStretch()
+        self._tracked_ids = frozenset(self.param_sliders)
+
+    @pyqtSlot(int)
+    def _on_slider_changed(self, slider_val):
+        """Forward a slider move to the host; one slot shared by every slider."""
+        if self.updating_from_plugin:
+            return
+        info = self.param_sliders.get(self.sender().property("param_id"))
+        if info is None:
+            return
+        actual = info["min"] + slider_val / 1000.0 * (info["max"] - info["min"])
+        try:
+            self.host.set_parameter(info["id"], actual)
+            info["label"].setText(f"{info['name']}: {actual:.3f} {info['units']}")
+            info["last_value"] = actual
+        except:
+            pass
 
     def poll_parameters(self):
         """Poll parameter values."""
         if self.updating_from_plugin:
             return
         try:
-            status = self.host.status()
+            # Only parameters that moved since the last poll; the full list is read on load
+            changed_params = self.host.get_changed_parameters(self._tracked_ids)
             self.updating_from_plugin = True
-            for param in status.get("parameters", []):
-                if param["id"] in self.param_sliders:
-                    info = self.param_sliders[param["id"]]
-                    norm = (param["value"] - info["min"]) / (info["max"] - info["min"]) if info["max"] != info["min"] else 0
-                    pos = int(norm * 1000)
-                    if abs(info["slider"].value() - pos) > 1:
-                        info["slider"].blockSignals(True)
-                        info["slider"].setValue(pos)
-                        info["slider"].blockSignals(False)
-                        info["label"].setText(f"{info['name']}: {param['value']:.3f} {info['units']}")
+            changed = False
+            for param in changed_params:
+                info = self.param_sliders.get(param["id"])
+                if info is None:
+                    continue
+                value = param["value"]
+                span = info["max"] - info["min"]
+                # Below slider resolution: nothing visible would change
+                if abs(value - info["last_value"]) < abs(span) * 1e-3:
+                    continue
+                info["last_value"] = value
+                changed = True
+                norm = (value - info["min"]) / span if span else 0
+                pos = int(norm * 1000)
+                if abs(info["slider"].value() - pos) > 1:
+                    info["slider"].blockSignals(True)
+                    info["slider"].setValue(pos)
+                    info["slider"].blockSignals(False)
+                    text = f"{info['name']}: {value:.3f} {info['units']}"
+                    if info["label"].text() != text:
+                        info["label"].setText(text)
             self.updating_from_plugin = False
+            self._adapt_poll_interval(changed)
         except:
             self.updating_from_plugin = False
 
+    def _adapt_poll_interval(self, changed):
+        """Poll quickly while parameters move, back off once they have been still for a while."""
+        if changed:
+            self._idle_polls = 0
+            if self.poll_timer.interval() != self.POLL_INTERVAL_MS:
+                self.poll_timer.setInterval(self.POLL_INTERVAL_MS)
+            return
+        self._idle_polls += 1
+        if self._idle_polls == self.POLL_IDLE_CYCLES:
+            self.poll_timer.setInterval(self.POLL_IDLE_INTERVAL_MS)
+
     def closeEvent(self, event):
         """Handle close."""
         self.poll_timer.stop()
@@ -4,12 +4,17 @@ import sys
 import json
 import logging
 import os
+import re
 from pathlib import Path
 from collections import deque
-from typing import Optional, List, Dict, Any, Tuple, Deque, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Set, Tuple, Deque, Iterator, Callable, cast
 from dataclasses import dataclass, field
-from datetime import datetime
+from functools import lru_cache, partial
 import threading
+import time
+import queue
+from array import array
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from string import Template
 from textwrap import dedent
@@ -23,9 +28,12 @@ from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QListWidget, QListWidgetItem, QScrollArea,
     QSlider, QFrame, QMessageBox, QComboBox, QTabWidget, QCheckBox,
-    QPlainTextEdit, QToolButton, QSizePolicy, QStackedWidget
+    QPlainTextEdit, QToolButton, QSizePolicy, QStackedWidget, QAction
+)
+from PyQt5.QtCore import (
+    Qt, QTimer, QThread, pyqtSignal, pyqtSlot, QObject, QEvent, QUrl, QSize, QRect,
+    QThreadPool, QRunnable, QSignalBlocker
 )
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, pyqtSlot, QObject, QEvent, QUrl, QSize
 from PyQt5.QtGui import (
     QPainter,
     QColor,
@@ -120,9 +128,424 @@ THEME_PRESETS = {
     }
 }
 
+# Theme colours pre-parsed into QColor objects so palette construction does no hex parsing.
+_THEME_QCOLORS: Dict[str, Dict[str, QColor]] = {
+    key: {name: QColor(value) for name, value in preset["colors"].items()}
+    for key, preset in THEME_PRESETS.items()
+}
+_BLACK = QColor("#000000")
+
 STRUDEL_REMOTE_URL = "https://strudel.tidalcycles.org/"
 
 
+# Global stylesheet, split by area. Placeholders are filled from the active theme palette.
+_WINDOW_QSS = Template("""\
+QMainWindow {
+    background-color: $bg;
+    color: $text;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    font-size: 14px;
+}
+QWidget#CentralWidget,
+QWidget#BodyWidget {
+    background-color: $panel_opaque;
+}
+QScrollArea#BodyScrollArea {
+    background-color: $panel_opaque;
+    border: none;
+}
+QScrollArea#BodyScrollArea QWidget {
+    background-color: $panel_opaque;
+}
+QStackedWidget#BodyStack {
+    background-color: transparent;
+    border: none;
+}
+QWidget#StrudelContainer {
+    background-color: $card;
+    border: 1px solid $panel_border;
+    border-radius: 16px;
+}
+QWebEngineView#StrudelView {
+    background: transparent;
+    border: none;
+    border-radius: 14px;
+}
+QLabel#StrudelFallback {
+    color: $text;
+    padding: 24px;
+}
+""")
+
+_TOOLBAR_QSS = Template("""\
+QFrame#Toolbar {
+    background-color: $panel;
+    border: 1px solid $panel_border;
+    border-radius: 10px;
+}
+QLabel#ToolbarTitle {
+    font-size: 18px;
+    font-weight: 600;
+    color: $text;
+}
+QComboBox#ThemePicker {
+    background-color: $card;
+    border: 1px solid $panel_border;
+    border-radius: 6px;
+    padding: 6px 10px;
+    color: $text;
+}
+""")
+
+_PLUGIN_BLOCK_QSS = Template("""\
+QFrame#PluginBlock {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 $panel, stop:1 $card);
+    border-radius: 16px;
+    border: 1px solid $panel_border;
+    box-shadow: 0px 26px 48px rgba(0, 0, 0, 0.30);
+}
+QFrame#CollapsibleSection {
+    background-color: transparent;
+    border: none;
+}
+QToolButton#SectionToggle {
+    border: 1px solid $panel_border;
+    border-radius: 10px;
+    font-weight: 600;
+    padding: 6px 10px;
+    text-align: left;
+    background-color: rgba(240, 240, 240, 0.94);
+    color: #000000;
+}
+QToolButton#SectionToggle:hover {
+    background-color: rgba(255, 255, 255, 0.98);
+    color: #000000;
+}
+QFrame#CollapsibleSectionContent {
+    background-color: $panel_soft;
+    border: 1px solid $panel_border;
+    border-radius: 14px;
+}
+QLabel#RackTitle {
+    font-size: 22px;
+    font-weight: 700;
+    color: $text;
+}
+QLabel#RackTagline {
+    color: $muted;
+}
+QLabel#RackStatus {
+    padding: 6px 12px;
+    border-radius: 999px;
+    background-color: $badge_bg;
+    border: 1px solid $badge_border;
+    color: $text;
+    font-size: 12px;
+}
+QFrame#WorkspacePanel,
+QFrame#RackPanel,
+QFrame#HostPanel,
+QFrame#InstrumentPanel,
+QFrame#RackLogPanel {
+    background-color: $panel_soft;
+    border: 1px solid $card_border;
+    border-radius: 12px;
+}
+QFrame#HostPanel {
+    border: 1px solid $accent_border;
+}
+QFrame#PluginEditorContainer {
+    background-color: $panel_soft;
+    border: 1px dashed $card_border;
+    border-radius: 12px;
+    min-height: 320px;
+}
+QFrame#PluginEditorContainer QLabel#PluginEditorPlaceholder {
+    color: $muted;
+    font-style: italic;
+}
+""")
+
+_LIST_QSS = Template("""\
+QListWidget#PluginList {
+    background-color: $list_bg;
+    border: 1px solid $card_border;
+    border-radius: 10px;
+    padding: 6px;
+}
+QListWidget#PluginList::item {
+    padding: 10px;
+    border-radius: 8px;
+    margin: 4px 0;
+    color: $text;
+}
+QListWidget#PluginList::item:selected {
+    background-color: $list_selected;
+    border: 1px solid $accent_border;
+}
+QListWidget#PluginList::item:hover {
+    background-color: $list_hover;
+}
+QPlainTextEdit#RackOutput {
+    background-color: $log_bg;
+    border: 1px solid $card_border;
+    border-radius: 10px;
+    padding: 10px;
+    color: $text;
+}
+""")
+
+_BUTTON_QSS = Template("""\
+QPushButton {
+    background-color: $accent_soft;
+    border: 1px solid $accent_border;
+    border-radius: 8px;
+    padding: 8px 14px;
+    color: $text;
+    font-weight: 600;
+}
+QPushButton:hover {
+    background-color: $accent_hover;
+}
+QPushButton:disabled {
+    color: $text_disabled;
+    border-color: $border_disabled;
+    background-color: $card_disabled;
+}
+""")
+
+_TAB_QSS = Template("""\
+QTabWidget#ParameterTabs::pane {
+    border: 1px solid $card_border;
+    background-color: $card_half;
+    border-radius: 10px;
+}
+QTabBar::tab {
+    background-color: $card_sixty;
+    border: 1px solid $card_border;
+    border-radius: 8px;
+    padding: 8px 16px;
+    color: $text;
+    margin-right: 6px;
+}
+QTabBar::tab:selected {
+    background-color: $accent_selected;
+}
+""")
+
+_GLOBAL_QSS_PARTS = (
+    _WINDOW_QSS,
+    _TOOLBAR_QSS,
+    _PLUGIN_BLOCK_QSS,
+    _LIST_QSS,
+    _BUTTON_QSS,
+    _TAB_QSS,
+)
+
+@lru_cache(maxsize=None)
+def _rgba(hex_color: str, alpha: float) -> str:
+    """Convert a ``#rgb``/``#rrggbb`` colour into a QSS ``rgba()`` expression."""
+    value = hex_color.lstrip('#')
+    if len(value) == 3:
+        value = ''.join(ch * 2 for ch in value)
+    r = int(value[0:2], 16)
+    g = int(value[2:4], 16)
+    b = int(value[4:6], 16)
+    return f"rgba({r}, {g}, {b}, {alpha})"
+
+
+def _build_note_lut(note_map: Dict[int, int]) -> "array[int]":
+    """Flatten a Qt key -> semitone mapping into a 256-entry table (-1 for unmapped keys)."""
+    lut = array('b', [-1] * 256)
+    for key, offset in note_map.items():
+        lut[int(key)] = offset
+    return lut
+
+
+@dataclass
+class PluginScanResult:
+    """Outcome of a plugin library scan."""
+    workspace_dir: Optional[Path] = None
+    available_dirs: List[Path] = field(default_factory=list)
+    missing_dirs: List[Path] = field(default_factory=list)
+    plugins: List[Path] = field(default_factory=list)
+
+
+PLUGIN_EXTENSIONS: Tuple[str, ...] = (".dll", ".vst3", ".vst")
+PLUGIN_CACHE_PATH = Path.home() / ".ambiance" / "plugin_cache.json"
+
+
+def _fast_lower(s: str) -> str:
+    """``s.lower()`` that skips the copy when ``s`` is already lowercase ASCII."""
+    return s if s.isascii() and s.islower() else s.lower()
+
+
+def _walk_plugins(root: Path, dir_mtimes: Optional[Dict[str, int]] = None) -> Iterator[Path]:
+    """Yield every plugin file or bundle below ``root`` in a single directory walk.
+
+    Bundles (``Foo.vst3`` folders) are yielded and still descended into, matching
+    what the previous ``**/*.ext`` globs returned. When ``dir_mtimes`` is given it
+    is filled with the mtime of every directory visited.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            if dir_mtimes is not None:
+                dir_mtimes[current] = os.stat(current).st_mtime_ns
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if _fast_lower(entry.name).endswith(PLUGIN_EXTENSIONS):
+                        yield Path(entry.path)
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        stack.append(entry.path)
+        except OSError:
+            continue
+
+
+def _dirs_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+    """True when every recorded directory still exists with the same mtime."""
+    if not dir_mtimes:
+        return False
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+def _scan_root(root: Path, cached: Optional[Dict[str, Any]] = None) -> Tuple[List[Path], Dict[str, Any]]:
+    """Return the plugins below ``root`` plus the cache entry describing them.
+
+    Any file added or removed changes the mtime of its parent directory, so a
+    cached entry whose directories are all unchanged can be reused without walking.
+    """
+    if cached and _dirs_unchanged(cached.get("dirs", {})):
+        return [Path(p) for p in cached.get("entries", [])], cached
+    dir_mtimes: Dict[str, int] = {}
+    found = list(_walk_plugins(root, dir_mtimes))
+    return found, {"dirs": dir_mtimes, "entries": [str(p) for p in found]}
+
+
+def _load_plugin_cache(cache_path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_plugin_cache(cache_path: Path, data: Dict[str, Any]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(data), encoding="utf-8")
+    except OSError as exc:
+        logging.getLogger(__name__).debug("Could not write plugin cache %s: %s", cache_path, exc)
+
+
+def discover_plugins(
+    base_dir: Path,
+    cache_path: Optional[Path] = None,
+    force: bool = False,
+) -> PluginScanResult:
+    """Walk the known plugin folders below ``base_dir`` and the system VST paths.
+
+    Pure filesystem work with no Qt calls, so it is safe to run on a worker thread.
+    With ``cache_path`` set, roots whose directories are unchanged since the last
+    scan are served from that JSON cache; ``force`` ignores it and re-walks.
+    """
+    workspace_candidates = [
+        base_dir / "included_plugins",
+        base_dir.parent / "included_plugins",
+    ]
+
+    # Multiple search paths
+    plugin_dirs = [
+        *workspace_candidates,
+        Path("C:/Program Files/VSTPlugins"),
+        Path("C:/Program Files/Steinberg/VSTPlugins"),
+        Path("C:/Program Files/Common Files/VST3"),
+        Path("C:/Program Files (x86)/VSTPlugins"),
+        Path("C:/Program Files (x86)/Steinberg/VSTPlugins"),
+    ]
+
+    # Stat each candidate exactly once; the workspace lookup reuses the same probes.
+    probes = {p: p.exists() for p in plugin_dirs}
+    workspace_dir = next((p for p in workspace_candidates if probes[p]), None)
+    available_dirs = [p for p, ok in probes.items() if ok]
+    missing_dirs = [p for p, ok in probes.items() if not ok and "Program Files" not in str(p)]
+
+    # Walk the roots concurrently so their disk metadata latency overlaps;
+    # scandir/stat release the GIL.
+    cache = _load_plugin_cache(cache_path) if cache_path and not force else {}
+
+    def scan(root: Path) -> Tuple[List[Path], Dict[str, Any]]:
+        return _scan_root(root, cache.get(str(root)))
+
+    if len(available_dirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(available_dirs))) as ex:
+            results = list(ex.map(scan, available_dirs))
+    else:
+        results = [scan(root) for root in available_dirs]
+
+    plugins: List[Path] = []
+    new_cache: Dict[str, Any] = {}
+    for root, (found, entry) in zip(available_dirs, results):
+        # The walk order depends on the stack, so sort each root's hits to keep
+        # the duplicate that wins below stable from run to run.
+        plugins.extend(sorted(found))
+        new_cache[str(root)] = entry
+    if cache_path and new_cache != cache:
+        _save_plugin_cache(cache_path, new_cache)
+
+    # Remove duplicates in one pass (first root in search order, then first path
+    # within it, wins), then sort survivors
+    seen: Dict[str, Path] = {}
+    for plugin_path in plugins:
+        seen.setdefault(_fast_lower(plugin_path.name), plugin_path)
+
+    return PluginScanResult(
+        workspace_dir=workspace_dir,
+        available_dirs=available_dirs,
+        missing_dirs=missing_dirs,
+        plugins=[seen[key] for key in sorted(seen)],
+    )
+
+
+class PluginScanSignals(QObject):
+    """Signals for :class:`PluginScanWorker`; a QRunnable cannot carry signals itself."""
+
+    finished = pyqtSignal(object, list)
+
+
+class PluginScanWorker(QRunnable):
+    """Runs :func:`discover_plugins` on the thread pool.
+
+    ``signals.finished`` delivers the :class:`PluginScanResult` plus the
+    ``(name, full_path)`` pairs for the library list, so the GUI thread only
+    builds list items.
+    """
+
+    def __init__(self, base_dir: Path, cache_path: Optional[Path] = None, force: bool = False) -> None:
+        super().__init__()
+        self.base_dir = base_dir
+        self.cache_path = cache_path
+        self.force = force
+        self.signals = PluginScanSignals()
+
+    def run(self) -> None:
+        try:
+            result = discover_plugins(self.base_dir, cache_path=self.cache_path, force=self.force)
+        except Exception as exc:
+            logging.getLogger(__name__).error("Plugin scan failed: %s", exc, exc_info=True)
+            result = PluginScanResult()
+        entries = [(path.stem, str(path)) for path in result.plugins]
+        self.signals.finished.emit(result, entries)
+
+
 @dataclass(eq=False)
 class PluginChainSlot:
     """Represents a plugin slot in the chain."""
@@ -134,8 +557,78 @@ class PluginChainSlot:
     parameters: Dict[int, float] = field(default_factory=dict)
     lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
     supports_midi: bool = False
+    # (supports_midi, is_instrument) derived once per loaded plugin; None until known.
+    capability_signature: Optional[Tuple[bool, bool]] = None
+    # Bumped per parameter request so results from superseded fetches are dropped.
+    param_fetch_token: int = 0
+
+
+
+def read_slot_parameters(slot: PluginChainSlot) -> List[Dict[str, Any]]:
+    """Read the slot's parameter list, falling back to ``describe_ui()`` when status has none.
+
+    Blocks on the Carla host, so callers run it off the GUI thread.
+    """
+    logger = logging.getLogger(__name__)
+    host = slot.host
+    if host is None:
+        return []
+
+    status: Dict[str, Any] = {}
+    try:
+        with slot.lock:
+            status = host.status()
+    except Exception as exc:
+        status = {}
+        logger.debug("Failed to read slot %s status: %s", slot.index, exc, exc_info=True)
+
+    if not isinstance(status, dict):
+        status = {}
+
+    params = status.get("parameters", [])
+    logger.debug("Slot %s initial parameter count: %s", slot.index, len(params) if isinstance(params, list) else 'n/a')
+
+    if not params:
+        descriptor: Dict[str, Any] = {}
+        try:
+            with slot.lock:
+                descriptor = host.describe_ui(include_parameters=True)
+        except Exception as exc:
+            logger.debug("describe_ui failed for slot %s: %s", slot.index, exc, exc_info=True)
+        else:
+            if isinstance(descriptor, dict):
+                params = descriptor.get("parameters") or []
+                if not params:
+                    plugin_info = descriptor.get("plugin")
+                    if isinstance(plugin_info, dict):
+                        params = plugin_info.get("parameters") or []
+                if params:
+                    logger.debug("Slot %s recovered %d parameters via describe_ui()", slot.index, len(params))
+                else:
+                    logger.debug("Slot %s still reports no parameters after describe_ui()", slot.index)
+    return list(params or [])
+
+
+class ParameterFetchSignals(QObject):
+    """Signals for :class:`ParameterFetchWorker`."""
+
+    # slot, request token, is_retry, parameters
+    ready = pyqtSignal(object, int, bool, list)
 
 
+class ParameterFetchWorker(QRunnable):
+    """Runs :func:`read_slot_parameters` on the thread pool so Carla IPC never stalls the GUI."""
+
+    def __init__(self, slot: PluginChainSlot, token: int, is_retry: bool = False) -> None:
+        super().__init__()
+        self.slot = slot
+        self.token = token
+        self.is_retry = is_retry
+        self.signals = ParameterFetchSignals()
+
+    def run(self) -> None:
+        self.signals.ready.emit(self.slot, self.token, self.is_retry, read_slot_parameters(self.slot))
+
 
 class StrudelPatternBridge(QObject):
     """Bridge object exposed to Strudel via QWebChannel."""
@@ -354,6 +847,14 @@ class PianoKeyboard(QWidget):
             painter.setPen(QPen(QColor(17, 17, 17), 2))
             painter.drawRect(*rect)
     
+    def note_rect(self, note: int) -> Optional[QRect]:
+        """Return the on-screen rectangle of ``note`` or ``None`` if it is not laid out yet."""
+        rect = self.black_key_rects.get(note) or self.white_key_rects.get(note)
+        if rect is None:
+            return None
+        # Pad by the 2px key outline so the border is repainted too.
+        return QRect(*rect).adjusted(-2, -2, 2, 2)
+
     def get_note_at_position(self, x, y):
         """Get note at mouse position."""
         if not (self.white_key_rects and self.black_key_rects):
@@ -575,6 +1076,73 @@ class CollapsibleSection(QFrame):
         self.toggle_button.setChecked(bool(expanded))
 
 
+class ParameterControl(QFrame):
+    """Label + slider row for one plugin parameter; rebindable so rows can be pooled."""
+
+    # Installed once on the parameter tabs and matched by property, so Qt parses it a
+    # single time instead of once per row. The descendant selector keeps the value label
+    # styled as it was under the old per-row ``QFrame`` rule.
+    STYLE_SHEET = """
+        QFrame[paramFrame="true"], QFrame[paramFrame="true"] QFrame {
+            background-color: rgba(255, 255, 255, 0.04);
+            border: 1px solid rgba(255, 255, 255, 0.08);
+            border-radius: 8px;
+            padding: 10px;
+        }
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setProperty("paramFrame", True)
+        param_layout = QVBoxLayout(self)
+
+        self.value_label = QLabel()
+        param_layout.addWidget(self.value_label)
+
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setMinimum(0)
+        self.slider.setMaximum(1000)
+        self.slider.valueChanged.connect(self._on_value_changed)
+        param_layout.addWidget(self.slider)
+
+        self._slot: Optional[PluginChainSlot] = None
+        self._param_id: Any = None
+        self._name = ""
+        self._units = ""
+        self._min_val = 0.0
+        self._max_val = 1.0
+
+    def bind(self, slot: PluginChainSlot, param: Dict[str, Any]) -> None:
+        """Point this row at ``param`` of ``slot`` without emitting a parameter change."""
+        self._slot = slot
+        self._param_id = param.get("id")
+        self._name = param.get("display_name") or param.get("name", "Parameter")
+        self._units = param.get("units", "")
+        self._min_val = param.get("min", 0)
+        self._max_val = param.get("max", 1)
+        current_val = param.get("value", 0)
+
+        self.value_label.setText(f"{self._name}: {current_val:.3f} {self._units}")
+        span = self._max_val - self._min_val
+        normalized = (current_val - self._min_val) / span if span else 0
+        with QSignalBlocker(self.slider):
+            self.slider.setValue(int(normalized * 1000))
+
+    @pyqtSlot(int)
+    def _on_value_changed(self, val: int) -> None:
+        slot = self._slot
+        host = slot.host if slot is not None else None
+        if host is None:
+            return
+        actual = self._min_val + (val / 1000.0) * (self._max_val - self._min_val)
+        try:
+            with slot.lock:
+                host.set_parameter(self._param_id, actual)
+            self.value_label.setText(f"{self._name}: {actual:.3f} {self._units}")
+        except Exception:
+            pass
+
+
 class PluginChainWidget(QWidget):
     """Widget for managing the plugin chain."""
     
@@ -736,9 +1304,8 @@ class PluginChainWidget(QWidget):
 
             # Docking failed - fall back to floating window and inform the user.
             container.clear_container()
-            dock_check.blockSignals(True)
-            dock_check.setChecked(False)
-            dock_check.blockSignals(False)
+            with QSignalBlocker(dock_check):
+                dock_check.setChecked(False)
             QMessageBox.warning(
                 self,
                 "Plugin Dock",
@@ -800,6 +1367,7 @@ class PluginChainWidget(QWidget):
                 slot.host.unload()
                 slot.host.shutdown()
         slot.supports_midi = False
+        slot.capability_signature = None
         self._clear_host_container()
 
         self.slots.pop(removed_index)
@@ -895,6 +1463,7 @@ class PluginChainWidget(QWidget):
             slot.host = None
         slot.plugin_path = None
         slot.supports_midi = False
+        slot.capability_signature = None
         slot.ui_visible = False
         self._clear_host_container()
         self.update_slot_display(self.selected_slot_index)
@@ -1002,6 +1571,11 @@ class PluginChainWidget(QWidget):
 class AmbianceQtImproved(QMainWindow):
     """Improved Qt desktop app with plugin chaining."""
 
+
+    # Oldest rack log lines are discarded beyond this many.
+    RACK_LOG_MAX_LINES = 2000
+    PARAM_RETRY_MAX_ATTEMPTS = 10  # Increased from 5 to 10 for slow plugins like Aspen
+
     # Map QWERTY keyboard keys to semitone offsets from the piano's start note.
     # Layout follows common DAW conventions (Z row = base octave, Q row = +1 octave).
     KEYBOARD_NOTE_MAP: Dict[int, int] = {
@@ -1046,6 +1620,14 @@ class AmbianceQtImproved(QMainWindow):
         Qt.Key_Equal: 30,
         Qt.Key_BracketRight: 31,
     }
+    # Category substrings that mark a plugin as an instrument.
+    INSTRUMENT_CATEGORY_KEYWORDS: Tuple[str, ...] = ("instrument", "synth", "generator")
+    # One case-insensitive scan per category string instead of lower() plus a probe per keyword.
+    INSTRUMENT_CATEGORY_RE = re.compile("|".join(map(re.escape, INSTRUMENT_CATEGORY_KEYWORDS)), re.IGNORECASE)
+    # Dense lookup table for the hot key-press path: index by Qt key code, -1 = unmapped.
+    KEYBOARD_NOTE_LUT = _build_note_lut(KEYBOARD_NOTE_MAP)
+    # Modifier combinations that should never be interpreted as note keys.
+    KEYBOARD_DISALLOWED_MODIFIERS = Qt.ControlModifier | Qt.AltModifier | Qt.MetaModifier
     
     def _install_event_filter(self):
         if self._qt_app is None:
@@ -1058,27 +1640,43 @@ class AmbianceQtImproved(QMainWindow):
 
     def __init__(self):
         super().__init__()
+        self._init_optional_attrs()
         self.setFocusPolicy(Qt.StrongFocus)
         self.keyboard_active_notes: Dict[int, int] = {}
         self._qt_app = QApplication.instance()
         self._keyboard_suspended = False
 
         
-        # Logging
-        self.logger = logging.getLogger(__name__)
-        
         # State
         self.plugin_chain = []
         self.param_sliders = {}
         self.updating_from_plugin = False
         self.instrument_velocity = 0.85
         self.instrument_octave = 4
+        self._piano_start_note = 0
+        self._piano_end_note = -1
+        self._piano_dirty_notes: Set[int] = set()
+        self._piano_repaint_pending = False
         self.param_refresh_attempts: Dict[int, int] = {}
+        # Detached ParameterControl rows per slot index, recycled across parameter refreshes.
+        self._param_widget_pool: Dict[int, List[ParameterControl]] = {}
+        # One reusable retry timer per slot while a plugin has not reported parameters yet.
+        self._param_retry_timers: Dict[int, QTimer] = {}
+        self._param_retry_labels: Dict[int, QLabel] = {}
+        # (slot index, bound host method) for MIDI-capable active slots, rebuilt lazily
+        # after any load/unload/bypass change.
+        self._midi_note_on_fns: List[Tuple[int, Callable[..., Any]]] = []
+        self._midi_note_off_fns: List[Tuple[int, Callable[..., Any]]] = []
+        self._midi_slots_dirty = True
         self.theme_key = "flat"
         self.dark_mode = THEME_PRESETS[self.theme_key]["dark"]
+        self._applied_theme_key: Optional[str] = None
+        self._qss_cache: Dict[Tuple[str, bool], str] = {}
+        self._palette_cache: Dict[str, QPalette] = {}
         self.colors = dict(COLORS)
         self._apply_theme_colors(self.theme_key)
-        self.fallback_audio_threads: List[threading.Thread] = []
+        self._fallback_queue: "queue.Queue[Optional[Tuple[int, int]]]" = queue.Queue()
+        self._fallback_worker: Optional[threading.Thread] = None
         self.warned_no_winsound = False
 
         self.strudel_available = QWebEngineView is not None
@@ -1105,6 +1703,18 @@ class AmbianceQtImproved(QMainWindow):
             self.logger.error("Failed to initialise audio engine: %s", exc, exc_info=True)
             self.audio_engine = None
         
+        self._scan_in_flight = False
+
+        # Log lines are queued and flushed once per frame so bursts cost one document edit.
+        self._log_queue: Deque[str] = deque(maxlen=self.RACK_LOG_MAX_LINES)
+        # Formatted HH:MM:SS reused for every line logged within the same second.
+        self._log_ts_second = -1
+        self._log_ts_text = ""
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(16)
+        self._log_timer.timeout.connect(self._flush_log)
+
         # Timer for parameter updates
         self.poll_timer = QTimer()
         self.poll_timer.timeout.connect(self.poll_parameters)
@@ -1119,6 +1729,18 @@ class AmbianceQtImproved(QMainWindow):
         self.process_timer.timeout.connect(QApplication.processEvents)
         self.process_timer.start(10)  # Process events every 10ms
     
+    def _init_optional_attrs(self) -> None:
+        """Pre-declare widgets that are built later (or lazily) so callers can test against ``None``."""
+        self.logger = logging.getLogger(__name__)
+        self.theme_combo: Optional[QComboBox] = None
+        self.chain_widget: Optional[PluginChainWidget] = None
+        self.blocks_panel: Optional[BlocksPanel] = None
+        self.instrument_panel: Optional[QFrame] = None
+        self.piano: Optional[PianoKeyboard] = None
+        self.log_panel: Optional[QFrame] = None
+        self.rack_output: Optional[QPlainTextEdit] = None
+        self.last_workspace_path = ""
+
     def init_ui(self):
         self.setWindowTitle("Ambiance Studio Rack")
         self.setGeometry(120, 80, 1560, 960)
@@ -1156,6 +1778,7 @@ class AmbianceQtImproved(QMainWindow):
         self.plugin_block = self.build_plugin_block()
         self.plugin_section = CollapsibleSection("Plugin Rack")
         self.plugin_section.setContentWidget(self.plugin_block)
+        self.plugin_section.toggled.connect(self._on_plugin_section_toggled)
         self.plugin_section.set_expanded(False)
         self.body_layout.addWidget(self.plugin_section)
 
@@ -1222,8 +1845,7 @@ class AmbianceQtImproved(QMainWindow):
         layout.setContentsMargins(18, 10, 18, 10)
         layout.setSpacing(10)
 
-        title = QLabel("Noisetown Ultimate")
-        title.setObjectName("ToolbarTitle")
+        title = self._mk_label("Noisetown Ultimate", "ToolbarTitle")
         layout.addWidget(title)
 
         self.start_audio_btn = QPushButton("Start Audio")
@@ -1257,45 +1879,52 @@ class AmbianceQtImproved(QMainWindow):
 
         self.theme_combo = QComboBox()
         self.theme_combo.setObjectName("ThemePicker")
-        self.theme_combo.blockSignals(True)
-        self.theme_combo.addItem("Flat (Default)", "flat")
-        self.theme_combo.addItem("Windows 98", "win98")
-        self.theme_combo.addItem("Windows XP", "winxp")
-        self.theme_combo.currentIndexChanged.connect(self.on_theme_changed)
-        default_index = self.theme_combo.findData(self.theme_key)
-        if default_index >= 0:
-            self.theme_combo.setCurrentIndex(default_index)
-        self.theme_combo.blockSignals(False)
+        with QSignalBlocker(self.theme_combo):
+            self.theme_combo.addItem("Flat (Default)", "flat")
+            self.theme_combo.addItem("Windows 98", "win98")
+            self.theme_combo.addItem("Windows XP", "winxp")
+            self.theme_combo.currentIndexChanged.connect(self.on_theme_changed)
+            default_index = self.theme_combo.findData(self.theme_key)
+            if default_index >= 0:
+                self.theme_combo.setCurrentIndex(default_index)
         layout.addWidget(self.theme_combo)
 
         layout.addStretch()
 
         self.save_session_btn = QPushButton("Save")
-        self.save_session_btn.clicked.connect(
-            lambda: self.append_log("Session saving is not wired yet in offline mode.")
-        )
+        self.save_session_btn.clicked.connect(self._on_save_session_stub)
         layout.addWidget(self.save_session_btn)
 
         self.save_preset_btn = QPushButton("Save Preset+Audio")
-        self.save_preset_btn.clicked.connect(
-            lambda: self.append_log("Preset capture is not yet implemented for the desktop app.")
-        )
+        self.save_preset_btn.clicked.connect(self._on_save_preset_stub)
         layout.addWidget(self.save_preset_btn)
 
         self.load_session_btn = QPushButton("Load")
-        self.load_session_btn.clicked.connect(
-            lambda: self.append_log("Session loading is coming soon for the desktop app.")
-        )
+        self.load_session_btn.clicked.connect(self._on_load_session_stub)
         layout.addWidget(self.load_session_btn)
 
         self.load_preset_btn = QPushButton("Load Preset")
-        self.load_preset_btn.clicked.connect(
-            lambda: self.append_log("Preset loading is not yet implemented offline.")
-        )
+        self.load_preset_btn.clicked.connect(self._on_load_preset_stub)
         layout.addWidget(self.load_preset_btn)
 
         return toolbar
 
+    @pyqtSlot()
+    def _on_save_session_stub(self) -> None:
+        self.append_log("Session saving is not wired yet in offline mode.")
+
+    @pyqtSlot()
+    def _on_save_preset_stub(self) -> None:
+        self.append_log("Preset capture is not yet implemented for the desktop app.")
+
+    @pyqtSlot()
+    def _on_load_session_stub(self) -> None:
+        self.append_log("Session loading is coming soon for the desktop app.")
+
+    @pyqtSlot()
+    def _on_load_preset_stub(self) -> None:
+        self.append_log("Preset loading is not yet implemented offline.")
+
     def ensure_strudel_loaded(self) -> None:
         if not self.strudel_available:
             return
@@ -1675,9 +2304,8 @@ class AmbianceQtImproved(QMainWindow):
                     "Strudel Mode",
                     "PyQtWebEngine is not installed. Install 'PyQtWebEngine' to enable the Strudel playground."
                 )
-                self.strudel_mode_btn.blockSignals(True)
-                self.strudel_mode_btn.setChecked(False)
-                self.strudel_mode_btn.blockSignals(False)
+                with QSignalBlocker(self.strudel_mode_btn):
+                    self.strudel_mode_btn.setChecked(False)
             self._set_keyboard_suspended(False)
             return
 
@@ -1714,6 +2342,7 @@ class AmbianceQtImproved(QMainWindow):
     def build_plugin_block(self) -> QFrame:
         block = QFrame()
         block.setObjectName("PluginBlock")
+        block.setUpdatesEnabled(False)
         layout = QVBoxLayout(block)
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(18)
@@ -1721,16 +2350,13 @@ class AmbianceQtImproved(QMainWindow):
         header = QHBoxLayout()
         header.setSpacing(12)
 
-        rack_title = QLabel("Plugin Rack")
-        rack_title.setObjectName("RackTitle")
+        rack_title = self._mk_label("Plugin Rack", "RackTitle")
         header.addWidget(rack_title)
 
-        self.plugin_block_tagline = QLabel("Route native plugins directly alongside your Noisetown sessions.")
-        self.plugin_block_tagline.setObjectName("RackTagline")
+        self.plugin_block_tagline = self._mk_label("Route native plugins directly alongside your Noisetown sessions.", "RackTagline")
         header.addWidget(self.plugin_block_tagline, 1)
 
-        self.rack_status_label = QLabel("Library pending")
-        self.rack_status_label.setObjectName("RackStatus")
+        self.rack_status_label = self._mk_label("Library pending", "RackStatus")
         header.addWidget(self.rack_status_label, 0, Qt.AlignRight)
 
         layout.addLayout(header)
@@ -1750,16 +2376,50 @@ class AmbianceQtImproved(QMainWindow):
         layout.addWidget(self.host_panel)
 
         self.instrument_panel = self.build_instrument_panel()
-        layout.addWidget(self.instrument_panel)
         self.instrument_panel.setEnabled(False)
+        layout.addWidget(self.instrument_panel)
 
+        # The log panel is built when the section is first expanded; reserve its
+        # position with an empty placeholder so it slots in without a relayout.
+        self._plugin_block_layout = layout
+        self._log_placeholder: Optional[QWidget] = QWidget()
+        layout.addWidget(self._log_placeholder)
 
+        block.setUpdatesEnabled(True)
+        return block
 
+    def _ensure_log_panel(self) -> QFrame:
+        """Build the rack log panel and flush any messages logged before it existed."""
 
-        self.log_panel = self.build_rack_log_panel()
-        layout.addWidget(self.log_panel)
+        if self.log_panel is None:
+            panel = self.build_rack_log_panel()
+            self._plugin_block_layout.replaceWidget(self._log_placeholder, panel)
+            self._log_placeholder.deleteLater()
+            self._log_placeholder = None
+            self.log_panel = panel
+            self._flush_log()
+        return self.log_panel
 
-        return block
+    def _on_plugin_section_toggled(self, expanded: bool) -> None:
+        if expanded:
+            self._ensure_log_panel()
+
+    def _mk_label(
+        self,
+        text: str,
+        obj_name: str,
+        *,
+        wrap: bool = False,
+        align: Optional[Qt.Alignment] = None,
+    ) -> QLabel:
+        """Create a styled label; all panel builders route through here."""
+        label = QLabel(text)
+        label.setObjectName(obj_name)
+        if wrap:
+            label.setWordWrap(True)
+        if align is not None:
+            label.setAlignment(align)
+        return label
 
     def build_workspace_panel(self) -> QFrame:
         frame = QFrame()
@@ -1770,25 +2430,25 @@ class AmbianceQtImproved(QMainWindow):
 
         header = QHBoxLayout()
         header.setSpacing(10)
-        title = QLabel("Plugin Library")
-        title.setObjectName("WorkspaceTitle")
+        title = self._mk_label("Plugin Library", "WorkspaceTitle")
         header.addWidget(title)
 
         self.scan_btn = QPushButton("Refresh")
         self.scan_btn.clicked.connect(self.scan_plugins)
+        force_rescan_action = QAction("Rescan (force)", self.scan_btn)
+        force_rescan_action.triggered.connect(self.force_rescan_plugins)
+        self.scan_btn.addAction(force_rescan_action)
+        self.scan_btn.setContextMenuPolicy(Qt.ActionsContextMenu)
         header.addWidget(self.scan_btn)
         layout.addLayout(header)
 
-        self.workspace_hint = QLabel("Drop VST, VST3, Audio Unit, or mc.svt plugins into this folder.")
-        self.workspace_hint.setWordWrap(True)
-        self.workspace_hint.setObjectName("WorkspaceHint")
+        self.workspace_hint = self._mk_label("Drop VST, VST3, Audio Unit, or mc.svt plugins into this folder.", "WorkspaceHint", wrap=True)
         layout.addWidget(self.workspace_hint)
 
         path_row = QHBoxLayout()
         path_row.setSpacing(8)
 
-        self.workspace_path_label = QLabel("Not available")
-        self.workspace_path_label.setObjectName("WorkspacePath")
+        self.workspace_path_label = self._mk_label("Not available", "WorkspacePath")
         path_row.addWidget(self.workspace_path_label, 1)
 
         self.copy_path_btn = QPushButton("Copy Path")
@@ -1798,13 +2458,14 @@ class AmbianceQtImproved(QMainWindow):
 
         self.plugin_list = QListWidget()
         self.plugin_list.setObjectName("PluginList")
+        # Rows are single-line text: skip per-row size hints and lay out large libraries in batches.
+        self.plugin_list.setUniformItemSizes(True)
+        self.plugin_list.setLayoutMode(QListWidget.Batched)
         self.plugin_list.itemSelectionChanged.connect(self.on_plugin_focus_changed)
         self.plugin_list.itemDoubleClicked.connect(self.on_plugin_selected)
         layout.addWidget(self.plugin_list, 1)
 
-        self.workspace_notes = QLabel()
-        self.workspace_notes.setObjectName("WorkspaceNotes")
-        self.workspace_notes.setWordWrap(True)
+        self.workspace_notes = self._mk_label("", "WorkspaceNotes", wrap=True)
         layout.addWidget(self.workspace_notes)
 
         return frame
@@ -1819,13 +2480,10 @@ class AmbianceQtImproved(QMainWindow):
         header = QVBoxLayout()
         header.setSpacing(6)
 
-        title = QLabel("Streams & Lanes")
-        title.setObjectName("RackStreamsTitle")
+        title = self._mk_label("Streams & Lanes", "RackStreamsTitle")
         header.addWidget(title)
 
-        self.selected_plugin_label = QLabel("Select a plugin to assign it to a lane.")
-        self.selected_plugin_label.setObjectName("SelectedPlugin")
-        self.selected_plugin_label.setWordWrap(True)
+        self.selected_plugin_label = self._mk_label("Select a plugin to assign it to a lane.", "SelectedPlugin", wrap=True)
         header.addWidget(self.selected_plugin_label)
 
         layout.addLayout(header)
@@ -1837,10 +2495,7 @@ class AmbianceQtImproved(QMainWindow):
         layout.addWidget(self.chain_widget)
         QTimer.singleShot(0, self._register_chain_window)
 
-        self.rack_notes_label = QLabel()
-        self.rack_notes_label.setObjectName("RackNotes")
-        self.rack_notes_label.setWordWrap(True)
-        self.rack_notes_label.setText("Tip: Add slots to build A/B processing lanes and stack effects.")
+        self.rack_notes_label = self._mk_label("Tip: Add slots to build A/B processing lanes and stack effects.", "RackNotes", wrap=True)
         layout.addWidget(self.rack_notes_label)
 
         return frame
@@ -1858,11 +2513,9 @@ class AmbianceQtImproved(QMainWindow):
 
         titles = QVBoxLayout()
         titles.setSpacing(4)
-        host_title = QLabel("Live VST Host")
-        host_title.setObjectName("HostTitle")
+        host_title = self._mk_label("Live VST Host", "HostTitle")
         titles.addWidget(host_title)
-        host_subtitle = QLabel("Powered by the embedded Carla engine")
-        host_subtitle.setObjectName("HostSubtitle")
+        host_subtitle = self._mk_label("Powered by the embedded Carla engine", "HostSubtitle")
         titles.addWidget(host_subtitle)
         header.addLayout(titles)
 
@@ -1888,14 +2541,10 @@ class AmbianceQtImproved(QMainWindow):
 
         layout.addLayout(header)
 
-        self.host_status_label = QLabel("Toolkit status pending...")
-        self.host_status_label.setObjectName("HostStatus")
-        self.host_status_label.setWordWrap(True)
+        self.host_status_label = self._mk_label("Toolkit status pending...", "HostStatus", wrap=True)
         layout.addWidget(self.host_status_label)
 
-        self.host_warnings_label = QLabel()
-        self.host_warnings_label.setObjectName("HostWarnings")
-        self.host_warnings_label.setWordWrap(True)
+        self.host_warnings_label = self._mk_label("", "HostWarnings", wrap=True)
         layout.addWidget(self.host_warnings_label)
 
         dock_row = QHBoxLayout()
@@ -1910,11 +2559,9 @@ class AmbianceQtImproved(QMainWindow):
         self.host_editor_container = PluginEditorContainer()
         layout.addWidget(self.host_editor_container, 1)
 
-        if hasattr(self, "chain_widget"):
+        if self.chain_widget is not None:
             self.chain_widget.set_host_controls(self.host_dock_check, self.host_editor_container)
             self.host_dock_check.toggled.connect(self.chain_widget.on_host_dock_toggled)
-        else:
-            self.host_dock_check.toggled.connect(lambda _checked: None)
 
         return frame
 
@@ -1930,11 +2577,9 @@ class AmbianceQtImproved(QMainWindow):
 
         titles = QVBoxLayout()
         titles.setSpacing(4)
-        self.instrument_title_label = QLabel("Digital Instrument")
-        self.instrument_title_label.setObjectName("InstrumentTitle")
+        self.instrument_title_label = self._mk_label("Digital Instrument", "InstrumentTitle")
         titles.addWidget(self.instrument_title_label)
-        self.instrument_subtitle_label = QLabel("Load an instrument plugin to unlock performance controls.")
-        self.instrument_subtitle_label.setObjectName("InstrumentSubtitle")
+        self.instrument_subtitle_label = self._mk_label("Load an instrument plugin to unlock performance controls.", "InstrumentSubtitle")
         titles.addWidget(self.instrument_subtitle_label)
         header.addLayout(titles)
 
@@ -1942,21 +2587,18 @@ class AmbianceQtImproved(QMainWindow):
         octave_box = QHBoxLayout()
         octave_box.setSpacing(6)
         self.instrument_octave_down = QPushButton("Oct -")
-        self.instrument_octave_down.clicked.connect(lambda: self.adjust_instrument_octave(-1))
+        self.instrument_octave_down.clicked.connect(partial(self.adjust_instrument_octave, -1))
         octave_box.addWidget(self.instrument_octave_down)
-        self.instrument_octave_label = QLabel(f"Octave {self.instrument_octave}")
-        self.instrument_octave_label.setObjectName("InstrumentOctave")
+        self.instrument_octave_label = self._mk_label(f"Octave {self.instrument_octave}", "InstrumentOctave")
         octave_box.addWidget(self.instrument_octave_label)
         self.instrument_octave_up = QPushButton("Oct +")
-        self.instrument_octave_up.clicked.connect(lambda: self.adjust_instrument_octave(1))
+        self.instrument_octave_up.clicked.connect(partial(self.adjust_instrument_octave, 1))
         octave_box.addWidget(self.instrument_octave_up)
         header.addLayout(octave_box)
 
         layout.addLayout(header)
 
-        self.instrument_status_label = QLabel("Load an instrument plugin to begin.")
-        self.instrument_status_label.setObjectName("InstrumentStatus")
-        self.instrument_status_label.setWordWrap(True)
+        self.instrument_status_label = self._mk_label("Load an instrument plugin to begin.", "InstrumentStatus", wrap=True)
         layout.addWidget(self.instrument_status_label)
 
         control_row = QHBoxLayout()
@@ -1973,13 +2615,13 @@ class AmbianceQtImproved(QMainWindow):
         self.piano.set_callbacks(self.on_note_on, self.on_note_off)
         # MIDI: C4 (middle C) = note 60 = 12 * (4 + 1)
         self.piano.start_note = 12 * (self.instrument_octave + 1)
+        self._refresh_piano_range()
         layout.addWidget(self.piano)
         self._apply_keyboard_enabled_state()
 
         footer = QHBoxLayout()
         footer.setSpacing(12)
-        velocity_label = QLabel("Velocity")
-        velocity_label.setObjectName("VelocityLabel")
+        velocity_label = self._mk_label("Velocity", "VelocityLabel")
         footer.addWidget(velocity_label)
         self.instrument_velocity_slider = QSlider(Qt.Horizontal)
         self.instrument_velocity_slider.setRange(20, 120)
@@ -1997,6 +2639,7 @@ class AmbianceQtImproved(QMainWindow):
 
         self.param_tabs = QTabWidget()
         self.param_tabs.setObjectName("ParameterTabs")
+        self.param_tabs.setStyleSheet(ParameterControl.STYLE_SHEET)
         layout.addWidget(self.param_tabs)
 
         return frame
@@ -2004,7 +2647,7 @@ class AmbianceQtImproved(QMainWindow):
     def _register_chain_window(self) -> None:
         """Share the main window handle with the plugin chain widget."""
 
-        if not getattr(self, "chain_widget", None):
+        if self.chain_widget is None:
             return
         window = self.windowHandle()
         if window is None:
@@ -2021,26 +2664,17 @@ class AmbianceQtImproved(QMainWindow):
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(8)
 
-        title = QLabel("Rack Activity")
-        title.setObjectName("RackLogTitle")
+        title = self._mk_label("Rack Activity", "RackLogTitle")
         layout.addWidget(title)
 
         self.rack_output = QPlainTextEdit()
         self.rack_output.setObjectName("RackOutput")
         self.rack_output.setReadOnly(True)
+        self.rack_output.setMaximumBlockCount(self.RACK_LOG_MAX_LINES)
         layout.addWidget(self.rack_output)
 
         return frame
 
-    def rgba(self, hex_color: str, alpha: float) -> str:
-        value = hex_color.lstrip('#')
-        if len(value) == 3:
-            value = ''.join(ch * 2 for ch in value)
-        r = int(value[0:2], 16)
-        g = int(value[2:4], 16)
-        b = int(value[4:6], 16)
-        return f"rgba({r}, {g}, {b}, {alpha})"
-
     def _apply_theme_colors(self, key: str) -> None:
         preset = THEME_PRESETS.get(key, THEME_PRESETS['flat'])
         self.colors.update(preset["colors"])
@@ -2048,24 +2682,32 @@ class AmbianceQtImproved(QMainWindow):
 
     def apply_theme(self, key: str, *, update_combo: bool = True, log_change: bool = False) -> None:
         theme_key = key if key in THEME_PRESETS else "flat"
+        if theme_key == self._applied_theme_key:
+            return
         self.theme_key = theme_key
         self._apply_theme_colors(theme_key)
 
-        if update_combo and hasattr(self, "theme_combo"):
+        if update_combo and self.theme_combo is not None:
             index = self.theme_combo.findData(theme_key)
             if index >= 0:
-                self.theme_combo.blockSignals(True)
-                self.theme_combo.setCurrentIndex(index)
-                self.theme_combo.blockSignals(False)
+                with QSignalBlocker(self.theme_combo):
+                    self.theme_combo.setCurrentIndex(index)
 
-        self.update_theme_palette()
-        self.apply_global_styles()
+        # Suspend painting so the palette and stylesheet repolish land in one repaint.
+        self.setUpdatesEnabled(False)
+        try:
+            self.update_theme_palette()
+            self.apply_global_styles()
+            self._applied_theme_key = theme_key
 
-        if getattr(self, "blocks_panel", None):
-            self.blocks_panel.apply_theme(self.colors, dark=self.dark_mode)
+            if self.blocks_panel is not None:
+                self.blocks_panel.apply_theme(self.colors, dark=self.dark_mode)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
-        if log_change and hasattr(self, "rack_output"):
-            label = self.theme_combo.currentText() if hasattr(self, "theme_combo") else theme_key
+        if log_change:
+            label = self.theme_combo.currentText() if self.theme_combo is not None else theme_key
             self.append_log(f"Theme switched to '{label}'.")
 
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # type: ignore[override]
@@ -2086,7 +2728,7 @@ class AmbianceQtImproved(QMainWindow):
         self._apply_keyboard_enabled_state()
 
     def _apply_keyboard_enabled_state(self) -> None:
-        piano = getattr(self, "piano", None)
+        piano = self.piano
         if not piano:
             return
         enabled = not self._keyboard_suspended
@@ -2097,7 +2739,7 @@ class AmbianceQtImproved(QMainWindow):
             piano.setToolTip("Disable Strudel Mode to play the built-in keyboard.")
 
     def _release_all_keyboard_notes(self) -> None:
-        piano = getattr(self, "piano", None)
+        piano = self.piano
         if piano is None:
             return
         pending = set(piano.pressed_keys)
@@ -2114,78 +2756,104 @@ class AmbianceQtImproved(QMainWindow):
         try:
             if event.isAutoRepeat() or not self.isActiveWindow():
                 return False
-            if not getattr(self, "piano", None):
-                return False
-            if self._keyboard_suspended:
+            piano = self.piano
+            if piano is None or self._keyboard_suspended or self.chain_widget is None:
                 return False
-            if not getattr(self, "chain_widget", None):
+            if event.modifiers() & self.KEYBOARD_DISALLOWED_MODIFIERS:
                 return False
-            modifiers = event.modifiers()
-            disallowed = Qt.ControlModifier | Qt.AltModifier | Qt.MetaModifier
-            if int(modifiers & disallowed):
+            key = event.key()
+            lut = self.KEYBOARD_NOTE_LUT
+            # Special keys (F1, Escape, ...) have codes above 0xFF and never map to notes.
+            offset = lut[key] if key < len(lut) else -1
+            if offset < 0:
                 return False
-            offset = self.KEYBOARD_NOTE_MAP.get(event.key())
-            if offset is None:
+            note = self._piano_start_note + offset
+            if note > self._piano_end_note:
                 return False
-            note = self.piano.start_note + offset
-            max_note = self.piano.start_note + self.piano.octaves * 12 - 1
-            if not (self.piano.start_note <= note <= max_note):
-                return False
-            if event.key() in self.keyboard_active_notes:
+            if key in self.keyboard_active_notes:
                 return True
-            self.keyboard_active_notes[event.key()] = note
-            if note not in self.piano.pressed_keys:
-                self.piano.pressed_keys.add(note)
-                self.piano.update()
+            self.keyboard_active_notes[key] = note
+            if note not in piano.pressed_keys:
+                piano.pressed_keys.add(note)
+                self._schedule_piano_repaint(note)
             self.on_note_on(note)
             return True
         except Exception as exc:
-            if hasattr(self, "logger"):
-                self.logger.error("Keyboard press handling failed: %s", exc, exc_info=True)
+            self.logger.error("Keyboard press handling failed: %s", exc, exc_info=True)
             return False
 
     def _handle_key_release(self, event: QKeyEvent) -> bool:
         try:
             if event.isAutoRepeat():
                 return False
-            if not getattr(self, "piano", None):
+            if self.piano is None:
                 return False
             note = self.keyboard_active_notes.pop(event.key(), None)
             if note is None:
                 return False
             if note in self.piano.pressed_keys:
                 self.piano.pressed_keys.remove(note)
-                self.piano.update()
+                self._schedule_piano_repaint(note)
             self.on_note_off(note)
             return True
         except Exception as exc:
-            if hasattr(self, "logger"):
-                self.logger.error("Keyboard release handling failed: %s", exc, exc_info=True)
+            self.logger.error("Keyboard release handling failed: %s", exc, exc_info=True)
             return False
 
 
+    def _schedule_piano_repaint(self, note: int) -> None:
+        """Queue a repaint of ``note``; all keys changed in one event-loop pass share one update."""
+        self._piano_dirty_notes.add(note)
+        if not self._piano_repaint_pending:
+            self._piano_repaint_pending = True
+            QTimer.singleShot(0, self._flush_piano_repaint)
+
+    def _flush_piano_repaint(self) -> None:
+        self._piano_repaint_pending = False
+        notes = self._piano_dirty_notes
+        self._piano_dirty_notes = set()
+        piano = self.piano
+        if piano is None or not notes:
+            return
+        region = QRect()
+        for note in notes:
+            rect = piano.note_rect(note)
+            if rect is None:
+                piano.update()
+                return
+            region = region.united(rect)
+        piano.update(region)
+
     def update_theme_palette(self) -> None:
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(self.colors['bg']))
-        palette.setColor(QPalette.WindowText, QColor(self.colors['text']))
-        base_color = self.colors['panel'] if self.dark_mode else self.colors['card']
-        palette.setColor(QPalette.Base, QColor(base_color))
-        palette.setColor(QPalette.AlternateBase, QColor(self.colors['card']))
-        palette.setColor(QPalette.Text, QColor(self.colors['text']))
-        palette.setColor(QPalette.Button, QColor(self.colors['panel']))
-        palette.setColor(QPalette.ButtonText, QColor(self.colors['text']))
-        palette.setColor(QPalette.Highlight, QColor(self.colors['accent']))
-        highlight_text = QColor("#000000") if not self.dark_mode else QColor(self.colors['text'])
-        palette.setColor(QPalette.HighlightedText, highlight_text)
+        palette = self._palette_cache.get(self.theme_key)
+        if palette is None:
+            palette = self._build_palette(self.theme_key)
+            self._palette_cache[self.theme_key] = palette
         self.setPalette(palette)
 
-    def cleanup_fallback_threads(self):
-        self.fallback_audio_threads = [t for t in self.fallback_audio_threads if t.is_alive()]
+    @staticmethod
+    def _build_palette(key: str) -> QPalette:
+        """Build the window palette for a theme preset."""
+        if key not in THEME_PRESETS:
+            key = 'flat'
+        qc = _THEME_QCOLORS[key]
+        dark_mode = THEME_PRESETS[key]["dark"]
+        palette = QPalette()
+        palette.setColor(QPalette.Window, qc['bg'])
+        palette.setColor(QPalette.WindowText, qc['text'])
+        palette.setColor(QPalette.Base, qc['panel'] if dark_mode else qc['card'])
+        palette.setColor(QPalette.AlternateBase, qc['card'])
+        palette.setColor(QPalette.Text, qc['text'])
+        palette.setColor(QPalette.Button, qc['panel'])
+        palette.setColor(QPalette.ButtonText, qc['text'])
+        palette.setColor(QPalette.Highlight, qc['accent'])
+        palette.setColor(QPalette.HighlightedText, qc['text'] if dark_mode else _BLACK)
+        return palette
 
     def play_fallback_tone(self, note: int, velocity: float = 0.5):
         ws = winsound
         if ws is None:
-            if not self.warned_no_winsound and hasattr(self, "rack_output"):
+            if not self.warned_no_winsound:
                 self.append_log("Fallback audio not available (winsound module missing).")
                 self.warned_no_winsound = True
             return
@@ -2194,251 +2862,90 @@ class AmbianceQtImproved(QMainWindow):
         frequency = max(37, min(32767, frequency))
         millis = max(40, int(max(0.2, min(1.0, velocity)) * 220))
 
-        def beep() -> None:
+        if self._fallback_worker is None:
+            self._fallback_worker = threading.Thread(
+                target=self._fallback_loop,
+                name="FallbackTone",
+                daemon=True,
+            )
+            self._fallback_worker.start()
+        self._fallback_queue.put((frequency, millis))
+
+    def _fallback_loop(self) -> None:
+        """Play queued fallback beeps one after another until a ``None`` sentinel arrives."""
+        ws = winsound
+        while True:
+            request = self._fallback_queue.get()
+            if request is None:
+                return
+            frequency, millis = request
             try:
                 ws.Beep(frequency, millis)
             except RuntimeError:
                 pass
 
-        thread = threading.Thread(target=beep, daemon=True)
-        thread.start()
-        self.fallback_audio_threads.append(thread)
-        self.cleanup_fallback_threads()
-
     def apply_global_styles(self):
-        c = self.colors
-        accent_soft = self.rgba(c['accent'], 0.22)
-        accent_border = self.rgba(c['accent'], 0.45)
-        accent_hover = self.rgba(c['accent'], 0.32)
-        accent_selected = self.rgba(c['accent'], 0.4)
-        badge_bg = self.rgba(c['accent'], 0.16)
-        badge_border = self.rgba(c['accent'], 0.32)
-        panel_border = self.rgba(c['border'], 0.9)
-        card_border = self.rgba(c['border'], 0.4)
-        panel_opaque = self.rgba(c['panel'], 1.0)
-        panel_soft = self.rgba(c['panel'], 0.9)
-        list_bg = self.rgba(c['card'], 0.65) if self.dark_mode else self.rgba(c['card'], 0.35)
-        list_hover = self.rgba(c['accent'], 0.12)
-        list_selected = self.rgba(c['accent'], 0.35)
-        log_bg = self.rgba(c['card'], 0.55)
-        text_disabled = self.rgba(c['text'], 0.45)
-        border_disabled = self.rgba(c['border'], 0.25)
-        card_disabled = self.rgba(c['card'], 0.25)
-        card_half = self.rgba(c['card'], 0.5)
-        card_sixty = self.rgba(c['card'], 0.6)
-
-        style_template = Template(
-            dedent(
-                """
-                QMainWindow {
-                    background-color: $bg;
-                    color: $text;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-size: 14px;
-                }
-                QWidget#CentralWidget,
-                QWidget#BodyWidget {
-                    background-color: $panel_opaque;
-                }
-                QScrollArea#BodyScrollArea {
-                    background-color: $panel_opaque;
-                    border: none;
-                }
-                QScrollArea#BodyScrollArea QWidget {
-                    background-color: $panel_opaque;
-                }
-                QStackedWidget#BodyStack {
-                    background-color: transparent;
-                    border: none;
-                }
-                QWidget#StrudelContainer {
-                    background-color: $card;
-                    border: 1px solid $panel_border;
-                    border-radius: 16px;
-                }
-                QWebEngineView#StrudelView {
-                    background: transparent;
-                    border: none;
-                    border-radius: 14px;
-                }
-                QLabel#StrudelFallback {
-                    color: $text;
-                    padding: 24px;
-                }
-                QFrame#Toolbar {
-                    background-color: $panel;
-                    border: 1px solid $panel_border;
-                    border-radius: 10px;
-                }
-                QLabel#ToolbarTitle {
-                    font-size: 18px;
-                    font-weight: 600;
-                    color: $text;
-                }
-                QComboBox#ThemePicker {
-                    background-color: $card;
-                    border: 1px solid $panel_border;
-                    border-radius: 6px;
-                    padding: 6px 10px;
-                    color: $text;
-                }
-                QFrame#PluginBlock {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 $panel, stop:1 $card);
-                    border-radius: 16px;
-                    border: 1px solid $panel_border;
-                    box-shadow: 0px 26px 48px rgba(0, 0, 0, 0.30);
-                }
-                QFrame#CollapsibleSection {
-                    background-color: transparent;
-                    border: none;
-                }
-                QToolButton#SectionToggle {
-                    border: 1px solid $panel_border;
-                    border-radius: 10px;
-                    font-weight: 600;
-                    padding: 6px 10px;
-                    text-align: left;
-                    background-color: rgba(240, 240, 240, 0.94);
-                    color: #000000;
-                }
-                QToolButton#SectionToggle:hover {
-                    background-color: rgba(255, 255, 255, 0.98);
-                    color: #000000;
-                }
-                QFrame#CollapsibleSectionContent {
-                    background-color: $panel_soft;
-                    border: 1px solid $panel_border;
-                    border-radius: 14px;
-                }
-                QLabel#RackTitle {
-                    font-size: 22px;
-                    font-weight: 700;
-                    color: $text;
-                }
-                QLabel#RackTagline {
-                    color: $muted;
-                }
-                QLabel#RackStatus {
-                    padding: 6px 12px;
-                    border-radius: 999px;
-                    background-color: $badge_bg;
-                    border: 1px solid $badge_border;
-                    color: $text;
-                    font-size: 12px;
-                }
-                QFrame#WorkspacePanel,
-                QFrame#RackPanel,
-                QFrame#HostPanel,
-                QFrame#InstrumentPanel,
-                QFrame#RackLogPanel {
-                    background-color: $panel_soft;
-                    border: 1px solid $card_border;
-                    border-radius: 12px;
-                }
-                QFrame#HostPanel {
-                    border: 1px solid $accent_border;
-                }
-                QFrame#PluginEditorContainer {
-                    background-color: $panel_soft;
-                    border: 1px dashed $card_border;
-                    border-radius: 12px;
-                    min-height: 320px;
-                }
-                QFrame#PluginEditorContainer QLabel#PluginEditorPlaceholder {
-                    color: $muted;
-                    font-style: italic;
-                }
-                QListWidget#PluginList {
-                    background-color: $list_bg;
-                    border: 1px solid $card_border;
-                    border-radius: 10px;
-                    padding: 6px;
-                }
-                QListWidget#PluginList::item {
-                    padding: 10px;
-                    border-radius: 8px;
-                    margin: 4px 0;
-                    color: $text;
-                }
-                QListWidget#PluginList::item:selected {
-                    background-color: $list_selected;
-                    border: 1px solid $accent_border;
-                }
-                QListWidget#PluginList::item:hover {
-                    background-color: $list_hover;
-                }
-                QPlainTextEdit#RackOutput {
-                    background-color: $log_bg;
-                    border: 1px solid $card_border;
-                    border-radius: 10px;
-                    padding: 10px;
-                    color: $text;
-                }
-                QPushButton {
-                    background-color: $accent_soft;
-                    border: 1px solid $accent_border;
-                    border-radius: 8px;
-                    padding: 8px 14px;
-                    color: $text;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background-color: $accent_hover;
-                }
-                QPushButton:disabled {
-                    color: $text_disabled;
-                    border-color: $border_disabled;
-                    background-color: $card_disabled;
-                }
-                QTabWidget#ParameterTabs::pane {
-                    border: 1px solid $card_border;
-                    background-color: $card_half;
-                    border-radius: 10px;
-                }
-                QTabBar::tab {
-                    background-color: $card_sixty;
-                    border: 1px solid $card_border;
-                    border-radius: 8px;
-                    padding: 8px 16px;
-                    color: $text;
-                    margin-right: 6px;
-                }
-                QTabBar::tab:selected {
-                    background-color: $accent_selected;
-                }
-                """
-            )
-        )
-
-        stylesheet = style_template.substitute(
-            bg=c['bg'],
-            text=c['text'],
-            muted=c['muted'],
-            panel=c['panel'],
-            panel_opaque=panel_opaque,
-            panel_soft=panel_soft,
-            panel_border=panel_border,
-            card=c['card'],
-            card_border=card_border,
-            card_half=card_half,
-            card_sixty=card_sixty,
-            card_disabled=card_disabled,
-            list_bg=list_bg,
-            list_hover=list_hover,
-            list_selected=list_selected,
-            log_bg=log_bg,
-            accent_soft=accent_soft,
-            accent_border=accent_border,
-            accent_hover=accent_hover,
-            accent_selected=accent_selected,
-            badge_bg=badge_bg,
-            badge_border=badge_border,
-            text_disabled=text_disabled,
-            border_disabled=border_disabled,
-        )
-
+        cache_key = (self.theme_key, self.dark_mode)
+        stylesheet = self._qss_cache.get(cache_key)
+        if stylesheet is None:
+            stylesheet = self._build_qss(self.colors, self.dark_mode)
+            self._qss_cache[cache_key] = stylesheet
         self.setStyleSheet(stylesheet)
 
+    def _build_qss(self, c: Dict[str, str], dark_mode: bool) -> str:
+        """Render the window stylesheet for a colour palette."""
+        accent = c['accent']
+        border = c['border']
+        card = c['card']
+        panel = c['panel']
+        accent_soft = _rgba(accent, 0.22)
+        accent_border = _rgba(accent, 0.45)
+        accent_hover = _rgba(accent, 0.32)
+        accent_selected = _rgba(accent, 0.4)
+        badge_bg = _rgba(accent, 0.16)
+        badge_border = _rgba(accent, 0.32)
+        panel_border = _rgba(border, 0.9)
+        card_border = _rgba(border, 0.4)
+        panel_opaque = _rgba(panel, 1.0)
+        panel_soft = _rgba(panel, 0.9)
+        list_bg = _rgba(card, 0.65) if dark_mode else _rgba(card, 0.35)
+        list_hover = _rgba(accent, 0.12)
+        list_selected = _rgba(accent, 0.35)
+        log_bg = _rgba(card, 0.55)
+        text_disabled = _rgba(c['text'], 0.45)
+        border_disabled = _rgba(border, 0.25)
+        card_disabled = _rgba(card, 0.25)
+        card_half = _rgba(card, 0.5)
+        card_sixty = _rgba(card, 0.6)
+
+        subs = {
+            "bg": c['bg'],
+            "text": c['text'],
+            "muted": c['muted'],
+            "panel": panel,
+            "panel_opaque": panel_opaque,
+            "panel_soft": panel_soft,
+            "panel_border": panel_border,
+            "card": card,
+            "card_border": card_border,
+            "card_half": card_half,
+            "card_sixty": card_sixty,
+            "card_disabled": card_disabled,
+            "list_bg": list_bg,
+            "list_hover": list_hover,
+            "list_selected": list_selected,
+            "log_bg": log_bg,
+            "accent_soft": accent_soft,
+            "accent_border": accent_border,
+            "accent_hover": accent_hover,
+            "accent_selected": accent_selected,
+            "badge_bg": badge_bg,
+            "badge_border": badge_border,
+            "text_disabled": text_disabled,
+            "border_disabled": border_disabled,
+        }
+        return "\n".join(part.substitute(subs) for part in _GLOBAL_QSS_PARTS)
+
     def on_edit_mode_toggled(self, checked: bool):
         self.edit_mode_btn.setText("Edit: ON" if checked else "Edit: OFF")
         state = "enabled" if checked else "disabled"
@@ -2456,7 +2963,7 @@ class AmbianceQtImproved(QMainWindow):
         self.apply_theme(key, update_combo=False, log_change=True)
 
     def copy_workspace_path(self):
-        if not hasattr(self, "last_workspace_path") or not self.last_workspace_path:
+        if not self.last_workspace_path:
             self.append_log("No workspace path available to copy.")
             return
         clipboard = QApplication.clipboard()
@@ -2479,6 +2986,7 @@ class AmbianceQtImproved(QMainWindow):
         self.refresh_host_status(slot)
 
     def on_chain_slot_updated(self, index: int):
+        self._midi_slots_dirty = True
         self.update_host_controls()
         if index == self.chain_widget.selected_slot_index:
             slot = self.get_selected_slot()
@@ -2519,48 +3027,56 @@ class AmbianceQtImproved(QMainWindow):
 
     def _extract_plugin_capabilities(self, status: Dict[str, Any]) -> Tuple[bool, bool]:
         """Determine plugin MIDI support and instrument flag from a status payload."""
-        supports_midi = False
-        is_instrument = False
-
         if not isinstance(status, dict):
-            return supports_midi, is_instrument
+            return False, False
+        supports_midi = False
 
-        def consider(container: Any) -> None:
-            nonlocal supports_midi, is_instrument
-            if not isinstance(container, dict):
-                return
-            if container.get("instrument"):
-                is_instrument = True
-                supports_midi = True
-            if container.get("midi"):
-                supports_midi = True
+        plugin = status.get("plugin")
+        if not isinstance(plugin, dict):
+            plugin = {}
 
-        consider(status.get("capabilities"))
+        # Cheapest signal first; an instrument flag from any source then ends the walk.
+        if isinstance(plugin.get("keyboard"), dict):
+            supports_midi = True
 
-        plugin = status.get("plugin")
-        if isinstance(plugin, dict):
-            consider(plugin.get("capabilities"))
-            metadata = plugin.get("metadata")
-            if isinstance(metadata, dict):
-                categories = metadata.get("categories") or metadata.get("category")
-                values: List[str] = []
-                if isinstance(categories, str):
-                    values = [categories]
-                elif isinstance(categories, (list, tuple, set)):
-                    values = [str(value) for value in categories]
-                for entry in values:
-                    lower = entry.lower()
-                    if any(keyword in lower for keyword in ("instrument", "synth", "generator")):
-                        is_instrument = True
-                        supports_midi = True
-                        break
-            keyboard_info = plugin.get("keyboard")
-            if isinstance(keyboard_info, dict):
+        for capabilities in (status.get("capabilities"), plugin.get("capabilities")):
+            if not isinstance(capabilities, dict):
+                continue
+            if capabilities.get("instrument"):
+                return True, True
+            if capabilities.get("midi"):
                 supports_midi = True
 
-        return supports_midi, is_instrument
+        metadata = plugin.get("metadata")
+        if isinstance(metadata, dict):
+            categories = metadata.get("categories") or metadata.get("category")
+            values: List[str] = []
+            if isinstance(categories, str):
+                values = [categories]
+            elif isinstance(categories, (list, tuple, set)):
+                values = [value if isinstance(value, str) else str(value) for value in categories]
+            search = self.INSTRUMENT_CATEGORY_RE.search
+            for entry in values:
+                if search(entry):
+                    return True, True
+
+        return supports_midi, False
+
+    def _slot_capabilities(self, slot: PluginChainSlot, status: Dict[str, Any]) -> Tuple[bool, bool]:
+        """Capabilities of the slot's plugin, derived from ``status`` only until first known.
+
+        They cannot change while a plugin stays loaded, so later status polls reuse
+        the memoized pair. A payload without plugin metadata is not memoized.
+        """
+        signature = slot.capability_signature
+        if signature is None:
+            signature = self._extract_plugin_capabilities(status)
+            if isinstance(status, dict) and isinstance(status.get("plugin"), dict):
+                slot.capability_signature = signature
+        return signature
 
     def refresh_host_status(self, slot: Optional[PluginChainSlot]):
+        self._midi_slots_dirty = True
         if slot and slot.host:
             try:
                 status = slot.host.status()
@@ -2577,7 +3093,7 @@ class AmbianceQtImproved(QMainWindow):
             sample_rate = engine.get("sample_rate") or "?"
             buffer_size = engine.get("buffer_size") or "?"
 
-            slot.supports_midi, is_instrument = self._extract_plugin_capabilities(status)
+            slot.supports_midi, is_instrument = self._slot_capabilities(slot, status)
 
             self.host_status_label.setText(
                 f"Loaded {plugin_name} | Driver: {driver} | SR: {sample_rate} | Buffer: {buffer_size}"
@@ -2605,6 +3121,7 @@ class AmbianceQtImproved(QMainWindow):
             self.instrument_panel.setEnabled(False)
             if slot:
                 slot.supports_midi = False
+                slot.capability_signature = None
             self.rack_status_label.setText(f"Library: {self.plugin_list.count()} plugins")
 
     def unload_selected_slot(self):
@@ -2614,6 +3131,8 @@ class AmbianceQtImproved(QMainWindow):
             return
         self.chain_widget.unload_plugin_from_slot()
         self.param_refresh_attempts.pop(slot.index, None)
+        self._stop_param_retry(slot.index)
+        self._midi_slots_dirty = True
         self.append_log(f"Unloaded slot {slot.index + 1}.")
         self.refresh_host_status(self.get_selected_slot())
         self.update_host_controls()
@@ -2637,8 +3156,15 @@ class AmbianceQtImproved(QMainWindow):
         self.update_instrument_octave_label()
         # MIDI: C at octave N = note 12 * (N + 1)
         self.piano.start_note = 12 * (self.instrument_octave + 1)
+        self._refresh_piano_range()
         self.piano.update()
 
+    def _refresh_piano_range(self) -> None:
+        """Cache the playable note range; call whenever ``piano.start_note`` changes."""
+        piano = self.piano
+        self._piano_start_note = piano.start_note
+        self._piano_end_note = piano.start_note + piano.octaves * 12 - 1
+
     def update_instrument_octave_label(self):
         self.instrument_octave_label.setText(f"Octave {self.instrument_octave}")
 
@@ -2646,68 +3172,65 @@ class AmbianceQtImproved(QMainWindow):
         self.instrument_velocity = max(0.2, min(1.2, value / 100.0))
 
     def append_log(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        entry = f"[{timestamp}] {message}"
-        existing = self.rack_output.toPlainText()
-        if existing:
-            self.rack_output.setPlainText(entry + "\n" + existing)
-        else:
-            self.rack_output.setPlainText(entry)
-        self.rack_output.verticalScrollBar().setValue(0)
+        now = int(time.time())
+        if now != self._log_ts_second:
+            lt = time.localtime(now)
+            self._log_ts_second = now
+            self._log_ts_text = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        timestamp = self._log_ts_text
+        self._log_queue.append(f"[{timestamp}] {message}")
+        # Lines queued before the log panel exists are flushed when it is built.
+        if self.rack_output is not None and not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        """Write every queued log line to the rack output in a single append."""
+        if self.rack_output is None or not self._log_queue:
+            return
+        self.rack_output.appendPlainText("\n".join(self._log_queue))
+        self._log_queue.clear()
 
+    @pyqtSlot()
     def scan_plugins(self):
-        """Scan for VST plugins."""
-        self.plugin_list.clear()
-        base_dir = Path(__file__).parent
-        workspace_candidates = [
-            base_dir / "included_plugins",
-            base_dir.parent / "included_plugins",
-        ]
-        workspace_dir = next((p for p in workspace_candidates if p.exists()), None)
+        """Scan for VST plugins on a worker thread and populate the library when done."""
+        self._start_plugin_scan(force=False)
+
+    @pyqtSlot()
+    def force_rescan_plugins(self):
+        """Re-walk every plugin folder, ignoring the on-disk scan cache."""
+        self._start_plugin_scan(force=True)
+
+    def _start_plugin_scan(self, force: bool) -> None:
+        if self._scan_in_flight:
+            return
+        self._scan_in_flight = True
+        self.scan_btn.setEnabled(False)
+        self.statusBar().showMessage("Scanning plugin folders...")
+        worker = PluginScanWorker(Path(__file__).parent, cache_path=PLUGIN_CACHE_PATH, force=force)
+        worker.signals.finished.connect(self._on_plugin_scan_finished)
+        QThreadPool.globalInstance().start(worker)
+
+    @pyqtSlot(object, list)
+    def _on_plugin_scan_finished(self, result: PluginScanResult, entries: List[Tuple[str, str]]) -> None:
+        self._scan_in_flight = False
+        self.scan_btn.setEnabled(True)
+
+        workspace_dir = result.workspace_dir
         self.last_workspace_path = str(workspace_dir) if workspace_dir else ""
         self.workspace_path_label.setText(self.last_workspace_path or "Workspace not found")
 
-        # Multiple search paths
-        plugin_dirs = [
-            base_dir / "included_plugins",
-            base_dir.parent / "included_plugins",
-            Path("C:/Program Files/VSTPlugins"),
-            Path("C:/Program Files/Steinberg/VSTPlugins"),
-            Path("C:/Program Files/Common Files/VST3"),
-            Path("C:/Program Files (x86)/VSTPlugins"),
-            Path("C:/Program Files (x86)/Steinberg/VSTPlugins"),
-        ]
-
-        available_dirs = [p for p in plugin_dirs if p.exists()]
-        missing_dirs = [p for p in plugin_dirs if not p.exists() and "Program Files" not in str(p)]
-
-        plugins = []
-        for plugin_dir in available_dirs:
-            for pattern in ("**/*.dll", "**/*.vst3", "**/*.vst"):
-                plugins.extend(plugin_dir.glob(pattern))
-        
-        # Remove duplicates and sort
-        seen = {}
-        for plugin_path in sorted(set(plugins)):
-            key = plugin_path.name.lower()
-            if key in seen:
-                continue
-            seen[key] = plugin_path
-            item = QListWidgetItem(plugin_path.stem)
-            item.setData(Qt.UserRole, str(plugin_path))
-            item.setToolTip(str(plugin_path))
-            self.plugin_list.addItem(item)
+        self._set_plugin_list(entries)
 
         notes: List[str] = []
-        if not available_dirs:
+        if not result.available_dirs:
             notes.append("No plugin directories were found. Drop VST files into the Ambiance 'included_plugins' folder.")
-        elif missing_dirs:
+        elif result.missing_dirs:
             notes.append("Some optional plugin folders were not found and will be skipped.")
 
         self.workspace_notes.setText("\n".join(notes))
 
-        plugin_count = len(seen)
-        dir_count = len(available_dirs)
+        plugin_count = len(result.plugins)
+        dir_count = len(result.available_dirs)
         self.statusBar().showMessage(f"Found {plugin_count} plugins across {dir_count} folders")
         self.rack_status_label.setText(f"Library: {plugin_count} plugins")
         if plugin_count == 0:
@@ -2718,6 +3241,21 @@ class AmbianceQtImproved(QMainWindow):
         self.refresh_selected_plugin_label()
         self.update_host_controls()
     
+    def _set_plugin_list(self, entries: List[Tuple[str, str]]) -> None:
+        """Replace the library contents with ``(name, path)`` entries in one layout pass."""
+        plugin_list = self.plugin_list
+        plugin_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(plugin_list):
+                plugin_list.clear()
+                plugin_list.addItems([name for name, _ in entries])
+                for row, (_, path) in enumerate(entries):
+                    item = plugin_list.item(row)
+                    item.setData(Qt.UserRole, path)
+                    item.setToolTip(path)
+        finally:
+            plugin_list.setUpdatesEnabled(True)
+
     def on_plugin_selected(self, item):
         """Handle plugin double-click."""
         # Check if there's a selected slot in chain
@@ -2738,6 +3276,8 @@ class AmbianceQtImproved(QMainWindow):
         plugin_path = Path(items[0].data(Qt.UserRole))
         slot = self.chain_widget.slots[self.chain_widget.selected_slot_index]
         slot.supports_midi = False
+        slot.capability_signature = None
+        self._midi_slots_dirty = True
         
         try:
             if slot.host:
@@ -2773,7 +3313,8 @@ class AmbianceQtImproved(QMainWindow):
                 self.logger.warning(f"Using {driver_name} driver - Install JACK or ASIO for better compatibility")
                 self.logger.warning(f"See JACK_SETUP.md for installation instructions")
 
-            slot.supports_midi, _ = self._extract_plugin_capabilities(status)
+            slot.supports_midi, _ = self._slot_capabilities(slot, status)
+            self._midi_slots_dirty = True
 
             self.chain_widget.update_slot_display(slot.index)
             self.chain_widget.update_controls()
@@ -2791,15 +3332,42 @@ class AmbianceQtImproved(QMainWindow):
 
         except Exception as e:
             slot.supports_midi = False
+            slot.capability_signature = None
+            self._midi_slots_dirty = True
             QMessageBox.critical(self, "Load Error", f"Failed to load plugin:\n{str(e)}")
             self.logger.error(f"Plugin load error: {e}", exc_info=True)
             self.append_log(f"Failed to load plugin: {e}")
     
     def update_parameters_for_slot(self, slot: PluginChainSlot):
-        """Update parameter controls for a slot."""
+        """Update parameter controls for a slot; the host is queried on the thread pool."""
         if not slot.host:
             return
-        
+        self._request_slot_parameters(slot)
+
+    def _request_slot_parameters(self, slot: PluginChainSlot, is_retry: bool = False) -> None:
+        slot.param_fetch_token += 1
+        worker = ParameterFetchWorker(slot, slot.param_fetch_token, is_retry)
+        worker.signals.ready.connect(self._on_parameters_ready)
+        QThreadPool.globalInstance().start(worker)
+
+    @pyqtSlot(object, int, bool, list)
+    def _on_parameters_ready(
+        self,
+        slot: PluginChainSlot,
+        token: int,
+        is_retry: bool,
+        params: List[Dict[str, Any]],
+    ) -> None:
+        if token != slot.param_fetch_token or slot.host is None or slot not in self.chain_widget.slots:
+            return
+        if is_retry and not params:
+            self._advance_param_retry(slot.index)
+            return
+        self._rebuild_parameter_tab(slot, params)
+        if is_retry:
+            self.refresh_host_status(slot)
+
+    def _rebuild_parameter_tab(self, slot: PluginChainSlot, params: List[Dict[str, Any]]) -> None:
         # Get or create tab for this slot
         tab_name = f"Slot {slot.index + 1}"
         tab_index = -1
@@ -2829,50 +3397,33 @@ class AmbianceQtImproved(QMainWindow):
             if existing_layout is None or not isinstance(existing_layout, QVBoxLayout):
                 existing_layout = QVBoxLayout(widget)
             layout = cast(QVBoxLayout, existing_layout)
+            # Park parameter rows for reuse; only one-off status labels are destroyed.
+            pool = self._param_widget_pool.setdefault(slot.index, [])
+            widget.setUpdatesEnabled(False)
             while layout.count():
                 item = layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-        
-        # Add parameters
-        status: Dict[str, Any] = {}
-        try:
-            with slot.lock:
-                status = slot.host.status()
-        except Exception as exc:
-            status = {}
-            self.logger.debug("Failed to read slot %s status: %s", slot.index, exc, exc_info=True)
-
-        if not isinstance(status, dict):
-            status = {}
+                child = item.widget()
+                if isinstance(child, ParameterControl):
+                    child.hide()
+                    pool.append(child)
+                elif child is not None:
+                    child.deleteLater()
 
-        params = status.get("parameters", [])
-        self.logger.debug("Slot %s initial parameter count: %s", slot.index, len(params) if isinstance(params, list) else 'n/a')
-
-        if not params:
-            descriptor: Dict[str, Any] = {}
-            try:
-                with slot.lock:
-                    descriptor = slot.host.describe_ui(include_parameters=True)
-            except Exception as exc:
-                self.logger.debug("describe_ui failed for slot %s: %s", slot.index, exc, exc_info=True)
-            else:
-                if isinstance(descriptor, dict):
-                    params = descriptor.get("parameters") or []
-                    if not params:
-                        plugin_info = descriptor.get("plugin")
-                        if isinstance(plugin_info, dict):
-                            params = plugin_info.get("parameters") or []
-                    if params:
-                        status["parameters"] = params
-                        self.logger.debug("Slot %s recovered %d parameters via describe_ui()", slot.index, len(params))
-                    else:
-                        self.logger.debug("Slot %s still reports no parameters after describe_ui()", slot.index)
+        try:
+            self._populate_parameter_tab(slot, layout, params)
+        finally:
+            widget.setUpdatesEnabled(True)
 
+    def _populate_parameter_tab(
+        self,
+        slot: PluginChainSlot,
+        layout: QVBoxLayout,
+        params: List[Dict[str, Any]],
+    ) -> None:
         attempts = self.param_refresh_attempts.get(slot.index, 0)
 
         if not params:
-            max_attempts = 10  # Increased from 5 to 10 for slow plugins like Aspen
+            max_attempts = self.PARAM_RETRY_MAX_ATTEMPTS
             if attempts == 0:
                 message = "Discovering parameters..."
             elif attempts < max_attempts:
@@ -2884,113 +3435,115 @@ class AmbianceQtImproved(QMainWindow):
             layout.addStretch()
             if attempts < max_attempts:
                 self.param_refresh_attempts[slot.index] = attempts + 1
-                # Progressive delays: start fast, get slower for stubborn plugins
-                if attempts < 2:
-                    delay = 500  # First 2: 500ms (quick check)
-                elif attempts < 5:
-                    delay = 1500  # Next 3: 1.5s (give it time)
-                else:
-                    delay = 3000  # Final 5: 3s (really patient)
-                QTimer.singleShot(
-                    delay,
-                    lambda idx=slot.index: self.retry_parameter_fetch(idx)
-                )
+                self._schedule_param_retry(slot.index, label, attempts)
             return
         
+        self._stop_param_retry(slot.index)
         self.param_refresh_attempts[slot.index] = 0
         for param in params:
             self.create_parameter_control(layout, slot, param)
         
         layout.addStretch()
 
-    def retry_parameter_fetch(self, slot_index: int):
-        if 0 <= slot_index < len(self.chain_widget.slots):
-            slot = self.chain_widget.slots[slot_index]
-            if slot.host:
-                self.update_parameters_for_slot(slot)
-                self.refresh_host_status(slot)
-    
+    @staticmethod
+    def _param_retry_delay(attempts: int) -> int:
+        # Progressive delays: start fast, get slower for stubborn plugins
+        if attempts < 2:
+            return 500  # First 2: 500ms (quick check)
+        if attempts < 5:
+            return 1500  # Next 3: 1.5s (give it time)
+        return 3000  # Final 5: 3s (really patient)
+
+    def _schedule_param_retry(self, slot_index: int, label: QLabel, attempts: int) -> None:
+        """(Re)arm the slot's persistent retry timer; ``label`` is updated in place on each poll."""
+        timer = self._param_retry_timers.get(slot_index)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(partial(self._poll_params_once, slot_index))
+            self._param_retry_timers[slot_index] = timer
+        self._param_retry_labels[slot_index] = label
+        timer.start(self._param_retry_delay(attempts))
+
+    def _stop_param_retry(self, slot_index: int) -> None:
+        timer = self._param_retry_timers.get(slot_index)
+        if timer is not None:
+            timer.stop()
+        self._param_retry_labels.pop(slot_index, None)
+
+    def _poll_params_once(self, slot_index: int) -> None:
+        """Retry tick: re-query the host; the tab is rebuilt only once parameters arrive."""
+        if not 0 <= slot_index < len(self.chain_widget.slots):
+            self._stop_param_retry(slot_index)
+            return
+        slot = self.chain_widget.slots[slot_index]
+        if slot.host is None or slot_index not in self._param_retry_labels:
+            self._stop_param_retry(slot_index)
+            return
+        self._request_slot_parameters(slot, is_retry=True)
+
+    def _advance_param_retry(self, slot_index: int) -> None:
+        """A retry came back empty: relabel in place and re-arm the timer, or give up."""
+        label = self._param_retry_labels.get(slot_index)
+        if label is None:
+            return
+        attempts = self.param_refresh_attempts.get(slot_index, 0)
+        max_attempts = self.PARAM_RETRY_MAX_ATTEMPTS
+        if attempts >= max_attempts:
+            label.setText("No parameters reported by this plugin.")
+            self._stop_param_retry(slot_index)
+            return
+        label.setText(f"No parameters yet. Retrying... (attempt {attempts + 1}/{max_attempts})")
+        self.param_refresh_attempts[slot_index] = attempts + 1
+        self._schedule_param_retry(slot_index, label, attempts)
+
     def create_parameter_control(self, layout: QVBoxLayout, slot: PluginChainSlot, param: Dict[str, Any]) -> None:
-        """Create a parameter control widget."""
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: rgba(255, 255, 255, 0.04);
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                border-radius: 8px;
-                padding: 10px;
-            }}
-        """)
-        param_layout = QVBoxLayout(frame)
-        
-        # Label
-        name = param.get("display_name") or param.get("name", "Parameter")
-        value_label = QLabel(f"{name}: {param['value']:.3f} {param.get('units', '')}")
-        param_layout.addWidget(value_label)
-        
-        # Slider
-        slider = QSlider(Qt.Horizontal)
-        slider.setMinimum(0)
-        slider.setMaximum(1000)
-        
-        min_val = param.get("min", 0)
-        max_val = param.get("max", 1)
-        current_val = param.get("value", 0)
-        
-        normalized = (current_val - min_val) / (max_val - min_val) if max_val != min_val else 0
-        slider.setValue(int(normalized * 1000))
-        
-        def on_value_changed(val: int) -> None:
-            host = slot.host
-            if host is None:
-                return
-            norm = val / 1000.0
-            actual = min_val + norm * (max_val - min_val)
-            try:
-                with slot.lock:
-                    host.set_parameter(param["id"], actual)
-                value_label.setText(f"{name}: {actual:.3f} {param.get('units', '')}")
-            except:
-                pass
-        
-        slider.valueChanged.connect(on_value_changed)
-        param_layout.addWidget(slider)
-        
-        layout.addWidget(frame)
+        """Add a parameter control, reusing a pooled row for this slot when one is free."""
+        pool = self._param_widget_pool.get(slot.index)
+        control = pool.pop() if pool else ParameterControl()
+        control.bind(slot, param)
+        layout.addWidget(control)
+        control.show()
     
     def toggle_note_names(self, checked):
         """Toggle note name display."""
         self.piano.show_note_names = checked
         self.piano.update()
     
+    def _refresh_midi_dispatch(self) -> None:
+        """Rebind the note dispatch lists to the current MIDI-capable active slots."""
+        slots = [s for s in self.chain_widget.get_active_slots() if s.supports_midi and s.host is not None]
+        self._midi_note_on_fns = [(s.index, s.host.note_on) for s in slots]
+        self._midi_note_off_fns = [(s.index, s.host.note_off) for s in slots]
+        self._midi_slots_dirty = False
+
     def on_note_on(self, note: int):
         """Handle note on event - send to all active plugins in chain."""
-        active_slots = [s for s in self.chain_widget.get_active_slots() if s.supports_midi]
-        if not active_slots:
-            self.play_fallback_tone(note, self.instrument_velocity)
+        if self._midi_slots_dirty:
+            self._refresh_midi_dispatch()
+        velocity = self.instrument_velocity
+        dispatch = self._midi_note_on_fns
+        if not dispatch:
+            self.play_fallback_tone(note, velocity)
             return
 
-        for slot in active_slots:
+        # Don't hold lock during MIDI send to avoid deadlock
+        for index, note_on in dispatch:
             try:
-                host = slot.host
-                if host is None:
-                    continue
-                # Don't hold lock during MIDI send to avoid deadlock
-                host.note_on(note, velocity=self.instrument_velocity)
+                note_on(note, velocity=velocity)
             except Exception as e:
-                self.logger.error(f"Note on error for slot {slot.index}: {e}")
+                self.logger.error(f"Note on error for slot {index}: {e}")
 
     def on_note_off(self, note: int):
         """Handle note off event - send to all active plugins in chain."""
-        for slot in [s for s in self.chain_widget.get_active_slots() if s.supports_midi]:
+        if self._midi_slots_dirty:
+            self._refresh_midi_dispatch()
+        # Don't hold lock during MIDI send to avoid deadlock
+        for index, note_off in self._midi_note_off_fns:
             try:
-                host = slot.host
-                if host is None:
-                    continue
-                # Don't hold lock during MIDI send to avoid deadlock
-                host.note_off(note)
+                note_off(note)
             except Exception as e:
-                self.logger.error(f"Note off error for slot {slot.index}: {e}")
+                self.logger.error(f"Note off error for slot {index}: {e}")
     
     def poll_parameters(self):
         """Poll parameter values for all active slots."""
@@ -3053,10 +3606,10 @@ class AmbianceQtImproved(QMainWindow):
                 self.logger.error("Audio engine shutdown failed: %s", exc, exc_info=True)
 
         self.chain_widget.shutdown()
-        for thread in list(self.fallback_audio_threads):
-            if thread.is_alive():
-                thread.join(timeout=0.2)
-        self.fallback_audio_threads.clear()
+        if self._fallback_worker is not None:
+            self._fallback_queue.put(None)
+            self._fallback_worker.join(timeout=0.2)
+            self._fallback_worker = None
 
         if self._qt_app is not None:
             try:
@@ -3068,6 +3621,10 @@ class AmbianceQtImproved(QMainWindow):
 
 
 def main():
+    # Skip Qt's opaque-sibling region subtraction: every panel here is tiled,
+    # never overlapping, so the per-widget intersect math on each repolish buys
+    # nothing. Overlapping siblings would simply overdraw.
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
     app = QApplication(sys.argv)
     app.setApplicationName("Ambiance Improved")
     app.setStyle("Fusion")
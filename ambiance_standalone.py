@@ -1,16 +1,17 @@
 """Standalone VST plugin host with built-in keyboard and plugin browser."""
 
 import argparse
+import os
 import sys
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, Iterator, Sequence
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QPushButton, QVBoxLayout, QHBoxLayout,
     QWidget, QLabel, QSlider, QScrollArea, QMessageBox, QGroupBox,
     QListWidget, QListWidgetItem, QSplitter, QFrame
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QPainter, QColor, QPen
 
 sys.path.insert(0, str(Path(__file__).parent / "ambiance" / "src"))
@@ -18,6 +19,107 @@ sys.path.insert(0, str(Path(__file__).parent / "ambiance" / "src"))
 from ambiance.integrations.carla_host import CarlaVSTHost, CarlaHostError
 
 
+PLUGIN_EXTENSIONS = (".dll", ".vst3")
+
+
+def _iter_plugins(root: str, dir_mtimes: dict[str, int] | None = None) -> Iterator[Path]:
+    """Yield plugin paths under ``root`` in a single directory walk.
+
+    When ``dir_mtimes`` is given it is filled with the mtime of every directory visited.
+    """
+    try:
+        if dir_mtimes is not None:
+            dir_mtimes[root] = os.stat(root).st_mtime_ns
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name.lower().endswith(PLUGIN_EXTENSIONS):
+            yield Path(entry.path)
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:  # e.g. a protected folder; skip it rather than abort the scan
+            continue
+        if is_dir:
+            yield from _iter_plugins(entry.path, dir_mtimes)
+
+
+def _dirs_unchanged(dir_mtimes: dict[str, int]) -> bool:
+    """True when every recorded directory still exists with the same mtime."""
+    if not dir_mtimes:
+        return False
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+# root -> (directory mtimes seen by the last walk, plugins found under it)
+_PLUGIN_SCAN_CACHE: dict[str, tuple[dict[str, int], list[Path]]] = {}
+
+
+def discover_plugin_files(
+    plugin_dirs: Sequence[Path],
+    progress: Callable[[int], None] | None = None,
+) -> list[Path]:
+    """Return the sorted, de-duplicated plugin paths below ``plugin_dirs``.
+
+    Adding or removing a file changes its parent directory's mtime, so a root
+    whose recorded directories are all unchanged is served from the previous
+    walk; rescanning an untouched library costs one ``stat`` per directory.
+    ``progress`` is called with the running count as new plugins turn up.
+    """
+    plugins: set[Path] = set()
+    for plugin_dir in plugin_dirs:
+        root = str(plugin_dir)
+        cached = _PLUGIN_SCAN_CACHE.get(root)
+        if cached is not None and _dirs_unchanged(cached[0]):
+            plugins.update(cached[1])
+            if progress is not None:
+                progress(len(plugins))
+            continue
+        dir_mtimes: dict[str, int] = {}
+        found = []
+        for plugin_path in _iter_plugins(root, dir_mtimes):
+            found.append(plugin_path)
+            if plugin_path not in plugins:
+                plugins.add(plugin_path)
+                if progress is not None:
+                    progress(len(plugins))
+        _PLUGIN_SCAN_CACHE[root] = (dir_mtimes, found)
+    return sorted(plugins)
+
+
+class PluginScanSignals(QObject):
+    """Signals for :class:`PluginScanWorker`; a QRunnable cannot carry signals itself."""
+
+    progressChanged = pyqtSignal(int)
+    finished = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+
+class PluginScanWorker(QRunnable):
+    """Walks the plugin directories on the thread pool.
+
+    ``progressChanged`` reports the running count; ``finished`` delivers sorted
+    ``(name, full_path)`` pairs so the GUI thread only builds list items.
+    """
+
+    def __init__(self, plugin_dirs: Sequence[Path]) -> None:
+        super().__init__()
+        self.plugin_dirs = list(plugin_dirs)
+        self.signals = PluginScanSignals()
+
+    def run(self) -> None:
+        try:
+            plugins = discover_plugin_files(self.plugin_dirs, self.signals.progressChanged.emit)
+            entries = [(path.stem, str(path)) for path in plugins]
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(entries)
+
+
 class PianoKeyboard(QWidget):
     """Virtual piano keyboard widget."""
 
@@ -179,6 +281,7 @@ class AmbianceApp(QMainWindow):
         self.param_sliders = {}
         self.updating_from_plugin = False
         self._auto_plugin = Path(auto_plugin) if auto_plugin else None
+        self._scan_worker: PluginScanWorker | None = None
 
         # Timer for parameter polling
         self.poll_timer = QTimer()
@@ -280,38 +383,46 @@ class AmbianceApp(QMainWindow):
         QTimer.singleShot(100, self.scan_plugins)
 
     def scan_plugins(self):
-        """Scan for available VST plugins."""
+        """Scan for available VST plugins on a worker thread."""
+        if self._scan_worker is not None:
+            return
         self.plugin_list.clear()
         self.status_label.setText("Scanning for plugins...")
-        QApplication.processEvents()
 
-        try:
-            # Get plugin directories from Carla
-            # For now, scan included_plugins
-            base_dir = Path(__file__).parent
-            plugin_dirs = [
-                base_dir / "included_plugins",
-                base_dir.parent / "included_plugins",
-            ]
-
-            plugins = []
-            for plugin_dir in plugin_dirs:
-                if plugin_dir.exists():
-                    # Find .dll and .vst3 files
-                    for pattern in ("**/*.dll", "**/*.vst3"):
-                        for plugin_file in plugin_dir.glob(pattern):
-                            plugins.append(plugin_file)
-
-            # Add to list
-            for plugin_path in sorted(set(plugins)):
-                item = QListWidgetItem(plugin_path.stem)
-                item.setData(Qt.UserRole, str(plugin_path))
-                self.plugin_list.addItem(item)
-
-            self.status_label.setText(f"Found {len(plugins)} plugin(s)")
-        except Exception as e:
-            QMessageBox.warning(self, "Scan Error", f"Failed to scan plugins:\n{e}")
-            self.status_label.setText("Scan failed")
+        # Get plugin directories from Carla
+        # For now, scan included_plugins
+        base_dir = Path(__file__).parent
+        plugin_dirs = [
+            base_dir / "included_plugins",
+            base_dir.parent / "included_plugins",
+        ]
+
+        worker = PluginScanWorker(plugin_dirs)
+        worker.signals.progressChanged.connect(self.on_scan_progress)
+        worker.signals.finished.connect(self.on_scan_finished)
+        worker.signals.failed.connect(self.on_scan_failed)
+        self._scan_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def on_scan_progress(self, count):
+        """Show the running plugin count while a scan is in flight."""
+        self.status_label.setText(f"Scanning for plugins... {count} found")
+
+    def on_scan_finished(self, entries):
+        """Fill the plugin list from a completed scan."""
+        self._scan_worker = None
+        self.plugin_list.setUpdatesEnabled(False)
+        for name, path in entries:
+            item = QListWidgetItem(name)
+            item.setData(Qt.UserRole, path)
+            self.plugin_list.addItem(item)
+        self.plugin_list.setUpdatesEnabled(True)
+        self.status_label.setText(f"Found {len(entries)} plugin(s)")
+
+    def on_scan_failed(self, message):
+        self._scan_worker = None
+        QMessageBox.warning(self, "Scan Error", f"Failed to scan plugins:\n{message}")
+        self.status_label.setText("Scan failed")
 
     def on_plugin_selected(self, item):
         """Load selected plugin."""
@@ -416,16 +527,13 @@ class AmbianceApp(QMainWindow):
             self.param_layout.addWidget(label)
             return
 
+        # Label and slider go straight into param_layout; no wrapper widget per parameter
         for param in params:
-            param_widget = QWidget()
-            param_layout = QVBoxLayout(param_widget)
-            param_layout.setContentsMargins(0, 5, 0, 5)
-
             # Label
             name = param["display_name"] or param["name"]
             units = param["units"]
             value_label = QLabel(f"{name}: {param['value']:.3f} {units}")
-            param_layout.addWidget(value_label)
+            self.param_layout.addWidget(value_label)
 
             # Slider
             slider = QSlider(Qt.Horizontal)
@@ -463,9 +571,8 @@ class AmbianceApp(QMainWindow):
                 return handler
 
             slider.valueChanged.connect(make_handler(param_id, min_val, max_val, value_label, name, units))
-            param_layout.addWidget(slider)
-
-            self.param_layout.addWidget(param_widget)
+            self.param_layout.addWidget(slider)
+            self.param_layout.addSpacing(5)
 
         self.param_layout.addStretch()
 
@@ -479,29 +586,39 @@ class AmbianceApp(QMainWindow):
             params = status.get("parameters", [])
 
             self.updating_from_plugin = True
-
-            for param in params:
-                param_id = param["id"]
-                value = param["value"]
-
-                if param_id in self.param_sliders:
-                    slider_info = self.param_sliders[param_id]
-                    slider = slider_info["slider"]
-                    label = slider_info["label"]
-                    min_val = slider_info["min"]
-                    max_val = slider_info["max"]
-                    name = slider_info["name"]
-                    units = slider_info["units"]
-
-                    # Update slider
-                    normalized = (value - min_val) / (max_val - min_val) if max_val != min_val else 0
-                    slider_pos = int(normalized * 1000)
-
-                    if abs(slider.value() - slider_pos) > 1:
-                        slider.blockSignals(True)
-                        slider.setValue(slider_pos)
-                        slider.blockSignals(False)
-                        label.setText(f"{name}: {value:.3f} {units}")
+            # Repaints are held off once for the whole pass, and only after the
+            # first slider that actually needs to move; only moved sliders are blocked.
+            repaints_held = False
+
+            try:
+                for param in params:
+                    param_id = param["id"]
+                    value = param["value"]
+
+                    if param_id in self.param_sliders:
+                        slider_info = self.param_sliders[param_id]
+                        slider = slider_info["slider"]
+                        label = slider_info["label"]
+                        min_val = slider_info["min"]
+                        max_val = slider_info["max"]
+                        name = slider_info["name"]
+                        units = slider_info["units"]
+
+                        # Update slider
+                        normalized = (value - min_val) / (max_val - min_val) if max_val != min_val else 0
+                        slider_pos = int(normalized * 1000)
+
+                        if abs(slider.value() - slider_pos) > 1:
+                            if not repaints_held:
+                                repaints_held = True
+                                self.param_widget.setUpdatesEnabled(False)
+                            slider.blockSignals(True)
+                            slider.setValue(slider_pos)
+                            slider.blockSignals(False)
+                            label.setText(f"{name}: {value:.3f} {units}")
+            finally:
+                if repaints_held:
+                    self.param_widget.setUpdatesEnabled(True)
 
             self.updating_from_plugin = False
         except Exception:
@@ -3,6 +3,8 @@
 
 import json
 import sys
+import threading
+import time
 from pathlib import Path
 
 # Add to your main startup or configuration
@@ -35,6 +37,25 @@ def configure_host_fallback():
     print(f"✓ Created host fallback configuration at {config_path}")
     return config_path
 
+def _engine_activity(backend):
+    """Return the event the backend's engine callback sets (see ``patch_carla_loading``)."""
+    return vars(backend).setdefault("_engine_activity", threading.Event())
+
+def _idle_until_ready(backend, max_ms=50, step_ms=2):
+    """Pump ``engine_idle()`` until Carla delivers its next engine callback, for at most ``max_ms``.
+
+    Without the callback hook nothing sets the event, so this is a plain
+    ``max_ms`` wait like the fixed sleep it replaces.
+    """
+    activity = _engine_activity(backend)
+    activity.clear()
+    deadline = time.monotonic() + max_ms / 1000
+    while True:
+        backend.host.engine_idle()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or activity.wait(min(step_ms / 1000, remaining)):
+            return
+
 def patch_carla_loading():
     """Monkey-patch to add synchronization to Carla loading"""
     try:
@@ -42,9 +63,20 @@ def patch_carla_loading():
         sys.path.insert(0, str(Path("C:/Ambiance2/src")))
         
         from ambiance.integrations.carla_host import CarlaHost
-        import time
         
         original_load = CarlaHost.load_plugin
+        original_callback = getattr(CarlaHost, "_handle_engine_callback", None)
+        
+        if original_callback is not None:
+            # Carla reports plugin-added, idle and other engine events through this
+            # callback; the next one after a load marks the engine as caught up.
+            def signalling_callback(self, *args):
+                try:
+                    return original_callback(self, *args)
+                finally:
+                    _engine_activity(self).set()
+            
+            CarlaHost._handle_engine_callback = signalling_callback
         
         def safe_load(self, plugin_path, **kwargs):
             plugin_name = Path(plugin_path).stem
@@ -60,15 +92,13 @@ def patch_carla_loading():
             # For other plugins, add synchronization
             try:
                 if hasattr(self, '_engine_running') and self._engine_running:
-                    self.host.engine_idle()
-                    time.sleep(0.05)
+                    _idle_until_ready(self)
                 
                 result = original_load(self, plugin_path, **kwargs)
                 
                 # Extra idle after loading
                 if hasattr(self, 'host') and self.host:
-                    self.host.engine_idle()
-                    time.sleep(0.05)
+                    _idle_until_ready(self)
                 
                 return result
             except Exception as e:
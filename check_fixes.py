@@ -1,8 +1,26 @@
 """Simple check to verify the code fixes are in place."""
 
+import re
 import sys
 from pathlib import Path
 
+
+def find_markers(path, markers):
+    """Return the keys of ``markers`` whose literal text occurs in ``path``.
+
+    All markers are matched by one compiled alternation in a single pass over
+    the file, stopping as soon as every marker has been seen.
+    """
+    combined = re.compile("|".join(f"(?P<{key}>{re.escape(text)})" for key, text in markers.items()))
+    found = set()
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            for match in combined.finditer(line):
+                found.add(match.lastgroup)
+            if len(found) == len(markers):
+                break
+    return found
+
 print("="*60)
 print("Checking Ambiance Keyboard & Audio Fixes")
 print("="*60)
@@ -15,14 +33,17 @@ if not carla_host_file.exists():
     print("ERROR: carla_host.py not found!")
     sys.exit(1)
 
-content = carla_host_file.read_text(encoding='utf-8')
+found = find_markers(carla_host_file, {
+    "midi_detect": "accepts_midi = self._plugin_accepts_midi()",
+    "midi_fallback": "supports_midi = self._supports_midi or accepts_midi",
+})
 
-if "accepts_midi = self._plugin_accepts_midi()" in content:
+if "midi_detect" in found:
     print("PASS: MIDI detection code updated")
 else:
     print("FAIL: MIDI detection fix not found")
 
-if "supports_midi = self._supports_midi or accepts_midi" in content:
+if "midi_fallback" in found:
     print("PASS: MIDI capability fallback logic added")
 else:
     print("FAIL: MIDI fallback logic not found")
@@ -35,14 +56,18 @@ if not server_file.exists():
     print("ERROR: server.py not found!")
     sys.exit(1)
 
-content = server_file.read_text(encoding='utf-8')
+found = find_markers(server_file, {
+    "broad_except": "except Exception as exc:",
+    "ui_route": "/api/vst/ui",
+    "fallback_descriptor": "fallback_descriptor",
+})
 
-if "except Exception as exc:" in content and "/api/vst/ui" in content:
+if {"broad_except", "ui_route"} <= found:
     print("PASS: Broader exception handling added")
 else:
     print("FAIL: Exception handling not updated")
 
-if "fallback_descriptor" in content:
+if "fallback_descriptor" in found:
     print("PASS: Fallback descriptor logic added")
 else:
     print("FAIL: Fallback descriptor not found")
@@ -55,19 +80,23 @@ if not claude_md.exists():
     print("ERROR: CLAUDE.md not found!")
     sys.exit(1)
 
-content = claude_md.read_text(encoding='utf-8')
+found = find_markers(claude_md, {
+    "audio_section": "Audio Architecture & Real-Time Playback",
+    "browser_bypass": "Audio bypasses the browser entirely",
+    "keyboard_docs": "Digital Keyboard Display",
+})
 
-if "Audio Architecture & Real-Time Playback" in content:
+if "audio_section" in found:
     print("PASS: Audio architecture section added")
 else:
     print("FAIL: Audio architecture documentation missing")
 
-if "Audio bypasses the browser entirely" in content:
+if "browser_bypass" in found:
     print("PASS: Browser audio bypass explanation added")
 else:
     print("FAIL: Browser bypass explanation missing")
 
-if "Digital Keyboard Display" in content:
+if "keyboard_docs" in found:
     print("PASS: Keyboard display documentation added")
 else:
     print("FAIL: Keyboard display docs missing")
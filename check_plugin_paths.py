@@ -1,6 +1,7 @@
 """Check what paths plugins are discovered with."""
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 import json
 
@@ -8,6 +9,13 @@ sys.path.insert(0, str(Path(__file__).parent / "ambiance" / "src"))
 
 from ambiance.integrations.plugins import PluginRackManager
 
+
+@lru_cache(maxsize=None)
+def _exists(path: str) -> bool:
+    """Stat ``path`` once; the report looks the same paths up repeatedly."""
+    return bool(path) and Path(path).exists()
+
+
 manager = PluginRackManager(base_dir=Path("C:/Ambiance2/ambiance"))
 plugins = manager.discover_plugins()
 
@@ -21,7 +29,7 @@ for plugin in plugins:
     print(f"Name: {name}")
     print(f"  Full Path: {path}")
     print(f"  Relative Path: {rel_path}")
-    print(f"  File Exists: {Path(path).exists() if path else False}")
+    print(f"  File Exists: {_exists(path)}")
     print()
 
 print("="*70)
@@ -35,11 +43,11 @@ if aspen_plugins:
     path = aspen.get('path', '')
     print(f"\nAspen Trumpet plugin:")
     print(f"  Path from discovery: {path}")
-    print(f"  File exists: {Path(path).exists()}")
+    print(f"  File exists: {_exists(path)}")
 
     expected_path = "C:/Ambiance2/included_plugins/Aspen-Trumpet-1_64/Aspen Trumpet 1.dll"
     print(f"\n  Expected path: {expected_path}")
-    print(f"  Expected exists: {Path(expected_path).exists()}")
+    print(f"  Expected exists: {_exists(expected_path)}")
 
     if path != expected_path:
         print(f"\n  ❌ PATH MISMATCH!")
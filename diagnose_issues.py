@@ -1,12 +1,143 @@
 """Diagnose keyboard and audio issues."""
 
+import argparse
+import os
 import sys
+import time
+import traceback
 from pathlib import Path
 import json
 
 # Add to path
 sys.path.insert(0, str(Path(__file__).parent / "ambiance" / "src"))
 
+PLUGIN_CACHE_PATH = Path.home() / ".ambiance" / "diagnose_plugin_cache.json"
+
+CAP_INSTRUMENT = 1 << 0
+CAP_MIDI = 1 << 1
+CAP_MIDI_ROUTED = 1 << 2
+CAP_EDITOR = 1 << 3
+CAP_KEYBOARD = CAP_MIDI | CAP_INSTRUMENT  # the web UI shows its keyboard for either
+
+
+def capability_mask(caps):
+    """Fold a status/descriptor ``capabilities`` dict into CAP_* bits."""
+    caps = caps or {}
+    return (
+        (CAP_INSTRUMENT if caps.get('instrument') else 0)
+        | (CAP_MIDI if caps.get('midi') else 0)
+        | (CAP_MIDI_ROUTED if caps.get('midi_routed') else 0)
+        | (CAP_EDITOR if caps.get('editor') else 0)
+    )
+
+
+def _directory_mtimes(roots):
+    """Map every directory below ``roots`` to its mtime; files are never statted."""
+    mtimes = {}
+    stack = [str(root) for root in roots]
+    while stack:
+        current = stack.pop()
+        try:
+            mtimes[current] = os.stat(current).st_mtime_ns
+            with os.scandir(current) as entries:
+                stack.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+        except OSError:
+            continue
+    return mtimes
+
+
+def _dirs_unchanged(mtimes):
+    if not mtimes:
+        return False
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in mtimes.items())
+    except OSError:
+        return False
+
+
+def cached_discover(manager, cache_path=PLUGIN_CACHE_PATH, force=False):
+    """Return the manager's discovered plugins, reusing the last result when possible.
+
+    Adding or removing a plugin changes its parent directory's mtime, so while
+    every directory recorded with the cached result is unchanged the cache is
+    returned after one stat per directory. Returns ``(plugins, from_cache)``.
+    """
+    key = str(Path(manager.base_dir).resolve())
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+    entry = cache.get(key)
+    if not force and isinstance(entry, dict) and _dirs_unchanged(entry.get("dirs", {})):
+        return entry.get("plugins", []), True
+
+    plugins = manager.discover_plugins(max_workers=8)
+    cache[key] = {"dirs": _directory_mtimes(manager.plugin_roots()), "plugins": plugins}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache, default=str), encoding="utf-8")
+    except OSError:
+        pass
+    return plugins, False
+
+
+# How long the test note keeps sounding once output is detected, so it is heard
+# rather than cut off as a click a few milliseconds after note-on
+AUDIBLE_HOLD_SECONDS = 0.5
+
+
+def wait_for_audio(host, timeout=2.0, threshold=1e-3, interval=0.01):
+    """Wait until the plugin's output peak rises above ``threshold``.
+
+    Returns the seconds it took, or ``None`` if nothing audible was rendered
+    within ``timeout``.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    while True:
+        if host.output_peak() > threshold:
+            return time.monotonic() - start
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(interval)
+
+
+# Console output is collected and written per section: every print() on a Windows
+# console is a separate, slow write. Piped output is left unbuffered so it streams.
+BUFFER_OUTPUT = sys.stdout.isatty()
+_pending_output = []
+
+
+def say(text=""):
+    if BUFFER_OUTPUT:
+        _pending_output.append(text)
+    else:
+        print(text)
+
+
+def flush_output():
+    if _pending_output:
+        sys.stdout.write("\n".join(_pending_output) + "\n")
+        sys.stdout.flush()
+        _pending_output.clear()
+
+
+def report_exception(exc=None):
+    """Print ``exc``'s traceback (default: the current one) after any buffered lines."""
+    flush_output()
+    if exc is None:
+        traceback.print_exc()
+    else:
+        traceback.print_exception(type(exc), exc, exc.__traceback__)
+
+
+parser = argparse.ArgumentParser(description="Diagnose keyboard and audio issues")
+parser.add_argument("--force-refresh", action="store_true", help="Ignore the cached plugin discovery results")
+parser.add_argument("--no-carla", action="store_true", help="Only run plugin discovery; skip loading Carla")
+args = parser.parse_args()
+
 print("="*70)
 print("Ambiance Issue Diagnosis")
 print("="*70)
@@ -16,147 +147,172 @@ print("\n[1] Plugin Discovery:")
 try:
     from ambiance.integrations.plugins import PluginRackManager
     manager = PluginRackManager(base_dir=Path("C:/Ambiance2/ambiance"))
-    plugins = manager.discover_plugins()  # Correct method name
-    print(f"  Found {len(plugins)} plugins:")
+    plugins, from_cache = cached_discover(manager, force=args.force_refresh)
+    print(f"  Found {len(plugins)} plugins{' (cached)' if from_cache else ''}:")
 
-    # Check for duplicates (should be fixed now)
-    paths = {}
+    # Check for duplicates (should be fixed now). Keys are case- and
+    # separator-normalised so C:\Foo and c:/foo count as the same plugin on Windows.
+    # discover_plugins always fills path, name and format, so index them directly.
+    first_seen = {}
+    normcase, normpath = os.path.normcase, os.path.normpath
     for plugin in plugins:
-        path_str = str(plugin.get('path', ''))
-        if path_str in paths:
-            print(f"  ⚠️  DUPLICATE: {plugin.get('name', 'Unknown')}")
-            print(f"      First:  {paths[path_str]}")
-            print(f"      Second: {path_str}")
+        path_str, name, plugin_format = plugin['path'], plugin['name'], plugin['format']
+        key = normcase(normpath(path_str))
+        if key in first_seen:
+            say(f"  ⚠️  DUPLICATE: {name}")
+            say(f"      First:  {first_seen[key]}")
+            say(f"      Second: {path_str}")
         else:
-            paths[path_str] = path_str
-            print(f"  - {plugin.get('name', 'Unknown')}")
-            print(f"    Path: {path_str}")
-            print(f"    Format: {plugin.get('format', 'Unknown')}")
+            first_seen[key] = path_str
+            say(f"  - {name}")
+            say(f"    Path: {path_str}")
+            say(f"    Format: {plugin_format}")
+    flush_output()
 
 except Exception as e:
-    print(f"  ✗ Error: {e}")
-    import traceback
-    traceback.print_exc()
+    say(f"  ✗ Error: {e}")
+    report_exception()
 
 # Test 2: Try loading a plugin
-print("\n[2] Testing Plugin Load:")
-try:
-    from ambiance.integrations.carla_host import CarlaVSTHost
+say("\n[2] Testing Plugin Load:")
+if args.no_carla:
+    say("  Skipped (--no-carla)")
+else:
+    try:
+        from ambiance.integrations.carla_host import CarlaVSTHost
 
-    # Find Aspen Trumpet
-    aspen_path = Path("C:/Ambiance2/included_plugins/Aspen-Trumpet-1_64/Aspen Trumpet 1.dll")
-    if not aspen_path.exists():
-        print(f"  ✗ Aspen Trumpet not found at {aspen_path}")
-    else:
-        print(f"  ✓ Found plugin at {aspen_path}")
-
-        host = CarlaVSTHost(base_dir=Path("C:/Ambiance2/ambiance"))
-        print(f"  ✓ Host created")
-
-        # Configure audio first
-        host.configure_audio(preferred_drivers=["DirectSound", "WASAPI", "Dummy"])
-        print(f"  ✓ Audio configured")
-
-        # Get status before load
-        status_before = host.status()
-        print(f"\n  Status BEFORE load:")
-        print(f"    Available: {status_before['available']}")
-        print(f"    Engine running: {status_before.get('engine', {}).get('running', False)}")
-        print(f"    Driver: {status_before.get('engine', {}).get('driver', 'N/A')}")
-
-        if not status_before['available']:
-            print(f"    ✗ Carla not available!")
-            print(f"    Warnings:")
-            for w in status_before.get('warnings', []):
-                print(f"      - {w}")
+        # Find Aspen Trumpet with one listing of its folder rather than a stat per probe
+        aspen_dir = Path("C:/Ambiance2/included_plugins/Aspen-Trumpet-1_64")
+        aspen_name = "Aspen Trumpet 1.dll"
+        try:
+            with os.scandir(aspen_dir) as it:
+                aspen_entries = {os.path.normcase(entry.name): entry for entry in it}
+        except OSError:
+            aspen_entries = {}
+        aspen_entry = aspen_entries.get(os.path.normcase(aspen_name))
+        aspen_path = Path(aspen_entry.path) if aspen_entry is not None else aspen_dir / aspen_name
+        if aspen_entry is None:
+            say(f"  ✗ Aspen Trumpet not found at {aspen_path}")
         else:
-            # Try to load
-            print(f"\n  Loading plugin...")
-            try:
-                result = host.load_plugin(aspen_path, show_ui=False)
-                print(f"  ✓ Plugin loaded!")
-
-                # Get status after load
-                status_after = host.status()
-                print(f"\n  Status AFTER load:")
-                print(f"    Plugin loaded: {status_after.get('plugin') is not None}")
-
-                if status_after.get('plugin'):
-                    plugin = status_after['plugin']
-                    print(f"    Plugin name: {plugin['metadata']['name']}")
-                    print(f"    Plugin vendor: {plugin['metadata']['vendor']}")
-
-                    caps = status_after.get('capabilities', {})
-                    print(f"\n  Capabilities:")
-                    print(f"    Instrument: {caps.get('instrument', False)}")
-                    print(f"    MIDI: {caps.get('midi', False)}")
-                    print(f"    MIDI Routed: {caps.get('midi_routed', False)}")
-                    print(f"    Editor: {caps.get('editor', False)}")
-
-                    # Check engine
-                    engine = status_after.get('engine', {})
-                    print(f"\n  Engine:")
-                    print(f"    Running: {engine.get('running', False)}")
-                    print(f"    Driver: {engine.get('driver', 'N/A')}")
-
-                    # Try to get UI descriptor
-                    print(f"\n  Getting UI descriptor...")
+            say(f"  ✓ Found plugin at {aspen_path}")
+
+            flush_output()
+            host = CarlaVSTHost(base_dir=Path("C:/Ambiance2/ambiance"))
+            say(f"  ✓ Host created")
+
+            # Configure audio first
+            flush_output()
+            host.configure_audio(preferred_drivers=["DirectSound", "WASAPI", "Dummy"])
+            say(f"  ✓ Audio configured")
+
+            # Get status before load
+            status_before = host.status_meta()
+            say(f"\n  Status BEFORE load:")
+            say(f"    Available: {status_before['available']}")
+            engine_before = status_before.get('engine') or {}
+            say(f"    Engine running: {engine_before.get('running', False)}")
+            say(f"    Driver: {engine_before.get('driver', 'N/A')}")
+
+            if not status_before['available']:
+                say(f"    ✗ Carla not available!")
+                say(f"    Warnings:")
+                for w in status_before.get('warnings', []):
+                    say(f"      - {w}")
+            else:
+                # Try to load
+                say(f"\n  Loading plugin...")
+                try:
+                    flush_output()
+                    # Load, post-load status and UI descriptor in one call; each is
+                    # reused for everything printed below
+                    status_after, descriptor, descriptor_error = host.load_and_describe(aspen_path, show_ui=False)
+                except Exception as e:
+                    say(f"  ✗ Load failed: {e}")
+                    report_exception()
+                else:
+                    say(f"  ✓ Plugin loaded!")
+
+                    # The plugin is loaded from here on; unload it whatever happens below
                     try:
-                        descriptor = host.describe_ui()
-                        print(f"  ✓ Descriptor obtained!")
-                        print(f"    Title: {descriptor.get('title', 'N/A')}")
-
-                        desc_caps = descriptor.get('capabilities', {})
-                        print(f"    Capabilities (from descriptor):")
-                        print(f"      Instrument: {desc_caps.get('instrument', False)}")
-                        print(f"      MIDI: {desc_caps.get('midi', False)}")
-                        print(f"      Editor: {desc_caps.get('editor', False)}")
-
-                        keyboard = descriptor.get('keyboard', {})
-                        print(f"    Keyboard range: {keyboard.get('min_note', '?')} - {keyboard.get('max_note', '?')}")
-
-                        # THE KEY QUESTION
-                        will_show = desc_caps.get('midi', False) or desc_caps.get('instrument', False)
-                        if will_show:
-                            print(f"\n  ✅ KEYBOARD SHOULD SHOW (midi={desc_caps.get('midi')}, instrument={desc_caps.get('instrument')})")
-                        else:
-                            print(f"\n  ❌ KEYBOARD WON'T SHOW (midi={desc_caps.get('midi')}, instrument={desc_caps.get('instrument')})")
-
-                    except Exception as e:
-                        print(f"  ✗ Descriptor failed: {e}")
-                        import traceback
-                        traceback.print_exc()
-
-                    # Try to send MIDI
-                    if caps.get('midi', False):
-                        print(f"\n  Testing MIDI...")
-                        try:
-                            import time
-                            host.note_on(60, velocity=0.8)
-                            print(f"  ✓ MIDI note-on sent (C4)")
-                            print(f"  💡 Listen to your speakers for 2 seconds...")
-                            time.sleep(2)
-                            host.note_off(60)
-                            print(f"  ✓ MIDI note-off sent")
-                            print(f"  (If you see a Carla assertion below, it's been fixed - just a timing issue)")
-                        except Exception as e:
-                            print(f"  ✗ MIDI failed: {e}")
-                            import traceback
-                            traceback.print_exc()
-
-                    # Cleanup
-                    host.unload()
-                    print(f"\n  ✓ Plugin unloaded")
-
-            except Exception as e:
-                print(f"  ✗ Load failed: {e}")
-                import traceback
-                traceback.print_exc()
+                        say(f"\n  Status AFTER load:")
+                        say(f"    Plugin loaded: {status_after.get('plugin') is not None}")
 
-except Exception as e:
-    print(f"  ✗ Error: {e}")
-    import traceback
-    traceback.print_exc()
+                        if status_after.get('plugin'):
+                            plugin = status_after['plugin']
+                            say(f"    Plugin name: {plugin['metadata']['name']}")
+                            say(f"    Plugin vendor: {plugin['metadata']['vendor']}")
+
+                            capmask = capability_mask(status_after.get('capabilities'))
+                            say(f"\n  Capabilities:")
+                            say(f"    Instrument: {bool(capmask & CAP_INSTRUMENT)}")
+                            say(f"    MIDI: {bool(capmask & CAP_MIDI)}")
+                            say(f"    MIDI Routed: {bool(capmask & CAP_MIDI_ROUTED)}")
+                            say(f"    Editor: {bool(capmask & CAP_EDITOR)}")
+
+                            # Check engine
+                            engine = status_after.get('engine') or {}
+                            say(f"\n  Engine:")
+                            say(f"    Running: {engine.get('running', False)}")
+                            say(f"    Driver: {engine.get('driver', 'N/A')}")
+
+                            # UI descriptor captured together with the load
+                            say(f"\n  UI descriptor:")
+                            if descriptor_error is not None:
+                                say(f"  ✗ Descriptor failed: {descriptor_error}")
+                                report_exception(descriptor_error)
+                            else:
+                                say(f"  ✓ Descriptor obtained!")
+                                say(f"    Title: {descriptor.get('title', 'N/A')}")
+
+                                desc_mask = capability_mask(descriptor.get('capabilities'))
+                                desc_midi = bool(desc_mask & CAP_MIDI)
+                                desc_instrument = bool(desc_mask & CAP_INSTRUMENT)
+                                say(f"    Capabilities (from descriptor):")
+                                say(f"      Instrument: {desc_instrument}")
+                                say(f"      MIDI: {desc_midi}")
+                                say(f"      Editor: {bool(desc_mask & CAP_EDITOR)}")
+
+                                keyboard = descriptor.get('keyboard', {})
+                                say(f"    Keyboard range: {keyboard.get('min_note', '?')} - {keyboard.get('max_note', '?')}")
+
+                                # THE KEY QUESTION
+                                if desc_mask & CAP_KEYBOARD:
+                                    say(f"\n  ✅ KEYBOARD SHOULD SHOW (midi={desc_midi}, instrument={desc_instrument})")
+                                else:
+                                    say(f"\n  ❌ KEYBOARD WON'T SHOW (midi={desc_midi}, instrument={desc_instrument})")
+
+                            # Try to send MIDI; without a running engine nothing can render, so don't wait
+                            if capmask & CAP_MIDI and not engine.get('running', False):
+                                say(f"\n  ⚠ Engine not running, skipping MIDI/audio test")
+                            elif capmask & CAP_MIDI:
+                                say(f"\n  Testing MIDI...")
+                                try:
+                                    host.note_on(60, velocity=0.8)
+                                    say(f"  ✓ MIDI note-on sent (C4)")
+                                    say(f"  💡 Listen to your speakers (waiting up to 2 seconds for output)...")
+                                    flush_output()
+                                    rendered_after = wait_for_audio(host, timeout=2.0)
+                                    if rendered_after is not None:
+                                        say(f"  ✓ Plugin output detected after {rendered_after * 1000:.0f} ms")
+                                        flush_output()
+                                        time.sleep(AUDIBLE_HOLD_SECONDS)
+                                    else:
+                                        say(f"  ✗ No plugin output within 2 seconds")
+                                    host.note_off(60)
+                                    say(f"  ✓ MIDI note-off sent")
+                                    say(f"  (If you see a Carla assertion below, it's been fixed - just a timing issue)")
+                                except Exception as e:
+                                    say(f"  ✗ MIDI failed: {e}")
+                                    report_exception()
+                    finally:
+                        flush_output()
+                        host.unload()
+                        say(f"\n  ✓ Plugin unloaded")
+
+    except Exception as e:
+        say(f"  ✗ Error: {e}")
+        report_exception()
+flush_output()
 
 print("\n" + "="*70)
 print("INSTRUCTIONS:")
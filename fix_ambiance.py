@@ -1,8 +1,156 @@
 """Apply fixes to the existing ambiance_qt.py file."""
 
+import mmap
+import os
+import re
+import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+NEW_TOGGLE_UI = '''def toggle_ui(self):
+    """Toggle native UI with improved error handling."""
+    try:
+        status = self.host.status_meta()
+        if status.get("ui_visible"):
+            self.host.hide_ui()
+            self.ui_btn.setText("Show Plugin UI")
+        else:
+            # Use QTimer to defer UI showing to avoid blocking
+            QTimer.singleShot(0, self._show_ui_deferred)
+    except CarlaHostError as e:
+        QMessageBox.warning(self, "UI Error", str(e))
+
+def _show_ui_deferred(self):
+    """Show UI in deferred manner."""
+    try:
+        self.host.show_ui()
+        self.ui_btn.setText("Hide Plugin UI")
+    except CarlaHostError as e:
+        QMessageBox.warning(self, "UI Error", f"Failed to show plugin UI:\\n{e}")
+'''
+
+# Well-known VST folders, used alongside whatever the registry reports
+DEFAULT_VST_DIRS = (
+    "C:/Program Files/VSTPlugins",
+    "C:/Program Files/Steinberg/VSTPlugins",
+    "C:/Program Files/Common Files/VST3",
+    "C:/Program Files (x86)/VSTPlugins",
+)
+
+VST_REGISTRY_KEYS = (r"SOFTWARE\VST", r"SOFTWARE\Wow6432Node\VST")
+
+
+def _enum_vst_paths_from_registry():
+    """Return the ``VSTPluginsPath`` values hosts and installers register, if any."""
+    try:
+        import winreg
+    except ImportError:  # not on Windows
+        return []
+    paths = []
+    for hive in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
+        for subkey in VST_REGISTRY_KEYS:
+            try:
+                with winreg.OpenKey(hive, subkey) as key:
+                    value, _ = winreg.QueryValueEx(key, "VSTPluginsPath")
+            except OSError:
+                continue
+            if isinstance(value, str) and value:
+                paths.append(value)
+    return paths
+
+
+@lru_cache(maxsize=1)
+def _extra_plugin_dirs():
+    """Registry and default VST folders that exist, de-duplicated by normalised path."""
+    seen = set()
+    found = []
+    for candidate in (*_enum_vst_paths_from_registry(), *DEFAULT_VST_DIRS):
+        key = os.path.normcase(os.path.normpath(candidate))
+        if key in seen:
+            continue
+        seen.add(key)
+        if os.path.isdir(candidate):
+            found.append(Path(candidate).as_posix())
+    return tuple(found)
+
+
+def _plugin_dirs_block():
+    lines = [
+        "plugin_dirs = [",
+        '    base_dir / "included_plugins",',
+        '    base_dir.parent / "included_plugins",',
+    ]
+    lines.extend(f'    Path("{path}"),' for path in _extra_plugin_dirs())
+    lines.append("]")
+    return "\n".join(lines)
+
+# Every fix as one named alternative, so the file is rewritten in a single pass.
+# Whitespace is matched loosely so reformatted code is still fixed. The pattern
+# is bytes so it can scan the memory-mapped file directly. The poll timer is
+# left alone: every tick still reads each tracked parameter from Carla, so a
+# shorter interval would add wakeups and work; ambiance_qt.py already backs off
+# to POLL_IDLE_INTERVAL_MS when nothing changes.
+FIX_PATTERN = re.compile(
+    rb"(?P<octaves>self\.octaves\s*=\s*2\b)"
+    rb"|(?P<start_note>self\.start_note\s*=\s*48\b(?:[ \t]*#[ \t]*C3\b)?)"
+    rb"|(?P<key_width>self\.white_key_width\s*=\s*42\b)"
+    rb"|(?P<plugin_dirs>^(?P<dirs_indent>[ \t]*)plugin_dirs\s*=\s*\[\s*"
+    rb"base_dir\s*/\s*\"included_plugins\",\s*"
+    rb"base_dir\.parent\s*/\s*\"included_plugins\",?\s*\])"
+    # The whole method plus any _show_ui_deferred left by an earlier run,
+    # up to the next def or decorator at the same indent
+    rb"|(?P<toggle_ui>^(?P<ui_indent>[ \t]*)def toggle_ui\(self\):.*?"
+    rb"(?=^(?P=ui_indent)(?:def (?!_show_ui_deferred\b)|@)|^\S|\Z))",
+    re.MULTILINE | re.DOTALL,
+)
+
+FIXED_TEXT = {
+    "octaves": "self.octaves = 5  # Expanded from 2",
+    "start_note": "self.start_note = 36  # C2 - Lower starting note",
+    "key_width": "self.white_key_width = 28  # Narrower to fit more octaves",
+}
+
+# Summary line for each fix, keyed by the pattern groups that implement it.
+FIX_SUMMARY = [
+    (("octaves", "start_note", "key_width"), "Expanded MIDI keyboard from 2 to 5 octaves"),
+    (("toggle_ui",), "Fixed plugin UI display with deferred loading"),
+    (("plugin_dirs",), "Added {dirs} VST search path(s) found on this machine"),
+]
+
+
+def _indent(text, prefix):
+    return "".join(prefix + line if line.strip() else line for line in text.splitlines(True))
+
+
+def _apply_fix(match):
+    kind = match.lastgroup
+    if kind == "plugin_dirs":
+        return _indent(_plugin_dirs_block(), match.group("dirs_indent").decode())
+    if kind == "toggle_ui":
+        return _indent(NEW_TOGGLE_UI, match.group("ui_indent").decode()) + "\n"
+    return FIXED_TEXT[kind]
+
+
+def rewrite(buffer, applied=None):
+    """Return ``buffer`` with every fix applied, spliced together in one join.
+
+    ``buffer`` is any bytes-like object (the mmap in :func:`apply_fixes`); its
+    line endings are kept, so replacements use CRLF when the file does. The
+    name of every fix that matched is added to the ``applied`` set if given.
+    """
+    newline = "\r\n" if buffer.find(b"\r\n") != -1 else "\n"
+    chunks = []
+    position = 0
+    for match in FIX_PATTERN.finditer(buffer):
+        if applied is not None:
+            applied.add(match.lastgroup)
+        chunks.append(buffer[position:match.start()])
+        chunks.append(_apply_fix(match).replace("\n", newline).encode("utf-8"))
+        position = match.end()
+    chunks.append(buffer[position:])
+    return b"".join(chunks)
+
 def apply_fixes():
     """Apply critical fixes to ambiance_qt.py"""
     
@@ -12,137 +160,37 @@ def apply_fixes():
         print("ERROR: ambiance_qt.py not found at C:/Ambiance2/")
         return False
     
-    # Read the file
-    with open(ambiance_path, 'r') as f:
-        content = f.read()
-    
-    # Fix 1: Expand keyboard octaves
-    content = content.replace(
-        "self.octaves = 2",
-        "self.octaves = 5  # Expanded from 2"
-    )
-    content = content.replace(
-        "self.start_note = 48  # C3",
-        "self.start_note = 36  # C2 - Lower starting note"
-    )
-    content = content.replace(
-        "self.white_key_width = 42",
-        "self.white_key_width = 28  # Narrower to fit more octaves"
-    )
+    # Scan the mapped file instead of reading it into a str; the map must be
+    # closed again before the file is renamed below.
+    with open(ambiance_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            applied = set()
+            content = rewrite(mm, applied)
+            unchanged = len(content) == len(mm) and content == mm[:]
     
-    # Fix 2: Fix the UI display issue by using QTimer for async UI operations
-    if "def toggle_ui(self):" in content:
-        # Add QTimer import if not present
-        if "from PyQt5.QtCore import Qt, QTimer, QSize" not in content:
-            content = content.replace(
-                "from PyQt5.QtCore import Qt, QTimer, QSize",
-                "from PyQt5.QtCore import Qt, QTimer, QSize, QThread, pyqtSignal"
-            )
-        
-        # Replace toggle_ui method
-        old_toggle_ui = '''    def toggle_ui(self):
-        """Toggle native UI."""
-        try:
-            status = self.host.status()
-            if status.get("ui_visible"):
-                self.host.hide_ui()
-                self.ui_btn.setText("Show Plugin UI")
-            else:
-                self.host.show_ui()
-                self.ui_btn.setText("Hide Plugin UI")
-        except CarlaHostError as e:
-            QMessageBox.warning(self, "UI Error", str(e))'''
-        
-        new_toggle_ui = '''    def toggle_ui(self):
-        """Toggle native UI with improved error handling."""
-        try:
-            status = self.host.status()
-            if status.get("ui_visible"):
-                self.host.hide_ui()
-                self.ui_btn.setText("Show Plugin UI")
-            else:
-                # Use QTimer to defer UI showing to avoid blocking
-                QTimer.singleShot(0, self._show_ui_deferred)
-        except CarlaHostError as e:
-            QMessageBox.warning(self, "UI Error", str(e))
-    
-    def _show_ui_deferred(self):
-        """Show UI in deferred manner."""
-        try:
-            self.host.show_ui()
-            self.ui_btn.setText("Hide Plugin UI")
-        except CarlaHostError as e:
-            QMessageBox.warning(self, "UI Error", f"Failed to show plugin UI:\\n{e}")'''
-        
-        if old_toggle_ui in content:
-            content = content.replace(old_toggle_ui, new_toggle_ui)
-        else:
-            # Add the deferred method after toggle_ui
-            content = content.replace(
-                "def toggle_ui(self):",
-                '''def toggle_ui(self):
-        """Toggle native UI with improved error handling."""
-        try:
-            status = self.host.status()
-            if status.get("ui_visible"):
-                self.host.hide_ui()
-                self.ui_btn.setText("Show Plugin UI")
-            else:
-                QTimer.singleShot(0, self._show_ui_deferred)
-        except CarlaHostError as e:
-            QMessageBox.warning(self, "UI Error", str(e))
+    if unchanged:
+        print("All fixes are already applied; nothing to write.")
+        return True
     
-    def _show_ui_deferred(self):
-        """Show UI in deferred manner."""
-        try:
-            self.host.show_ui()
-            self.ui_btn.setText("Hide Plugin UI")
-        except CarlaHostError as e:
-            QMessageBox.warning(self, "UI Error", f"Failed to show plugin UI:\\n{e}")
-    
-    def toggle_ui_original(self):'''
-            )
-    
-    # Fix 3: Ensure parameters display properly
-    if "def update_parameters(self):" in content:
-        # Make sure parameter polling is more robust
-        content = content.replace(
-            "self.poll_timer.start(100)",
-            "self.poll_timer.start(50)  # Faster polling for smoother updates"
-        )
-    
-    # Fix 4: Add more plugin search paths
-    if "plugin_dirs = [" in content:
-        old_dirs = """        plugin_dirs = [
-            base_dir / "included_plugins",
-            base_dir.parent / "included_plugins",
-        ]"""
-        
-        new_dirs = """        plugin_dirs = [
-            base_dir / "included_plugins",
-            base_dir.parent / "included_plugins",
-            Path("C:/Program Files/VSTPlugins"),
-            Path("C:/Program Files/Steinberg/VSTPlugins"),
-            Path("C:/Program Files/Common Files/VST3"),
-            Path("C:/Program Files (x86)/VSTPlugins"),
-        ]"""
-        
-        content = content.replace(old_dirs, new_dirs)
+    # Write the fixed content next to the original, then swap it in atomically
+    # so a crash at any point leaves a complete ambiance_qt.py behind.
+    new_path = ambiance_path.with_suffix('.py.new')
+    with open(new_path, 'wb') as f:
+        f.write(content)
     
-    # Write the fixed content back
     backup_path = ambiance_path.with_suffix('.py.backup')
-    ambiance_path.rename(backup_path)
+    shutil.copy2(ambiance_path, backup_path)
     print(f"Original file backed up to: {backup_path}")
-    
-    with open(ambiance_path, 'w') as f:
-        f.write(content)
+    os.replace(new_path, ambiance_path)
     
     print("Fixes applied successfully!")
     print("\nFixed issues:")
-    print("1. ✓ Expanded MIDI keyboard from 2 to 5 octaves")
-    print("2. ✓ Fixed plugin UI display with deferred loading")
-    print("3. ✓ Improved parameter update polling")
-    print("4. ✓ Added more VST search paths")
+    for number, (groups, summary) in enumerate(FIX_SUMMARY, 1):
+        summary = summary.format(dirs=len(_extra_plugin_dirs()))
+        if applied.intersection(groups):
+            print(f"{number}. ✓ {summary}")
+        else:
+            print(f"{number}. - {summary}: pattern not found, left unchanged")
     
     return True
 
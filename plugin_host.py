@@ -1,9 +1,13 @@
 """Standalone VST plugin host using Carla with audio output."""
 
 import argparse
+import queue
 import sys
+import threading
+import time
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from pathlib import Path
 from typing import Sequence
@@ -12,75 +16,210 @@ from PyQt5.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QWidget, QLabel, QSlider, QScrollArea,
     QMessageBox, QComboBox, QGroupBox
 )
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtMultimedia import QAudioOutput, QAudioFormat
-from PyQt5.QtCore import QByteArray, QIODevice
+from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
+from PyQt5.QtMultimedia import QAudioDeviceInfo, QAudioOutput, QAudioFormat
+from PyQt5.QtCore import QIODevice
 
 sys.path.insert(0, str(Path(__file__).parent / "ambiance" / "src"))
 
 from ambiance.integrations.carla_host import CarlaVSTHost, CarlaHostError
 
+# Starting folder for the plugin file dialog
+_HOME_DIR = str(Path.home())
 
-class AudioPlayer:
-    """Simple audio output handler using PyQt5 multimedia."""
+# Test-note choices (C3..B4) mapped to MIDI note numbers; C3 is MIDI 48
+_NOTE_NAMES = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+_NOTE_TO_MIDI = {
+    f"{name}{octave}": (octave + 1) * 12 + index
+    for octave in (3, 4)
+    for index, name in enumerate(_NOTE_NAMES)
+}
+
+
+def _make_playback_format(sample_size: int, sample_type) -> QAudioFormat:
+    fmt = QAudioFormat()
+    fmt.setSampleRate(44100)
+    fmt.setChannelCount(2)  # Stereo
+    fmt.setSampleSize(sample_size)
+    fmt.setCodec("audio/pcm")
+    fmt.setByteOrder(QAudioFormat.LittleEndian)
+    fmt.setSampleType(sample_type)
+    return fmt
+
+
+# Output formats shared by every AudioPlayer: stereo PCM at 44.1 kHz, float32
+# when the output device takes it (no conversion), 16-bit integer otherwise
+_FLOAT_PLAYBACK_FORMAT = _make_playback_format(32, QAudioFormat.Float)
+_PLAYBACK_FORMAT = _make_playback_format(16, QAudioFormat.SignedInt)
+
+
+class PCMDevice(QIODevice):
+    """Read-only device that streams straight out of a NumPy buffer.
+    
+    QAudioOutput pulls small chunks through ``readData``, so the full PCM buffer
+    is never copied into a ``bytes``/``QByteArray`` pair.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._view = memoryview(b"")
+        self._pos = 0
+    
+    def set_samples(self, samples: np.ndarray):
+        """Rewind onto ``samples``; the array must stay untouched while playing."""
+        self._view = memoryview(samples).cast("B")
+        self._pos = 0
+    
+    def isSequential(self):
+        return True
+    
+    def bytesAvailable(self):
+        return len(self._view) - self._pos + super().bytesAvailable()
+    
+    def readData(self, maxlen):
+        chunk = self._view[self._pos:self._pos + maxlen]
+        self._pos += len(chunk)
+        return chunk.tobytes()
     
-    def __init__(self):
+    def writeData(self, data):
+        return -1
+
+
+class PCMConverter(QObject):
+    """Converts float PCM to the interleaved output format on the audio worker thread.
+    
+    With ``float_output`` the samples only need clipping into a contiguous
+    float32 buffer; otherwise they are narrowed to int16.
+    """
+    
+    converted = pyqtSignal(int, object)  # request generation, output samples
+    
+    def __init__(self, scratch_samples: int, float_output: bool = False):
+        super().__init__()
+        self._float_output = float_output
+        self._f32_scratch = np.empty(scratch_samples, dtype=np.float32)
+        self._i16_scratch = np.empty(scratch_samples, dtype=np.int16)
+    
+    def _scratch_buffers(self, shape: tuple[int, ...]) -> tuple[np.ndarray, np.ndarray]:
+        """Return float32/int16 scratch views of ``shape``, growing them if needed."""
+        count = int(np.prod(shape))
+        if count > self._f32_scratch.size:
+            self._f32_scratch = np.empty(count, dtype=np.float32)
+            self._i16_scratch = np.empty(count, dtype=np.int16)
+        return (
+            self._f32_scratch[:count].reshape(shape),
+            self._i16_scratch[:count].reshape(shape),
+        )
+    
+    @pyqtSlot(int, object)
+    def convert(self, generation: int, samples: np.ndarray):
+        # Ensure stereo; a broadcast view duplicates the channel without copying
+        samples = np.asarray(samples)
+        if samples.ndim == 1:
+            samples = np.broadcast_to(samples[:, np.newaxis], (samples.shape[0], 2))
+        
+        if self._float_output:
+            scaled, _ = self._scratch_buffers(samples.shape)
+            np.clip(samples, -1.0, 1.0, out=scaled)
+            self.converted.emit(generation, scaled)
+            return
+        
+        # Convert float32 to int16 through the reusable scratch buffers, rounding
+        # to nearest and saturating instead of wrapping for samples outside [-1, 1]
+        scaled, samples_int = self._scratch_buffers(samples.shape)
+        np.multiply(samples, 32767.0, out=scaled)
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, -32768, 32767, out=scaled)
+        samples_int[...] = scaled
+        self.converted.emit(generation, samples_int)
+
+
+class AudioPlayer(QObject):
+    """Simple audio output handler using PyQt5 multimedia.
+    
+    Sample conversion runs on a worker thread; the GUI thread only starts and
+    stops the output once converted samples come back.
+    """
+    
+    _convert_requested = pyqtSignal(int, object)
+    
+    def __init__(self, max_seconds: float = 4.0):
+        super().__init__()
         self.audio_output = None
         self.io_device = None
-        self.sample_rate = 44100
+        self.sample_rate = _PLAYBACK_FORMAT.sampleRate()
+        self.float_output = False
+        # Bumped on every play/stop so conversions that finish late are dropped
+        self._generation = 0
         self.setup_audio()
+        # Stereo conversion scratch sized for ``max_seconds``, reused across
+        # play_buffer calls and only grown for longer buffers
+        self._converter = PCMConverter(
+            int(self.sample_rate * max_seconds) * 2, float_output=self.float_output
+        )
+        self._thread = QThread()
+        self._converter.moveToThread(self._thread)
+        self._convert_requested.connect(self._converter.convert)
+        self._converter.converted.connect(self._on_converted)
+        self._thread.start()
     
     def setup_audio(self):
-        """Initialize audio output."""
-        fmt = QAudioFormat()
-        fmt.setSampleRate(self.sample_rate)
-        fmt.setChannelCount(2)  # Stereo
-        fmt.setSampleSize(16)
-        fmt.setCodec("audio/pcm")
-        fmt.setByteOrder(QAudioFormat.LittleEndian)
-        fmt.setSampleType(QAudioFormat.SignedInt)
-        
-        self.audio_output = QAudioOutput(fmt)
+        """Initialize audio output, preferring float32 samples when the device supports them."""
+        device = QAudioDeviceInfo.defaultOutputDevice()
+        self.float_output = device.isFormatSupported(_FLOAT_PLAYBACK_FORMAT)
+        fmt = _FLOAT_PLAYBACK_FORMAT if self.float_output else _PLAYBACK_FORMAT
+        self.audio_output = QAudioOutput(device, fmt)
         self.audio_output.setVolume(0.7)
     
     def play_buffer(self, samples: np.ndarray):
-        """Play a numpy buffer (float32, -1 to 1 range)."""
+        """Play a numpy buffer (float32, -1 to 1 range).
+        
+        Returns immediately; ``samples`` must not be modified until playback starts.
+        """
         if self.audio_output is None:
             return
         
-        # Stop any existing playback
-        if self.io_device:
-            self.audio_output.stop()
-        
-        # Convert float32 to int16
-        samples_int = (samples * 32767).astype(np.int16)
-        
-        # Ensure stereo
-        if len(samples_int.shape) == 1:
-            samples_int = np.column_stack([samples_int, samples_int])
-        
-        # Convert to bytes
-        byte_array = QByteArray(samples_int.tobytes())
+        # Stop any existing playback before the worker reuses its scratch
+        self.stop()
+        self._convert_requested.emit(self._generation, samples)
+    
+    @pyqtSlot(int, object)
+    def _on_converted(self, generation: int, samples: np.ndarray):
+        if generation != self._generation:
+            return
         
-        # Create a buffer
-        from PyQt5.QtCore import QBuffer
-        buffer = QBuffer()
-        buffer.setData(byte_array)
-        buffer.open(QIODevice.ReadOnly)
+        # Point the persistent device at the converted samples (no bytes copy)
+        if self.io_device is None:
+            self.io_device = PCMDevice()
+            self.io_device.open(QIODevice.ReadOnly)
+        self.io_device.set_samples(samples)
         
         # Play
-        self.audio_output.start(buffer)
-        
-        # Keep reference to prevent garbage collection
-        self.io_device = buffer
+        self.audio_output.start(self.io_device)
     
     def stop(self):
         """Stop playback."""
+        self._generation += 1
         if self.audio_output:
             self.audio_output.stop()
+    
+    def close(self):
+        """Stop playback and shut down the conversion thread."""
+        self.stop()
+        self._thread.quit()
+        self._thread.wait()
 
 
 class PluginHostWindow(QMainWindow):
+    # Emitted from Carla's engine thread; Qt queues delivery onto the GUI thread
+    parameterChanged = pyqtSignal(int, float)
+
+    TEST_NOTE_MS = 500  # How long the test-note button holds its note
+    TEST_NOTE_VELOCITY = 100 / 127  # MIDI velocity 100 on the host's 0..1 scale
+    POLL_FALLBACK_MS = 500  # Safety-net poll; also catches changes the listener misses
+    SYNC_BATCH_WINDOW = 0.05  # Seconds to gather parameter changes into one POST
+    SYNC_BATCH_MAX = 64
+
     def __init__(
         self,
         *,
@@ -115,10 +254,20 @@ class PluginHostWindow(QMainWindow):
         self.updating_from_plugin = False  # Prevent feedback loops
         self.updating_from_server = False  # Prevent sync loops
 
+        # Parameter changes are sent to the server from a background thread
+        self._sync_queue = queue.Queue()
+        self._sync_thread = threading.Thread(target=self._sync_worker, daemon=True)
+        self._sync_thread.start()
+
         # Timer for parameter polling
         self.poll_timer = QTimer()
         self.poll_timer.timeout.connect(self.poll_parameters)
 
+        # Parameter changes made in the plugin's own UI, pushed by Carla
+        self.parameterChanged.connect(self._apply_param_change)
+        self._param_listener = self.parameterChanged.emit
+        self._param_callbacks = self.host.add_parameter_listener(self._param_listener)
+
         self.init_ui()
 
         if self._auto_plugin:
@@ -168,9 +317,7 @@ class PluginHostWindow(QMainWindow):
         test_row = QHBoxLayout()
         
         self.note_combo = QComboBox()
-        notes = ['C3', 'C#3', 'D3', 'D#3', 'E3', 'F3', 'F#3', 'G3', 'G#3', 'A3', 'A#3', 'B3',
-                 'C4', 'C#4', 'D4', 'D#4', 'E4', 'F4', 'F#4', 'G4', 'G#4', 'A4', 'A#4', 'B4']
-        self.note_combo.addItems(notes)
+        self.note_combo.addItems(list(_NOTE_TO_MIDI))
         self.note_combo.setCurrentText('C4')
         test_row.addWidget(QLabel("Note:"))
         test_row.addWidget(self.note_combo)
@@ -208,7 +355,7 @@ class PluginHostWindow(QMainWindow):
         plugin_path, _ = file_dialog.getOpenFileName(
             self,
             "Select VST Plugin",
-            str(Path.home()),
+            _HOME_DIR,
             "VST Plugins (*.vst3 *.dll);;All Files (*.*)"
         )
         
@@ -240,8 +387,12 @@ class PluginHostWindow(QMainWindow):
             self.play_note_btn.setEnabled(is_instrument)
             self.render_btn.setEnabled(True)
 
-            print(f"⏲️  Starting parameter polling timer (100ms interval)")
-            self.poll_timer.start(100)
+            # Keep polling even with a listener: not every plugin reports its UI edits
+            # through Carla's callback, and the poll only returns values that moved.
+            if self._param_callbacks:
+                print("🔔 Listening for parameter changes from Carla")
+            print(f"⏲️  Starting parameter polling timer ({self.POLL_FALLBACK_MS}ms interval)")
+            self.poll_timer.start(self.POLL_FALLBACK_MS)
 
             if status.get("capabilities", {}).get("editor"):
                 try:
@@ -283,32 +434,21 @@ class PluginHostWindow(QMainWindow):
     def play_test_note(self):
         """Play a test note through the plugin."""
         note_name = self.note_combo.currentText()
-        note_map = {
-            'C': 0, 'C#': 1, 'D': 2, 'D#': 3, 'E': 4, 'F': 5,
-            'F#': 6, 'G': 7, 'G#': 8, 'A': 9, 'A#': 10, 'B': 11
-        }
-        
-        # Parse note and octave
-        if '#' in note_name:
-            note = note_name[:2]
-            octave = int(note_name[2:])
-        else:
-            note = note_name[0]
-            octave = int(note_name[1:])
-        
-        midi_note = (octave + 1) * 12 + note_map[note]
+        midi_note = _NOTE_TO_MIDI[note_name]
         
         try:
-            # This requires the Carla backend to support MIDI
-            # For now, we'll just show a message
-            QMessageBox.information(
-                self, 
-                "MIDI Note", 
-                f"MIDI note {midi_note} ({note_name}) would be played here.\n\n"
-                "Full MIDI implementation requires additional Carla integration."
-            )
+            self.host.note_on(midi_note, velocity=self.TEST_NOTE_VELOCITY)
         except Exception as e:
             QMessageBox.warning(self, "Playback Error", str(e))
+            return
+        print(f"🎹 Playing MIDI note {midi_note} ({note_name})")
+        QTimer.singleShot(self.TEST_NOTE_MS, lambda: self._release_test_note(midi_note))
+    
+    def _release_test_note(self, midi_note: int):
+        try:
+            self.host.note_off(midi_note)
+        except CarlaHostError as e:
+            print(f"❌ Note off failed: {e}")
     
     def render_audio(self):
         """Render audio from the plugin and play it."""
@@ -330,19 +470,88 @@ class PluginHostWindow(QMainWindow):
             QMessageBox.warning(self, "Render Error", str(e))
     
     def send_parameter_to_server(self, param_id: int, value: float):
-        """Send parameter change to the server."""
-        try:
-            url = f"{self.server_url}/api/vst/parameter"
-            payload = {"id": param_id, "value": value}
-            print(f"📤 Sending parameter {param_id}={value:.3f} to {url}")
-            response = requests.post(url, json=payload, timeout=0.5)
-            if response.status_code != 200:
-                print(f"❌ Server parameter update failed: {response.status_code}")
-            else:
-                print(f"✅ Parameter {param_id} synced successfully")
-        except Exception as e:
-            # Don't block UI on server communication errors
-            print(f"❌ Failed to send parameter to server: {e}")
+        """Queue a parameter change for the background sync thread."""
+        self._sync_queue.put((param_id, value))
+
+    def _sync_worker(self):
+        """Push queued parameter changes to the server in deduplicated batches.
+        
+        Runs on its own thread with one keep-alive session, so the GUI never
+        waits on the network. ``None`` on the queue stops the worker.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        url = f"{self.server_url}/api/vst/parameters"
+        running = True
+        while running:
+            item = self._sync_queue.get()
+            if item is None:
+                break
+            pending = dict([item])  # Latest value per parameter ID
+            deadline = time.monotonic() + self.SYNC_BATCH_WINDOW
+            while len(pending) < self.SYNC_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._sync_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                pending[item[0]] = item[1]
+
+            payload = {"updates": [{"id": pid, "value": val} for pid, val in pending.items()]}
+            try:
+                print(f"📤 Sending {len(pending)} parameter update(s) to {url}")
+                response = session.post(url, json=payload, timeout=0.5)
+                if response.status_code != 200:
+                    print(f"❌ Server parameter update failed: {response.status_code}")
+                else:
+                    print(f"✅ {len(pending)} parameter(s) synced successfully")
+            except Exception as e:
+                print(f"❌ Failed to send parameters to server: {e}")
+        session.close()
+
+    @staticmethod
+    def _set_value_label(info: dict, value: float):
+        """Show ``value`` on a parameter label, skipping it if the 3-decimal text is unchanged."""
+        rounded = round(value * 1000)
+        if rounded == info["last_rounded"]:
+            return
+        info["last_rounded"] = rounded
+        info["label"].setText(f"{info['name']}: {value:.3f} {info['units']}")
+
+    def _apply_param_change(self, param_id: int, value: float) -> bool:
+        """Move a parameter's slider to ``value`` and forward it to the server.
+
+        Returns ``True`` if the slider actually moved.
+        """
+        slider_info = self.param_sliders.get(param_id)
+        if slider_info is None:
+            return False
+        slider = slider_info["slider"]
+        min_val = slider_info["min"]
+        max_val = slider_info["max"]
+
+        # Update slider position
+        normalized = (value - min_val) / (max_val - min_val) if max_val != min_val else 0
+        slider_pos = int(normalized * 1000)
+
+        # Only update if significantly different to avoid jitter
+        if abs(slider.value() - slider_pos) <= 1:
+            return False
+        slider.blockSignals(True)
+        slider.setValue(slider_pos)
+        slider.blockSignals(False)
+        self._set_value_label(slider_info, value)
+
+        # Send updated value to server
+        self.send_parameter_to_server(param_id, value)
+        return True
 
     def poll_parameters(self):
         """Poll parameter values from the plugin to sync with native UI changes."""
@@ -350,39 +559,15 @@ class PluginHostWindow(QMainWindow):
             return
 
         try:
-            status = self.host.status()
-            params = status.get("parameters", [])
+            # Only parameters that moved since the last poll, and only those with sliders
+            params = self.host.get_changed_parameters(self.param_sliders.keys())
 
             self.updating_from_plugin = True
             changes_detected = 0
 
             for param in params:
-                param_id = param["id"]
-                value = param["value"]
-
-                if param_id in self.param_sliders:
-                    slider_info = self.param_sliders[param_id]
-                    slider = slider_info["slider"]
-                    label = slider_info["label"]
-                    min_val = slider_info["min"]
-                    max_val = slider_info["max"]
-                    name = slider_info["name"]
-                    units = slider_info["units"]
-
-                    # Update slider position
-                    normalized = (value - min_val) / (max_val - min_val) if max_val != min_val else 0
-                    slider_pos = int(normalized * 1000)
-
-                    # Only update if significantly different to avoid jitter
-                    if abs(slider.value() - slider_pos) > 1:
-                        changes_detected += 1
-                        slider.blockSignals(True)
-                        slider.setValue(slider_pos)
-                        slider.blockSignals(False)
-                        label.setText(f"{name}: {value:.3f} {units}")
-
-                        # Send updated value to server
-                        self.send_parameter_to_server(param_id, value)
+                if self._apply_param_change(param["id"], param["value"]):
+                    changes_detected += 1
 
             if changes_detected > 0:
                 print(f"🔄 Polling detected {changes_detected} parameter changes")
@@ -427,77 +612,100 @@ class PluginHostWindow(QMainWindow):
                 item.widget().deleteLater()
         self.param_sliders.clear()
     
+    def _create_param_row(self, param_id: int) -> dict:
+        """Build the label + slider widget for one parameter."""
+        param_widget = QWidget()
+        param_layout = QVBoxLayout(param_widget)
+        param_layout.setContentsMargins(0, 5, 0, 5)
+        
+        value_label = QLabel()
+        param_layout.addWidget(value_label)
+        
+        # Scale to int for slider (use 1000 steps)
+        slider = QSlider(Qt.Horizontal)
+        slider.setMinimum(0)
+        slider.setMaximum(1000)
+        
+        # Connect slider; the shared slot finds its parameter via this property
+        slider.setProperty("param_id", param_id)
+        slider.valueChanged.connect(self._on_slider_changed)
+        param_layout.addWidget(slider)
+        
+        return {"widget": param_widget, "slider": slider, "label": value_label}
+    
     def update_parameters(self):
-        self.clear_parameters()
-        
+        """Show the hosted plugin's parameters, reusing rows for IDs already shown."""
         status = self.host.status()
         params = status.get("parameters", [])
         
-        if not params:
-            label = QLabel("No parameters available")
-            self.param_layout.addWidget(label)
-            return
+        # Empty the layout without destroying rows; reused ones are added back in order
+        previous = self.param_sliders
+        self.param_sliders = {}
+        row_widgets = {info["widget"] for info in previous.values()}
+        while self.param_layout.count():
+            widget = self.param_layout.takeAt(0).widget()
+            if widget is not None and widget not in row_widgets:
+                widget.deleteLater()
         
         for param in params:
-            param_widget = QWidget()
-            param_layout = QVBoxLayout(param_widget)
-            param_layout.setContentsMargins(0, 5, 0, 5)
-            
-            # Label with name and value
-            name = param["display_name"] or param["name"]
-            units = param["units"]
-            value_label = QLabel(f"{name}: {param['value']:.3f} {units}")
-            param_layout.addWidget(value_label)
-            
-            # Slider
-            slider = QSlider(Qt.Horizontal)
+            param_id = param["id"]
+            info = previous.pop(param_id, None) or self._create_param_row(param_id)
             min_val = param["min"]
             max_val = param["max"]
+            info.update(
+                min=min_val,
+                max=max_val,
+                name=param["display_name"] or param["name"],
+                units=param["units"],
+                last_rounded=None,  # Value shown on the label, in thousandths
+            )
+            self._set_value_label(info, param["value"])
             
-            # Scale to int for slider (use 1000 steps)
-            slider.setMinimum(0)
-            slider.setMaximum(1000)
             normalized = (param["value"] - min_val) / (max_val - min_val) if max_val != min_val else 0
-            slider.setValue(int(normalized * 1000))
+            info["slider"].blockSignals(True)
+            info["slider"].setValue(int(normalized * 1000))
+            info["slider"].blockSignals(False)
             
             # Store slider info for polling
-            param_id = param["id"]
-            self.param_sliders[param_id] = {
-                "slider": slider,
-                "label": value_label,
-                "min": min_val,
-                "max": max_val,
-                "name": name,
-                "units": units
-            }
-            
-            # Connect slider
-            def make_handler(param_id, min_v, max_v, label, name, units):
-                def handler(slider_val):
-                    if self.updating_from_plugin or self.updating_from_server:
-                        return
-                    normalized = slider_val / 1000.0
-                    actual = min_v + normalized * (max_v - min_v)
-                    try:
-                        self.host.set_parameter(param_id, actual)
-                        label.setText(f"{name}: {actual:.3f} {units}")
-
-                        # Send parameter change to server
-                        self.send_parameter_to_server(param_id, actual)
-                    except CarlaHostError as e:
-                        print(f"Parameter update failed: {e}")
-                return handler
-            
-            slider.valueChanged.connect(make_handler(param_id, min_val, max_val, value_label, name, units))
-            param_layout.addWidget(slider)
-            
-            self.param_layout.addWidget(param_widget)
+            self.param_sliders[param_id] = info
+            self.param_layout.addWidget(info["widget"])
+        
+        # Rows for parameters the new plugin does not have
+        for info in previous.values():
+            info["widget"].deleteLater()
+        
+        if not params:
+            label = QLabel("No parameters available")
+            self.param_layout.addWidget(label)
+            return
         
         self.param_layout.addStretch()
     
+    @pyqtSlot(int)
+    def _on_slider_changed(self, slider_val):
+        """Forward a slider move to the host; one slot shared by every slider."""
+        if self.updating_from_plugin or self.updating_from_server:
+            return
+        param_id = self.sender().property("param_id")
+        info = self.param_sliders.get(param_id)
+        if info is None:
+            return
+        normalized = slider_val / 1000.0
+        actual = info["min"] + normalized * (info["max"] - info["min"])
+        try:
+            self.host.set_parameter(param_id, actual)
+            self._set_value_label(info, actual)
+
+            # Send parameter change to server
+            self.send_parameter_to_server(param_id, actual)
+        except CarlaHostError as e:
+            print(f"Parameter update failed: {e}")
+    
     def closeEvent(self, event):
         self.poll_timer.stop()
-        self.audio_player.stop()
+        self.host.remove_parameter_listener(self._param_listener)
+        self._sync_queue.put(None)
+        self.audio_player.close()
         self.host.shutdown()
         event.accept()
 
@@ -1,11 +1,28 @@
 """Test Carla discovery to diagnose path issues."""
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add to path
 sys.path.insert(0, str(Path(__file__).parent / "ambiance" / "src"))
 
+
+@lru_cache(maxsize=None)
+def _dir_names(directory: Path) -> frozenset[str]:
+    """Read ``directory`` once; the checks below look several names up in the same folders."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(os.path.normcase(entry.name) for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _exists(path: Path) -> bool:
+    return os.path.normcase(path.name) in _dir_names(path.parent)
+
+
 print("="*70)
 print("Carla Discovery Test")
 print("="*70)
@@ -52,14 +69,14 @@ search_paths = [
 ]
 
 for path in search_paths:
-    exists = path.exists()
+    exists = _exists(path)
     marker = "✓" if exists else "✗"
     print(f"  {marker} {path}")
 
 # Test 5: Check for source/frontend/carla_backend.py
 if backend.root:
     backend_py = backend.root / "source" / "frontend" / "carla_backend.py"
-    exists = backend_py.exists()
+    exists = _exists(backend_py)
     marker = "✓" if exists else "✗"
     print(f"\n[6] Carla Backend Script:")
     print(f"  {marker} {backend_py}")
@@ -73,7 +90,7 @@ if backend.root:
         backend.root / "libcarla_standalone2.dll",
     ]
     for path in dll_paths:
-        exists = path.exists()
+        exists = _exists(path)
         marker = "✓" if exists else "✗"
         print(f"  {marker} {path}")
 
@@ -1,31 +1,94 @@
 """Test script to verify keyboard display and audio fixes."""
 
+import argparse
+import atexit
+import contextlib
+import io
+import multiprocessing
 import sys
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-# Force UTF-8 encoding for Windows console
+# Force UTF-8 encoding for Windows console by reconfiguring the existing streams
+# (no extra encoder layer); stdout is block-buffered so prints are encoded in
+# batches, and the script flushes before slow Carla calls
 if sys.platform.startswith('win'):
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+    sys.stdout.reconfigure(encoding='utf-8', errors='strict', line_buffering=False)
+    sys.stderr.reconfigure(encoding='utf-8', errors='strict')
 
 # Add ambiance to path
 sys.path.insert(0, str(Path(__file__).parent / "ambiance" / "src"))
 
 from ambiance.integrations.carla_host import CarlaVSTHost
 
+PLUGIN_EXTENSIONS = (".vst3", ".dll")
+# Runtime DLLs shipped next to plugins that are not plugins themselves
+_DEPENDENCY_DLL = re.compile(r"msvc|ucrt|vcrun|api-ms")
+
+
+def find_plugins(root: Path) -> list[Path]:
+    """Return the .vst3 then .dll plugins under ``root`` from a single directory walk."""
+    found = {ext: [] for ext in PLUGIN_EXTENSIONS}
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = list(os.scandir(stack.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            name = entry.name.lower()
+            if name.endswith(PLUGIN_EXTENSIONS) and not _DEPENDENCY_DLL.search(name):
+                found[name[name.rfind("."):]].append(Path(entry.path))
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+    return found[".vst3"] + found[".dll"]
+
+
+# Descriptor section of the per-plugin report, written in one go
+_DESCRIPTOR_REPORT = (
+    "\n📊 Plugin Information:\n"
+    "  Title: %s\n"
+    "  Subtitle: %s\n"
+    "\n🎹 Capabilities:\n"
+    "  Instrument: %s\n"
+    "  MIDI: %s\n"
+    "  Editor: %s\n"
+    "\n⌨️  Keyboard Range:\n"
+    "  Min Note: %s\n"
+    "  Max Note: %s\n"
+)
+
+
+def make_host(driver: str | None = None) -> CarlaVSTHost:
+    """Create the Carla host shared by every plugin test in this process.
+
+    ``driver`` forces one audio driver; by default the first working real
+    driver is used, falling back to Dummy.
+    """
+    host = CarlaVSTHost()
+    print(f"\n⚙️  Configuring audio drivers...")
+    if driver:
+        host.configure_audio(forced_driver=driver)
+    else:
+        host.configure_audio(preferred_drivers=["DirectSound", "WASAPI", "Dummy"])
+    return host
+
 
-def test_plugin_capabilities(plugin_path: Path):
-    """Test if a plugin properly reports MIDI/instrument capabilities."""
+def test_plugin_capabilities(host: CarlaVSTHost, plugin_path: Path, *, full: bool = False):
+    """Test if a plugin properly reports MIDI/instrument capabilities.
+
+    ``host`` is reused across plugins; the plugin is unloaded again before returning.
+    Plugins without MIDI/instrument support are not loaded unless ``full`` is set.
+    """
     print(f"\n{'='*70}")
     print(f"Testing: {plugin_path.name}")
     print(f"{'='*70}")
 
-    host = CarlaVSTHost()
-
-    # Check if Carla is available
-    status = host.status()
+    # Check if Carla is available (no plugin yet, so skip the parameter list)
+    status = host.status_meta()
     print(f"\n✓ Carla available: {status['available']}")
     print(f"✓ Qt available: {status.get('qt_available', False)}")
 
@@ -36,33 +99,28 @@ def test_plugin_capabilities(plugin_path: Path):
             print(f"  - {warning}")
         return False
 
-    # Configure audio
-    print(f"\n⚙️  Configuring audio drivers...")
-    host.configure_audio(preferred_drivers=["DirectSound", "WASAPI", "Dummy"])
-
     # Try to get UI descriptor
     print(f"\n🔍 Fetching UI descriptor...")
+    sys.stdout.flush()
     try:
         descriptor = host.describe_ui(plugin_path)
         print(f"✓ Descriptor fetched successfully!")
 
-        print(f"\n📊 Plugin Information:")
-        print(f"  Title: {descriptor.get('title', 'N/A')}")
-        print(f"  Subtitle: {descriptor.get('subtitle', 'N/A')}")
-
         caps = descriptor.get('capabilities', {})
-        print(f"\n🎹 Capabilities:")
-        print(f"  Instrument: {caps.get('instrument', False)}")
-        print(f"  MIDI: {caps.get('midi', False)}")
-        print(f"  Editor: {caps.get('editor', False)}")
-
+        has_midi = caps.get('midi', False)
         keyboard = descriptor.get('keyboard', {})
-        print(f"\n⌨️  Keyboard Range:")
-        print(f"  Min Note: {keyboard.get('min_note', 'N/A')}")
-        print(f"  Max Note: {keyboard.get('max_note', 'N/A')}")
+        sys.stdout.write(_DESCRIPTOR_REPORT % (
+            descriptor.get('title', 'N/A'),
+            descriptor.get('subtitle', 'N/A'),
+            caps.get('instrument', False),
+            has_midi,
+            caps.get('editor', False),
+            keyboard.get('min_note', 'N/A'),
+            keyboard.get('max_note', 'N/A'),
+        ))
 
         # Key question: Will the keyboard show?
-        will_show = caps.get('midi', False) or caps.get('instrument', False)
+        will_show = has_midi or caps.get('instrument', False)
         if will_show:
             print(f"\n✅ KEYBOARD SHOULD DISPLAY IN UI!")
         else:
@@ -72,8 +130,14 @@ def test_plugin_capabilities(plugin_path: Path):
         print(f"❌ Failed to get descriptor: {e}")
         return False
 
+    # Loading only exercises MIDI, which this plugin does not take
+    if not will_show and not full:
+        print(f"\n(skipping runtime MIDI test; use --full to load it anyway)")
+        return True
+
     # Now test actual loading and MIDI
     print(f"\n🎵 Loading plugin for audio test...")
+    sys.stdout.flush()
     try:
         result = host.load_plugin(plugin_path, show_ui=False)
         print(f"✓ Plugin loaded!")
@@ -81,27 +145,33 @@ def test_plugin_capabilities(plugin_path: Path):
         # Get status after load
         status = host.status()
         engine = status.get('engine', {})
+        # Without a real audio driver nothing can be heard, so don't hold the note
+        real_driver = engine.get('driver') not in (None, '', 'Dummy')
         print(f"\n🔊 Audio Engine:")
         print(f"  Running: {engine.get('running', False)}")
         print(f"  Driver: {engine.get('driver', 'N/A')}")
 
         caps = status.get('capabilities', {})
+        has_midi = caps.get('midi', False)
         print(f"\n🎛️  Runtime Capabilities:")
-        print(f"  MIDI: {caps.get('midi', False)}")
+        print(f"  MIDI: {has_midi}")
         print(f"  MIDI Routed: {caps.get('midi_routed', False)}")
         print(f"  Instrument: {caps.get('instrument', False)}")
 
         params = status.get('parameters', [])
         print(f"\n🎚️  Parameters: {len(params)} available")
 
-        if caps.get('midi', False):
+        if has_midi:
             print(f"\n🎹 Testing MIDI note...")
             try:
                 host.note_on(60, velocity=0.8)  # Middle C
                 print(f"✓ MIDI note-on sent (note 60)")
 
-                import time
-                time.sleep(0.5)
+                if real_driver:
+                    import time
+                    time.sleep(0.5)
+                else:
+                    print(f"  [skipped audible delay: dummy driver]")
 
                 host.note_off(60)
                 print(f"✓ MIDI note-off sent")
@@ -120,15 +190,54 @@ def test_plugin_capabilities(plugin_path: Path):
 
     except Exception as e:
         print(f"❌ Failed to load plugin: {e}")
+        # Leave the shared host empty for the next plugin
+        try:
+            host.unload()
+        except Exception:
+            pass
         return False
 
-    finally:
-        host.shutdown()
-
     return True
 
 
+# Carla host of the current worker process, created by _init_worker_host
+_worker_host: CarlaVSTHost | None = None
+
+
+def _init_worker_host(driver: str | None) -> None:
+    """Pool initializer: create this worker's host and shut it down when the worker exits."""
+    global _worker_host
+    with contextlib.redirect_stdout(io.StringIO()):
+        _worker_host = make_host(driver)
+    atexit.register(_worker_host.shutdown)
+
+
+def _test_plugin_captured(plugin_path: Path, full: bool = False) -> tuple[bool, str]:
+    """Run ``test_plugin_capabilities`` in a worker process and return its report text."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        success = test_plugin_capabilities(_worker_host, plugin_path, full=full)
+    return success, output.getvalue()
+
+
 def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Test plugins one at a time in this process (easier to debug)",
+    )
+    parser.add_argument(
+        "--driver",
+        help="Force an audio driver; plugins are only tested in parallel with 'Dummy'",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Also load plugins without MIDI/instrument support",
+    )
+    args = parser.parse_args()
+
     print("="*70)
     print("Ambiance Keyboard & Audio Fix Verification")
     print("="*70)
@@ -140,12 +249,8 @@ def main():
         print(f"\n❌ Included plugins directory not found: {included_dir}")
         return
 
-    # Find all plugin files
-    plugins = list(included_dir.rglob("*.vst3")) + list(included_dir.rglob("*.dll"))
-
-    # Filter out non-plugin DLLs (like dependencies)
-    plugins = [p for p in plugins if not any(skip in p.name.lower() for skip in
-                                             ['msvc', 'ucrt', 'vcrun', 'api-ms'])]
+    # Find all plugin files, skipping non-plugin DLLs (like dependencies)
+    plugins = find_plugins(included_dir)
 
     if not plugins:
         print(f"\n❌ No plugins found in {included_dir}")
@@ -156,11 +261,37 @@ def main():
     for p in plugins:
         print(f"  - {p.relative_to(included_dir.parent)}")
 
-    # Test each plugin
+    # Test each plugin on one Carla host per process; Carla's native state is
+    # per process, so independent plugins can run in separate worker processes.
+    # That is only done on the Dummy driver: several workers opening a real
+    # device would each play their test notes over one another.
+    parallel = args.driver == "Dummy" and not args.serial and len(plugins) > 1
     results = {}
-    for plugin_path in plugins:
-        success = test_plugin_capabilities(plugin_path)
-        results[plugin_path.name] = success
+    if not parallel:
+        host = make_host(args.driver)
+        try:
+            for plugin_path in plugins:
+                success = test_plugin_capabilities(host, plugin_path, full=args.full)
+                results[plugin_path.name] = success
+                sys.stdout.flush()
+        finally:
+            host.shutdown()
+    else:
+        sys.stdout.flush()
+        # Spawned workers exit through sys.exit, so the atexit shutdown always runs
+        with ProcessPoolExecutor(
+            max_workers=min(4, len(plugins)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker_host,
+            initargs=(args.driver,),
+        ) as pool:
+            # Reports are printed whole and in discovery order as workers finish
+            for plugin_path, (success, report) in zip(
+                plugins, pool.map(partial(_test_plugin_captured, full=args.full), plugins)
+            ):
+                sys.stdout.write(report)
+                sys.stdout.flush()
+                results[plugin_path.name] = success
 
     # Summary
     print(f"\n\n{'='*70}")